@@ -1 +1,8 @@
-from .estimateur_parametres import estimer_parametres_rab
\ No newline at end of file
+from .bootstrap import bootstrap_parametres
+from .calibration import Calibrateur
+from .estimateur_parametres import (
+    estimer_parametres_glissants,
+    estimer_parametres_rab,
+    estimer_taux_vaccination,
+)
+from .monte_carlo import prevision_monte_carlo
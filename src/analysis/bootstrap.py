@@ -0,0 +1,181 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.estimateur_parametres import estimer_parametres_rab
+from src.analysis.integration.methodes import Integration
+from src.analysis.quantiles import HistogrammeQuantiles
+
+
+def bootstrap_parametres(
+    df: pd.DataFrame,
+    n_replicats: int = 10_000,
+    bloc: int = 14,
+    niveaux: tuple[float, ...] = (0.025, 0.5, 0.975),
+    workers: int = None,
+    seed: int = None,
+    taille_lot: int = 500,
+) -> dict:
+    """
+    Intervalles de confiance de r, a et b par bootstrap par blocs mobiles.
+
+    Chaque réplicat tire des blocs de `bloc` jours consécutifs (ce qui
+    conserve l'autocorrélation des séries) et recalcule l'estimateur de
+    estimer_parametres_rab avec les multiplicités m des jours tirés :
+        a* = (R(0) + Σ m ΔR) / Σ m w I    b* = (D(0) + Σ m ΔD) / Σ m w I
+        r* = médiane pondérée par m de (dI/dt + (a* + b*) I) / (S I)
+    avec w les poids de Simpson. La dérivée et les poids sont calculés une
+    fois ; les réplicats d'un lot sont des produits matriciels (lot, n).
+
+    Les lots sont répartis sur un pool de processus. Chaque lot a sa graine,
+    issue de SeedSequence(seed).spawn : le résultat ne dépend pas du nombre
+    de processus. Les réplicats ne sont pas conservés : chaque processus les
+    accumule dans un HistogrammeQuantiles, fusionné ensuite.
+
+    Args:
+        df: Données SIRD (colonnes 'S', 'I', 'I_abs', 'R_abs', 'D_abs') ;
+            non modifiées
+        n_replicats: Nombre de réplicats
+        bloc: Longueur des blocs (jours)
+        niveaux: Niveaux des quantiles renvoyés
+        workers: Nombre de processus (None ou 1 : exécution séquentielle)
+        seed: Graine du bootstrap
+        taille_lot: Nombre de réplicats calculés ensemble
+
+    Returns:
+        Dictionnaire avec:
+            - estimation: Estimation ponctuelle (estimer_parametres_rab)
+            - quantiles: {r, a, b: {niveau: valeur}}
+            - moyenne: {r, a, b: moyenne des réplicats}
+            - n_replicats: Nombre de réplicats
+            - histogramme: Accumulateur fusionné (autres quantiles)
+    """
+    donnees = _preparer(df)
+    if not 1 <= bloc <= donnees["n"]:
+        raise ValueError(f"Longueur de bloc invalide: {bloc}")
+
+    n_lots = -(-n_replicats // taille_lot)
+    graines = np.random.SeedSequence(seed).spawn(n_lots)
+    tailles = [min(taille_lot, n_replicats - k * taille_lot) for k in range(n_lots)]
+    lots = list(zip(graines, tailles))
+
+    calculer = partial(_bootstrap_lots, donnees, bloc=bloc)
+    if workers is None or workers <= 1:
+        histogramme = calculer(lots)
+    else:
+        # Une tâche par processus : les données ne sont transmises qu'une fois
+        groupes = [lots[k::workers] for k in range(workers) if lots[k::workers]]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partiels = list(executor.map(calculer, groupes))
+        histogramme = partiels[0]
+        for partiel in partiels[1:]:
+            histogramme.fusionner(partiel)
+
+    quantiles = histogramme.quantiles(niveaux)
+    cles = ("r", "a", "b")
+    return {
+        "estimation": estimer_parametres_rab(df.copy()),
+        "quantiles": {
+            cle: dict(zip(niveaux, quantiles[j].tolist())) for j, cle in enumerate(cles)
+        },
+        "moyenne": dict(zip(cles, histogramme.moyenne.tolist())),
+        "n_replicats": histogramme.n,
+        "histogramme": histogramme,
+    }
+
+
+def _preparer(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Quantités par jour, calculées une fois pour tous les réplicats."""
+    S = np.asarray(df["S"], dtype=float)
+    I = np.asarray(df["I"], dtype=float)
+    R_abs = np.asarray(df["R_abs"], dtype=float)
+    D_abs = np.asarray(df["D_abs"], dtype=float)
+    n = len(S)
+
+    # Incréments journaliers : R(fin) = R(0) + Σ ΔR
+    delta_R = np.zeros(n)
+    delta_R[1:] = np.diff(R_abs)
+    delta_D = np.zeros(n)
+    delta_D[1:] = np.diff(D_abs)
+
+    # Points valides de l'estimateur de r et termes affines en (a + b)
+    dI_dt = np.gradient(I, 1)
+    valides = (S * I > 1e-9) & (I > 1e-6)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pente = dI_dt / (S * I)
+        facteur = 1 / S
+
+    I_abs = np.asarray(df["I_abs"], dtype=float)
+
+    return {
+        "n": n,
+        "w_I": Integration.poids(n, 1.0, "simpson") * I_abs,
+        "R0": R_abs[0],
+        "D0": D_abs[0],
+        "delta_R": delta_R,
+        "delta_D": delta_D,
+        "valides": valides,
+        "pente": pente[valides],
+        "facteur": facteur[valides],
+    }
+
+
+def _multiplicites(
+    rng: np.random.Generator, n_replicats: int, n: int, bloc: int
+) -> np.ndarray:
+    """Multiplicités (n_replicats, n) des jours tirés par blocs mobiles."""
+    n_blocs = -(-n // bloc)
+    debuts = rng.integers(0, n - bloc + 1, size=(n_replicats, n_blocs))
+
+    # Tableau de différences : +1 au début de chaque bloc, -1 après sa fin
+    debuts = debuts + (np.arange(n_replicats) * (n + 1))[:, None]
+    differences = np.bincount(
+        np.concatenate([debuts.ravel(), (debuts + bloc).ravel()]),
+        weights=np.repeat([1.0, -1.0], debuts.size),
+        minlength=n_replicats * (n + 1),
+    ).reshape(n_replicats, n + 1)
+    return np.cumsum(differences[:, :n], axis=1)
+
+
+def _replicats(donnees: dict, multiplicites: np.ndarray) -> np.ndarray:
+    """Paramètres (lot, 3) des réplicats de multiplicités données."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        integrale = multiplicites @ donnees["w_I"]
+        a = (donnees["R0"] + multiplicites @ donnees["delta_R"]) / integrale
+        b = (donnees["D0"] + multiplicites @ donnees["delta_D"]) / integrale
+
+    # Médiane pondérée de r_t = pente_t + (a + b) facteur_t sur les points valides
+    valeurs = donnees["pente"] + (a + b)[:, None] * donnees["facteur"]
+    poids = multiplicites[:, donnees["valides"]]
+    ordre = np.argsort(valeurs, axis=1)
+    valeurs = np.take_along_axis(valeurs, ordre, axis=1)
+    cumul = np.cumsum(np.take_along_axis(poids, ordre, axis=1), axis=1)
+
+    r = np.full(len(multiplicites), np.nan)
+    if cumul.shape[1]:
+        total = cumul[:, -1]
+        lignes = np.arange(len(valeurs))
+        milieu = np.argmax(cumul >= total[:, None] / 2, axis=1)
+        # Poids exactement partagés : moyenne des deux valeurs centrales,
+        # comme la médiane de pandas pour un nombre pair de points
+        suivant = np.minimum(milieu + 1, cumul.shape[1] - 1)
+        egalite = cumul[lignes, milieu] * 2 == total
+        r = valeurs[lignes, milieu]
+        r = np.where(egalite, (r + valeurs[lignes, suivant]) / 2, r)
+        r = np.where(total > 0, r, np.nan)
+
+    return np.column_stack([r, a, b])
+
+
+def _bootstrap_lots(
+    donnees: dict, lots: list[tuple[np.random.SeedSequence, int]], bloc: int
+) -> HistogrammeQuantiles:
+    """Calcule et accumule les réplicats d'une liste de lots (un processus)."""
+    histogramme = HistogrammeQuantiles(n_variables=3)
+    for graine, taille in lots:
+        rng = np.random.default_rng(graine)
+        multiplicites = _multiplicites(rng, taille, donnees["n"], bloc)
+        histogramme.ajouter(_replicats(donnees, multiplicites))
+    return histogramme
@@ -1,55 +1,129 @@
 import numpy as np
 import pandas as pd
 
+# Stencils à 5 points (coefficients à diviser par 12h ou 12h²)
+# Dérivée première : centré, puis décentrés pour x0 et x1
+_PREMIERE_CENTRE = np.array([1, -8, 0, 8, -1])
+_PREMIERE_BORD_0 = np.array([-25, 48, -36, 16, -3])
+_PREMIERE_BORD_1 = np.array([-3, -10, 18, -6, 1])
+# Dérivée seconde : centré, puis décentrés pour x0 et x1
+_SECONDE_CENTRE = np.array([-1, 16, -30, 16, -1])
+_SECONDE_BORD_0 = np.array([35, -104, 114, -56, 11])
+_SECONDE_BORD_1 = np.array([11, -20, 6, 4, -1])
+
 
 class Derivation:
     def __init__(self, df, col, h):
         """
         df: Le DataFrame(csv) contenant les données.
-        col: Le nom de la colonne contenant les valeurs y.
+        col: Le nom de la colonne contenant les valeurs y, ou une liste de
+             colonnes (S, I, R, D...) dérivées simultanément
         h : le pas entre xi+1 et xi
         """
         self.df = df
         self.col = col
         self.x = df.index.to_numpy()
-        self.y = df[col].to_numpy()
+        # Tableau (n,) pour une colonne, (n, m) pour plusieurs colonnes
+        self.y = np.ascontiguousarray(df[col].to_numpy(dtype=float))
         self.h = h
         self.n = len(df)
 
-    def premier_derivation_5point(self):
+    @staticmethod
+    def _appliquer_stencil(fx, coefficients):
+        """
+        Combinaison linéaire des 5 voisins fx[i-2..i+2] pour tous les points
+        intérieurs, par tranches décalées (toutes les colonnes à la fois).
+        """
+        n = len(fx)
+        resultat = coefficients[0] * fx[0 : n - 4]
+        for decalage in range(1, 5):
+            if coefficients[decalage] != 0:
+                voisins = fx[decalage : n - 4 + decalage]
+                resultat = resultat + coefficients[decalage] * voisins
+        return resultat
+
+    def _bords_ordre4(self, resultat, fx, bord_0, bord_1, denominateur):
+        """Stencils décentrés à 5 points (ordre 4) aux deux premiers et derniers."""
+        debut = fx[:5]
+        fin = fx[-5:][::-1]  # Symétrie : les points de fin sont lus à rebours
+        resultat[0] = np.tensordot(bord_0, debut, axes=1) / denominateur
+        resultat[1] = np.tensordot(bord_1, debut, axes=1) / denominateur
+        resultat[-1] = np.tensordot(bord_0, fin, axes=1) / denominateur
+        resultat[-2] = np.tensordot(bord_1, fin, axes=1) / denominateur
+
+    def _bords_series_courtes(self, bords):
+        """
+        Avec 3 ou 4 points, aucun point intérieur n'a 5 voisins : seules les
+        différences à 3 points des bornes s'appliquent (comportement initial).
+        """
+        if self.n < 3:
+            raise ValueError("Au moins 3 points sont nécessaires pour la dérivation.")
+        return "simple" if self.n < 5 else bords
+
+    def premier_derivation_5point(self, bords="simple"):
+        """
+        Dérivée première par différences centrées à 5 points.
+
+        Args:
+            bords: 'simple' (différences à 2 ou 3 points aux bornes) ou
+                   'ordre4' (stencils décentrés à 5 points, même ordre que
+                   l'intérieur) ; 'simple' est utilisé pour moins de 5 points
+
+        Returns:
+            Tableau de même forme que les données (n,) ou (n, m)
+        """
         fx = self.y
-        n = self.n
-        dfx = np.zeros(n)  # List vide pour la derivée première
+        bords = self._bords_series_courtes(bords)
+        dfx = np.zeros_like(fx)  # Tableau vide pour la derivée première
 
-        for i in range(2, n - 2):  ## derivation formule pour 5points centre
-            dfx[i] = (-fx[i + 2] + 8 * fx[i + 1] - 8 * fx[i - 1] + fx[i - 2]) / (
-                12 * self.h
-            )
+        # derivation formule pour 5points centre (toutes les colonnes à la fois)
+        if self.n >= 5:
+            dfx[2:-2] = self._appliquer_stencil(fx, _PREMIERE_CENTRE) / (12 * self.h)
 
         # le probleme pour les bornes ou il n y a pas 5point autour de xi
-        dfx[0] = (fx[1] - fx[0]) / self.h
-        dfx[1] = (fx[2] - fx[0]) / (2 * self.h)
-        dfx[-2] = (fx[-1] - fx[-3]) / (2 * self.h)
-        dfx[-1] = (fx[-1] - fx[-2]) / self.h
+        if bords == "simple":
+            dfx[0] = (fx[1] - fx[0]) / self.h
+            dfx[1] = (fx[2] - fx[0]) / (2 * self.h)
+            dfx[-2] = (fx[-1] - fx[-3]) / (2 * self.h)
+            dfx[-1] = (fx[-1] - fx[-2]) / self.h
+        elif bords == "ordre4":
+            self._bords_ordre4(
+                dfx, fx, _PREMIERE_BORD_0, _PREMIERE_BORD_1, 12 * self.h
+            )
+            # La lecture à rebours inverse le signe de la dérivée première
+            dfx[-2:] = -dfx[-2:]
+        else:
+            raise ValueError(f"Traitement des bords {bords} non supporté")
 
         return dfx
 
-    def second_derivation_5point(self):
-        # List vide pour la derivée seconde
-        # derivation formule pour 5points  centre
+    def second_derivation_5point(self, bords="simple"):
+        """
+        Dérivée seconde par différences centrées à 5 points.
+
+        Args/Voir premier_derivation_5point
+        """
         fx = self.y
-        n = self.n
-        d2fx = np.zeros(n)
+        bords = self._bords_series_courtes(bords)
+        d2fx = np.zeros_like(fx)
 
-        for i in range(2, n - 2):
-            d2fx[i] = (
-                -fx[i + 2] + 16 * fx[i + 1] - 30 * fx[i] + 16 * fx[i - 1] - fx[i - 2]
-            ) / (12 * self.h**2)
+        # derivation formule pour 5points centre
+        if self.n >= 5:
+            d2fx[2:-2] = self._appliquer_stencil(fx, _SECONDE_CENTRE) / (
+                12 * self.h**2
+            )
 
         # le probleme pour les bornes ou il n y a pas 5point autour de xi
-        d2fx[0] = (fx[2] - 2 * fx[1] + fx[0]) / self.h**2
-        d2fx[1] = (fx[2] - 2 * fx[1] + fx[0]) / self.h**2
-        d2fx[-2] = (fx[-1] - 2 * fx[-2] + fx[-3]) / self.h**2
-        d2fx[-1] = (fx[-1] - 2 * fx[-2] + fx[-3]) / self.h**2
+        if bords == "simple":
+            d2fx[0] = (fx[2] - 2 * fx[1] + fx[0]) / self.h**2
+            d2fx[1] = (fx[2] - 2 * fx[1] + fx[0]) / self.h**2
+            d2fx[-2] = (fx[-1] - 2 * fx[-2] + fx[-3]) / self.h**2
+            d2fx[-1] = (fx[-1] - 2 * fx[-2] + fx[-3]) / self.h**2
+        elif bords == "ordre4":
+            self._bords_ordre4(
+                d2fx, fx, _SECONDE_BORD_0, _SECONDE_BORD_1, 12 * self.h**2
+            )
+        else:
+            raise ValueError(f"Traitement des bords {bords} non supporté")
 
         return d2fx
@@ -0,0 +1,580 @@
+import ast
+import keyword
+
+import numpy as np
+import pandas as pd
+
+from .solveur import SolveurNumerique
+
+# Opérations autorisées dans les expressions de taux et ufunc correspondantes
+_OPERATIONS = {
+    ast.Add: "np.add",
+    ast.Sub: "np.subtract",
+    ast.Mult: "np.multiply",
+    ast.Div: "np.divide",
+    ast.Pow: "np.power",
+}
+
+
+class ModeleCompartiments:
+    """
+    Modèle compartimental déclaratif compilé en fonctions NumPy fusionnées.
+
+    Un modèle est décrit par ses compartiments, ses paramètres et ses flux
+    (source, destination, expression du taux). Les expressions n'admettent
+    que des nombres, des noms de compartiments ou de paramètres et les
+    opérations + - * / ** ; elles sont validées sur leur arbre syntaxique.
+
+    La compilation génère une seule fonction derivee(etat, t, out=None) :
+    chaque opération est un appel de ufunc écrivant dans un tampon
+    préalloué (out=), réutilisé d'un appel à l'autre pour une même forme
+    d'état, puis chaque dérivée est la somme signée de ses flux. La
+    jacobienne ∂f/∂x est obtenue par dérivation symbolique des expressions
+    et compilée de la même façon. Les deux fonctions s'utilisent avec
+    SolveurNumerique (derivee_inplace=True, euler_implicite) pour un état
+    (C,) ou un ensemble (N, C).
+
+    Exemple d'utilisation:
+    >>> sirdv = ModeleCompartiments(
+    ...     compartiments=["S", "I", "R", "D", "V"],
+    ...     parametres=["r", "a", "b", "v"],
+    ...     flux=[
+    ...         ("S", "I", "r * S * I"),
+    ...         ("I", "R", "a * I"),
+    ...         ("I", "D", "b * I"),
+    ...         ("S", "V", "v * S"),
+    ...     ],
+    ... )
+    >>> simulateur = SimulateurCompartiments(sirdv, {"r": 0.3, ...})
+    >>> t, y = simulateur.integrer(donnees, t_max=365)  # y: (N, pas + 1, 5)
+    """
+
+    def __init__(
+        self,
+        compartiments: list[str],
+        parametres: list[str],
+        flux: list[tuple[str | None, str | None, str]],
+        colonnes: dict[str, str | None] = None,
+    ):
+        """
+        Args:
+            compartiments: Noms des compartiments (ordre des colonnes d'état)
+            parametres: Noms des paramètres
+            flux: Triplets (source, destination, taux) ; None désigne
+                l'extérieur du modèle (naissances, sorties)
+            colonnes: Colonne des données donnant la valeur initiale de
+                chaque compartiment (par défaut son nom ; None : part de 0)
+        """
+        self.compartiments = list(compartiments)
+        self.parametres = list(parametres)
+        self._valider_noms()
+
+        self.flux = []
+        for source, destination, taux in flux:
+            for extremite in (source, destination):
+                if extremite is not None and extremite not in self.compartiments:
+                    raise ValueError(f"Compartiment inconnu: {extremite}")
+            self.flux.append((source, destination, self._analyser(taux)))
+
+        self.colonnes = {nom: nom for nom in self.compartiments}
+        self.colonnes.update(colonnes or {})
+
+        self.source = self._generer()
+        espace = {}
+        exec(compile(self.source, f"<modele {self}>", "exec"), espace)
+        self._fabrique = espace["_fabrique"]
+
+    def __repr__(self) -> str:
+        return f"ModeleCompartiments({''.join(self.compartiments)})"
+
+    def _valider_noms(self) -> None:
+        """Noms uniques, identifiants Python valides et non réservés."""
+        noms = self.compartiments + self.parametres
+        if len(set(noms)) != len(noms):
+            raise ValueError("Noms de compartiments et de paramètres en double")
+        for nom in noms:
+            if not nom.isidentifier() or keyword.iskeyword(nom):
+                raise ValueError(f"Nom invalide: {nom!r}")
+
+    def _analyser(self, expression: str) -> ast.expr:
+        """
+        Arbre syntaxique validé d'une expression de taux.
+
+        Raises:
+            ValueError: Syntaxe, nom ou opération non autorisés
+        """
+        try:
+            arbre = ast.parse(expression, mode="eval").body
+        except SyntaxError as e:
+            raise ValueError(f"Expression invalide: {expression!r}") from e
+
+        for noeud in ast.walk(arbre):
+            if isinstance(noeud, ast.Name):
+                if noeud.id not in self.compartiments + self.parametres:
+                    raise ValueError(f"Nom inconnu {noeud.id!r} dans {expression!r}")
+            elif isinstance(noeud, ast.Constant):
+                if not isinstance(noeud.value, (int, float)) or isinstance(
+                    noeud.value, bool
+                ):
+                    raise ValueError(f"Constante invalide dans {expression!r}")
+            elif isinstance(noeud, ast.BinOp):
+                if type(noeud.op) not in _OPERATIONS:
+                    raise ValueError(f"Opération non autorisée dans {expression!r}")
+                # Exposant indépendant de l'état : dérivée n u^(n-1) u'
+                if isinstance(noeud.op, ast.Pow) and self._depend_etat(noeud.right):
+                    raise ValueError(f"Exposant dépendant de l'état: {expression!r}")
+            elif isinstance(noeud, ast.UnaryOp):
+                if not isinstance(noeud.op, (ast.USub, ast.UAdd)):
+                    raise ValueError(f"Opération non autorisée dans {expression!r}")
+            elif not isinstance(noeud, (ast.operator, ast.unaryop, ast.expr_context)):
+                raise ValueError(
+                    f"{type(noeud).__name__} non autorisé dans {expression!r}"
+                )
+        return arbre
+
+    def _depend_etat(self, arbre: ast.expr) -> bool:
+        """Vrai si l'expression contient un compartiment."""
+        return any(
+            isinstance(noeud, ast.Name) and noeud.id in self.compartiments
+            for noeud in ast.walk(arbre)
+        )
+
+    def _generer(self) -> str:
+        """Source de la fabrique des fonctions derivee et jacobienne."""
+        n = len(self.compartiments)
+        arguments = ", ".join(f"p_{nom}" for nom in self.parametres)
+
+        # Second membre : un tampon par flux, puis sommes signées
+        derivee = _Emetteur(self.compartiments)
+        references = [derivee.emettre(taux) for _, _, taux in self.flux]
+        termes = {nom: [] for nom in self.compartiments}
+        for (source, destination, _), reference in zip(self.flux, references):
+            if source is not None:
+                termes[source].append(("-", reference))
+            if destination is not None:
+                termes[destination].append(("+", reference))
+        for j, nom in enumerate(self.compartiments):
+            derivee.sommer(f"derivees[..., {j}]", termes[nom])
+
+        # Jacobienne : dérivées symboliques non nulles, écrites en place
+        jacobienne = _Emetteur(self.compartiments)
+        for i, ligne in enumerate(self.compartiments):
+            for j, colonne in enumerate(self.compartiments):
+                entree = _constante(0)
+                for source, destination, taux in self.flux:
+                    signe = (destination == ligne) - (source == ligne)
+                    if signe:
+                        d_taux = _deriver(taux, colonne)
+                        entree = (
+                            _somme(entree, d_taux)
+                            if signe > 0
+                            else _difference(entree, d_taux)
+                        )
+                if not _est_constante(entree, 0):
+                    jacobienne.emettre(entree, cible=f"jacobienne[..., {i}, {j}]")
+
+        lignes = [
+            f"def _fabrique(np, _tampons, _tampons_j, {arguments}):",
+            "    def derivee(etat, t, out=None):",
+            *derivee.prologue("_tampons", n),
+            "        derivees = np.empty_like(etat) if out is None else out",
+            *derivee.instructions,
+            "        return derivees",
+            "",
+            "    def jacobienne(etat, t, out=None):",
+            *jacobienne.prologue("_tampons_j", n),
+            "        if out is None:",
+            f"            jacobienne = np.zeros(etat.shape + ({n},))",
+            "        else:",
+            "            jacobienne = out",
+            "            jacobienne.fill(0)",
+            *jacobienne.instructions,
+            "        return jacobienne",
+            "",
+            "    return derivee, jacobienne",
+        ]
+        return "\n".join(lignes) + "\n"
+
+    def lier(self, parametres: dict[str, np.ndarray | float]) -> tuple:
+        """
+        Fonctions (derivee, jacobienne) pour des valeurs de paramètres.
+
+        Args:
+            parametres: Valeur de chaque paramètre, scalaire ou tableau (N,)
+
+        Returns:
+            Tuple: (derivee(etat, t, out=None), jacobienne(etat, t, out=None))
+        """
+        manquants = set(self.parametres) - set(parametres)
+        if manquants:
+            raise ValueError(f"Paramètres manquants: {sorted(manquants)}")
+        valeurs = {f"p_{nom}": parametres[nom] for nom in self.parametres}
+        return self._fabrique(np, {}, {}, **valeurs)
+
+
+class _Emetteur:
+    """Traduit des expressions en appels de ufunc dans des tampons (out=)."""
+
+    def __init__(self, compartiments: list[str]):
+        self.compartiments = compartiments
+        self.instructions = []
+        self.n_tampons = 0
+
+    def prologue(self, cache: str, n: int) -> list[str]:
+        """Récupération des tampons et vues des compartiments utilisés."""
+        lignes = [
+            f"        if etat.shape[-1] != {n}:",
+            "            raise ValueError(f'État de dimension {etat.shape[-1]} "
+            f"au lieu de {n}')",
+        ]
+        if self.n_tampons:
+            lignes += [
+                f"        tampons = {cache}.get(etat.shape)",
+                "        if tampons is None:",
+                f"            tampons = {cache}[etat.shape] = np.empty(",
+                f"                ({self.n_tampons},) + etat.shape[:-1]",
+                "            )",
+            ]
+        code = "\n".join(self.instructions)
+        for j, nom in enumerate(self.compartiments):
+            if f"x_{nom}" in code:
+                lignes.append(f"        x_{nom} = etat[..., {j}]")
+        return lignes
+
+    def emettre(self, arbre: ast.expr, cible: str = None) -> str:
+        """
+        Émet le calcul d'une expression et renvoie la référence du résultat.
+
+        Args:
+            arbre: Expression validée
+            cible: Vue dans laquelle écrire le résultat (tampon sinon)
+        """
+        reference = self._emettre(arbre, cible)
+        if cible is not None and reference != cible:
+            self.instructions.append(f"        np.copyto({cible}, {reference})")
+        return cible or reference
+
+    def _emettre(self, arbre: ast.expr, cible: str = None) -> str:
+        if isinstance(arbre, ast.Constant):
+            return repr(float(arbre.value))
+        if isinstance(arbre, ast.Name):
+            prefixe = "x" if arbre.id in self.compartiments else "p"
+            return f"{prefixe}_{arbre.id}"
+        if isinstance(arbre, ast.UnaryOp):
+            operande = self._emettre(arbre.operand)
+            if isinstance(arbre.op, ast.UAdd):
+                return operande
+            sortie = cible or self._sortie(operande)
+            self.instructions.append(f"        np.negative({operande}, out={sortie})")
+            return sortie
+
+        gauche = self._emettre(arbre.left)
+        droite = self._emettre(arbre.right)
+        # Résultat écrit dans un tampon d'opérande si possible (pas de copie)
+        sortie = cible or self._sortie(gauche, droite)
+        ufunc = _OPERATIONS[type(arbre.op)]
+        self.instructions.append(f"        {ufunc}({gauche}, {droite}, out={sortie})")
+        return sortie
+
+    def _sortie(self, *operandes: str) -> str:
+        """Tampon d'un opérande intermédiaire, ou nouveau tampon."""
+        for operande in operandes:
+            if operande.startswith("tampons["):
+                return operande
+        self.n_tampons += 1
+        # Indexation [k, ...] : vue (même 0-d pour un état (C,)), jamais un scalaire
+        return f"tampons[{self.n_tampons - 1}, ...]"
+
+    def sommer(self, cible: str, termes: list[tuple[str, str]]) -> None:
+        """Écrit dans cible la somme signée des références."""
+        if not termes:
+            self.instructions.append(f"        {cible} = 0.0")
+            return
+        signe, reference = termes[0]
+        if signe == "+":
+            self.instructions.append(f"        np.copyto({cible}, {reference})")
+        else:
+            self.instructions.append(f"        np.negative({reference}, out={cible})")
+        for signe, reference in termes[1:]:
+            ufunc = "np.add" if signe == "+" else "np.subtract"
+            self.instructions.append(
+                f"        {ufunc}({cible}, {reference}, out={cible})"
+            )
+
+
+def _constante(valeur: float) -> ast.Constant:
+    return ast.Constant(value=valeur)
+
+
+def _est_constante(arbre: ast.expr, valeur: float = None) -> bool:
+    """Vrai si l'arbre est une constante (égale à valeur si précisée)."""
+    return isinstance(arbre, ast.Constant) and (
+        valeur is None or arbre.value == valeur
+    )
+
+
+def _somme(u: ast.expr, v: ast.expr) -> ast.expr:
+    if _est_constante(u) and _est_constante(v):
+        return _constante(u.value + v.value)
+    if _est_constante(u, 0):
+        return v
+    if _est_constante(v, 0):
+        return u
+    return ast.BinOp(u, ast.Add(), v)
+
+
+def _difference(u: ast.expr, v: ast.expr) -> ast.expr:
+    if _est_constante(u) and _est_constante(v):
+        return _constante(u.value - v.value)
+    if _est_constante(v, 0):
+        return u
+    if _est_constante(u, 0):
+        return _oppose(v)
+    return ast.BinOp(u, ast.Sub(), v)
+
+
+def _produit(u: ast.expr, v: ast.expr) -> ast.expr:
+    if _est_constante(u) and _est_constante(v):
+        return _constante(u.value * v.value)
+    if _est_constante(u, 0) or _est_constante(v, 0):
+        return _constante(0)
+    if _est_constante(u, 1):
+        return v
+    if _est_constante(v, 1):
+        return u
+    return ast.BinOp(u, ast.Mult(), v)
+
+
+def _quotient(u: ast.expr, v: ast.expr) -> ast.expr:
+    if _est_constante(u, 0):
+        return _constante(0)
+    if _est_constante(v, 1):
+        return u
+    return ast.BinOp(u, ast.Div(), v)
+
+
+def _oppose(u: ast.expr) -> ast.expr:
+    if _est_constante(u):
+        return _constante(-u.value)
+    if isinstance(u, ast.UnaryOp) and isinstance(u.op, ast.USub):
+        return u.operand
+    return ast.UnaryOp(ast.USub(), u)
+
+
+def _deriver(arbre: ast.expr, variable: str) -> ast.expr:
+    """Dérivée symbolique d'une expression validée par rapport à une variable."""
+    if isinstance(arbre, ast.Constant):
+        return _constante(0)
+    if isinstance(arbre, ast.Name):
+        return _constante(1 if arbre.id == variable else 0)
+    if isinstance(arbre, ast.UnaryOp):
+        derivee = _deriver(arbre.operand, variable)
+        return derivee if isinstance(arbre.op, ast.UAdd) else _oppose(derivee)
+
+    u, v = arbre.left, arbre.right
+    du, dv = _deriver(u, variable), _deriver(v, variable)
+    if isinstance(arbre.op, ast.Add):
+        return _somme(du, dv)
+    if isinstance(arbre.op, ast.Sub):
+        return _difference(du, dv)
+    if isinstance(arbre.op, ast.Mult):
+        return _somme(_produit(du, v), _produit(u, dv))
+    if isinstance(arbre.op, ast.Div):
+        # (u'v - uv') / v²
+        numerateur = _difference(_produit(du, v), _produit(u, dv))
+        return _quotient(numerateur, _produit(v, v))
+    # Puissance d'exposant n indépendant de l'état : n u^(n-1) u'
+    if _est_constante(du, 0):
+        return _constante(0)
+    exposant = _difference(v, _constante(1))
+    puissance = u if _est_constante(exposant, 1) else ast.BinOp(u, ast.Pow(), exposant)
+    if _est_constante(exposant, 0):
+        puissance = _constante(1)
+    return _produit(_produit(v, puissance), du)
+
+
+class SimulateurCompartiments:
+    """
+    Simule un ensemble de N scénarios d'un modèle compartimental compilé.
+
+    Équivalent de SimulateurSIRDEnsemble pour un modèle quelconque : l'état
+    (N, C) de tous les membres est avancé par SolveurNumerique avec la
+    fonction compilée (aucune allocation par appel). Pour le préréglage
+    SIRD, les trajectoires sont celles de SimulateurSIRDEnsemble.
+
+    Exemple d'utilisation:
+    >>> simulateur = SimulateurCompartiments(SEIRD, {
+    ...     "r": np.linspace(0.2, 0.5, 10_000), "sigma": 0.2, "a": 0.1, "b": 0.02
+    ... })
+    >>> t, y = simulateur.integrer(donnees, t_max=365)  # y: (N, pas + 1, 5)
+    """
+
+    def __init__(
+        self, modele: ModeleCompartiments, parametres: dict[str, np.ndarray | float]
+    ):
+        """
+        Args:
+            modele: Modèle compilé
+            parametres: Valeur de chaque paramètre du modèle, scalaire ou
+                tableau (N,) ; les scalaires sont diffusés à l'ensemble
+        """
+        self.modele = modele
+        valeurs = np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(parametres[nom], dtype=float))
+                for nom in modele.parametres
+            )
+        )
+        if valeurs and valeurs[0].ndim != 1:
+            raise ValueError("Les paramètres doivent être des tableaux de forme (N,)")
+        self.parametres = dict(zip(modele.parametres, valeurs))
+        self.n_membres = len(valeurs[0]) if valeurs else 1
+        if any((valeur < 0).any() for valeur in valeurs):
+            raise ValueError("Tous les paramètres doivent être positifs")
+
+        self._derivee, self._jacobienne = modele.lier(self.parametres)
+
+    def _conditions_initiales(
+        self, conditions_initiales: pd.DataFrame | dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Construit le tenseur d'état initial (N, C).
+
+        Args:
+            conditions_initiales: DataFrame (première ligne des colonnes du
+                modèle, diffusée à tous les membres) ou dictionnaire
+                {compartiment: scalaire ou tableau (N,)} ; un compartiment
+                sans colonne de données (colonnes du modèle) part de 0
+        """
+        colonnes = self.modele.colonnes
+        if isinstance(conditions_initiales, pd.DataFrame):
+            valeurs = {
+                nom: conditions_initiales[colonne].iloc[0]
+                for nom, colonne in colonnes.items()
+                if colonne is not None
+            }
+        else:
+            # Les compartiments sans colonne de données peuvent être omis
+            valeurs = {
+                nom: conditions_initiales[nom]
+                for nom in self.modele.compartiments
+                if nom in conditions_initiales or colonnes[nom] is not None
+            }
+
+        y0 = np.zeros((self.n_membres, len(self.modele.compartiments)))
+        try:
+            for j, nom in enumerate(self.modele.compartiments):
+                if nom in valeurs:
+                    y0[:, j] = valeurs[nom]
+        except ValueError as e:
+            raise ValueError(
+                f"Conditions initiales incompatibles avec {self.n_membres} membres"
+            ) from e
+        return y0
+
+    def integrer(
+        self,
+        conditions_initiales: pd.DataFrame | dict[str, np.ndarray],
+        t_max: int,
+        dt: float = 1.0,
+        methode: str = "rk4",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Intègre tous les membres de l'ensemble simultanément.
+
+        Args:
+            conditions_initiales: Voir _conditions_initiales
+            t_max: Durée de simulation (jours)
+            dt: Pas de temps (pour 'rk45' : espacement de la grille de sortie)
+            methode: 'euler', 'rk4', 'rk45' ou 'euler_implicite' (jacobienne
+                compilée)
+
+        Returns:
+            Tuple: (temps, états) avec états de forme (N, pas + 1, C)
+        """
+        y0 = self._conditions_initiales(conditions_initiales)
+
+        if methode == "euler":
+            t, y = SolveurNumerique.euler(
+                self._derivee, y0, t_max, dt, derivee_inplace=True
+            )
+        elif methode == "rk4":
+            t, y = SolveurNumerique.rk4(
+                self._derivee, y0, t_max, dt, derivee_inplace=True
+            )
+        elif methode == "rk45":
+            t, y = SolveurNumerique.rk45(
+                self._derivee, y0, t_max, dt, derivee_inplace=True
+            )
+        elif methode == "euler_implicite":
+            t, y = SolveurNumerique.euler_implicite(
+                self._derivee, self._jacobienne, y0, t_max, dt
+            )
+        else:
+            raise ValueError(f"Méthode {methode} non supportée")
+
+        # Le solveur empile les pas en premier : (pas + 1, N, C) -> (N, pas + 1, C)
+        return t, y.swapaxes(0, 1)
+
+    def resoudre(
+        self,
+        conditions_initiales: pd.DataFrame | dict[str, np.ndarray],
+        t_max: int,
+        dt: float = 1.0,
+        methode: str = "rk4",
+    ) -> pd.DataFrame:
+        """
+        Intègre l'ensemble et renvoie les résultats au format long.
+
+        Args/Voir méthode integrer pour les paramètres
+
+        Returns:
+            DataFrame avec les colonnes membre, temps et une par compartiment
+        """
+        t, y = self.integrer(conditions_initiales, t_max, dt, methode)
+        n_pas = len(t)
+        df = pd.DataFrame(
+            y.reshape(-1, y.shape[-1]), columns=self.modele.compartiments
+        )
+        df.insert(0, "temps", np.tile(t, self.n_membres))
+        df.insert(0, "membre", np.repeat(np.arange(self.n_membres), n_pas))
+        return df
+
+
+# Préréglages
+SIRD = ModeleCompartiments(
+    compartiments=["S", "I", "R", "D"],
+    parametres=["r", "a", "b"],
+    flux=[
+        ("S", "I", "r * S * I"),
+        ("I", "R", "a * I"),
+        ("I", "D", "b * I"),
+    ],
+)
+
+# V des données est un flux journalier (estimer_taux_vaccination) : le
+# compartiment des vaccinés part de 0
+SIRDV = ModeleCompartiments(
+    compartiments=["S", "I", "R", "D", "V"],
+    parametres=["r", "a", "b", "v"],
+    flux=[
+        ("S", "I", "r * S * I"),
+        ("I", "R", "a * I"),
+        ("I", "D", "b * I"),
+        ("S", "V", "v * S"),
+    ],
+    colonnes={"V": None},
+)
+
+# Exposés (E) : incubation de durée moyenne 1 / sigma, absents des données
+SEIRD = ModeleCompartiments(
+    compartiments=["S", "E", "I", "R", "D"],
+    parametres=["r", "sigma", "a", "b"],
+    flux=[
+        ("S", "E", "r * S * I"),
+        ("E", "I", "sigma * E"),
+        ("I", "R", "a * I"),
+        ("I", "D", "b * I"),
+    ],
+    colonnes={"E": None},
+)
@@ -0,0 +1,297 @@
+import numpy as np
+import pandas as pd
+
+from .solveur import SolveurNumerique
+
+
+class SimulateurSIRDEnsemble:
+    """
+    Simule un ensemble de N scénarios SIRD en une seule intégration vectorisée.
+
+    L'état (N, 4) de tous les membres est avancé simultanément par
+    SolveurNumerique : le coût d'un balayage de scénarios est celui d'une
+    simulation unique multiplié par une petite constante, au lieu de N boucles
+    Python.
+
+    Exemple d'utilisation:
+    >>> ensemble = SimulateurSIRDEnsemble({
+    ...     "r": np.linspace(0.2, 0.5, 10_000),
+    ...     "a": 0.1,
+    ...     "b": 0.02
+    ... })
+    >>> t, y = ensemble.integrer(donnees, t_max=365, dt=1.0)  # y: (N, pas, 4)
+    >>> resultats = ensemble.resoudre(donnees, t_max=365)  # format long
+    """
+
+    def __init__(self, parametres: dict[str, np.ndarray | float]):
+        """
+        Initialise l'ensemble avec des paramètres vectoriels.
+
+        Args:
+            parametres: Dictionnaire des paramètres contenant:
+                - r: Taux de contagion, scalaire ou tableau (N,)
+                - a: Taux de guérison, scalaire ou tableau (N,)
+                - b: Taux de mortalité, scalaire ou tableau (N,)
+                Les scalaires sont diffusés à la taille de l'ensemble.
+        """
+        self.r, self.a, self.b = np.broadcast_arrays(
+            *(
+                np.atleast_1d(np.asarray(parametres[cle], dtype=float))
+                for cle in ("r", "a", "b")
+            )
+        )
+        if self.r.ndim != 1:
+            raise ValueError("Les paramètres doivent être des tableaux de forme (N,)")
+        self.n_membres = len(self.r)
+        self._valider_parametres()
+
+        # Dérivées = (base + S * coefficients_S) * I, ligne par ligne :
+        # [-r S, r S - (a + b), a, b] * I
+        zeros = np.zeros(self.n_membres)
+        self._coefficients_S = np.column_stack([-self.r, self.r, zeros, zeros])
+        self._coefficients_base = np.column_stack(
+            [zeros, -self._taux_sortie, self.a, self.b]
+        )
+
+    def _valider_parametres(self) -> None:
+        """Validation vectorielle des contraintes sur les paramètres."""
+        if (self.r < 0).any() or (self.a < 0).any() or (self.b < 0).any():
+            raise ValueError("Tous les paramètres doivent être positifs")
+
+        if not ((self.r > 0) & (self.r <= 1)).all():
+            raise ValueError("r doit être dans ]0, 1] pour tous les membres")
+
+        # Contrairement à SimulateurSIRD, un membre avec R0 < 1 reste un scénario
+        # valide d'un balayage : il est simulé tel quel.
+        self._taux_sortie = self.a + self.b
+        with np.errstate(divide="ignore"):
+            self.R0 = self.r / self._taux_sortie
+
+    def _modele_sird(
+        self, etat: np.ndarray, t: float, out: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Équations SIRD évaluées pour tous les membres à la fois.
+
+        Args:
+            etat: Tenseur d'état (N, 4) dont les colonnes sont [S, I, R, D]
+            t: Temps (non utilisé mais requis par le solveur)
+            out: Tampon optionnel (N, 4) dans lequel écrire les dérivées
+
+        Returns:
+            Tenseur des dérivées (N, 4)
+        """
+        derivees = np.empty_like(etat) if out is None else out
+        # Trois opérations sur le bloc (N, 4) au lieu d'une par colonne
+        np.multiply(etat[:, 0:1], self._coefficients_S, out=derivees)
+        np.add(derivees, self._coefficients_base, out=derivees)
+        np.multiply(derivees, etat[:, 1:2], out=derivees)
+        return derivees
+
+    def _modele_sensibilites(
+        self, etat: np.ndarray, t: float, out: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Équations SIRD augmentées des équations de sensibilité.
+
+        Pour x = [S, I, R, D] et p = (r, a, b), la matrice Σ = ∂x/∂p (4, 3)
+        vérifie dΣ/dt = J_x Σ + J_p, avec J_x et J_p les jacobiennes du
+        modèle par rapport à l'état et aux paramètres.
+
+        Chaque compartiment occupe une ligne [x_i, ∂x_i/∂r, ∂x_i/∂a, ∂x_i/∂b]
+        de 4 colonnes, traitée comme un nombre dual x_i + Σ_i ε : le flux
+        d'infection r S I et sa variation r (I Σ_S + S Σ_I) sont obtenus par un
+        seul produit dual, et J_x Σ ne coûte que quelques opérations sur des
+        blocs (N, 4). Les tampons intermédiaires sont réutilisés d'un appel à
+        l'autre.
+
+        Args:
+            etat: Tenseur (N, 16) des lignes de S, I, R et D mises bout à bout
+            t: Temps (non utilisé mais requis par le solveur)
+            out: Tampon optionnel (N, 16)
+
+        Returns:
+            Tenseur des dérivées (N, 16)
+        """
+        derivees = np.empty_like(etat) if out is None else out
+
+        # Tampons et paramètres en colonne, créés au premier appel
+        if getattr(self, "_tampons_sensibilites", None) is None:
+            self._tampons_sensibilites = (
+                np.empty((self.n_membres, 4)),
+                np.empty((self.n_membres, 4)),
+                np.empty((self.n_membres, 1)),
+            )
+            self._colonnes = tuple(
+                p[:, None] for p in (self.r, self._taux_sortie, self.a, self.b)
+            )
+        flux, tampon, SI = self._tampons_sensibilites
+        r, taux_sortie, a, b = self._colonnes
+
+        S = etat[:, 0:1]
+        I = etat[:, 4:5]
+        ligne_S = etat[:, 0:4]
+        ligne_I = etat[:, 4:8]
+
+        # Produit dual (S + Σ_S ε)(I + Σ_I ε) = S I + (I Σ_S + S Σ_I) ε
+        np.multiply(S, ligne_I, out=flux)
+        np.multiply(I, ligne_S, out=tampon)
+        np.add(flux, tampon, out=flux)
+        np.multiply(S, I, out=SI)
+        np.subtract(flux[:, 0:1], SI, out=flux[:, 0:1])
+        np.multiply(r, flux, out=flux)
+
+        # dS = -r S I ; dI = r S I - (a + b) I ; dR = a I ; dD = b I (en dual)
+        np.negative(flux, out=derivees[:, 0:4])
+        np.multiply(taux_sortie, ligne_I, out=tampon)
+        np.subtract(flux, tampon, out=derivees[:, 4:8])
+        np.multiply(a, ligne_I, out=derivees[:, 8:12])
+        np.multiply(b, ligne_I, out=derivees[:, 12:16])
+
+        # J_p : ∂S/∂r -= S I ; ∂I/∂r += S I ; ∂I/∂(a, b) -= I ; ∂R/∂a, ∂D/∂b += I
+        np.subtract(derivees[:, 1:2], SI, out=derivees[:, 1:2])
+        np.add(derivees[:, 5:6], SI, out=derivees[:, 5:6])
+        np.subtract(derivees[:, 6:8], I, out=derivees[:, 6:8])
+        np.add(derivees[:, 10:16:5], I, out=derivees[:, 10:16:5])
+        return derivees
+
+    def _conditions_initiales(
+        self, conditions_initiales: pd.DataFrame | dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Construit le tenseur d'état initial (N, 4).
+
+        Args:
+            conditions_initiales: DataFrame (première ligne diffusée à tous les
+                membres) ou dictionnaire {S, I, R, D} de scalaires ou tableaux (N,)
+        """
+        if isinstance(conditions_initiales, pd.DataFrame):
+            valeurs = [conditions_initiales[col].iloc[0] for col in ["S", "I", "R", "D"]]
+        else:
+            valeurs = [conditions_initiales[col] for col in ["S", "I", "R", "D"]]
+
+        y0 = np.empty((self.n_membres, 4))
+        try:
+            for j, valeur in enumerate(valeurs):
+                y0[:, j] = valeur
+        except ValueError as e:
+            raise ValueError(
+                f"Conditions initiales incompatibles avec {self.n_membres} membres"
+            ) from e
+
+        # Même plancher d'infectés que SimulateurSIRD
+        y0[:, 1] = np.maximum(y0[:, 1], 1e-5)
+        return y0
+
+    def integrer(
+        self,
+        conditions_initiales: pd.DataFrame | dict[str, np.ndarray],
+        t_max: int,
+        dt: float = 1.0,
+        methode: str = "rk4",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Intègre tous les membres de l'ensemble simultanément.
+
+        Args:
+            conditions_initiales: Voir _conditions_initiales
+            t_max: Durée de simulation (jours)
+            dt: Pas de temps
+            methode: 'euler' ou 'rk4'
+
+        Returns:
+            Tuple: (temps, états) avec états de forme (N, pas + 1, 4)
+        """
+        y0 = self._conditions_initiales(conditions_initiales)
+
+        if methode == "euler":
+            t, y = SolveurNumerique.euler(
+                self._modele_sird, y0, t_max, dt, derivee_inplace=True
+            )
+        elif methode == "rk4":
+            t, y = SolveurNumerique.rk4(
+                self._modele_sird, y0, t_max, dt, derivee_inplace=True
+            )
+        else:
+            raise ValueError(f"Méthode {methode} non supportée")
+
+        # Le solveur empile les pas en premier : (pas + 1, N, 4) -> (N, pas + 1, 4)
+        return t, y.swapaxes(0, 1)
+
+    def integrer_sensibilites(
+        self,
+        conditions_initiales: pd.DataFrame | dict[str, np.ndarray],
+        t_max: int,
+        dt: float = 1.0,
+        methode: str = "rk4",
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Intègre les états et leurs sensibilités aux paramètres en une passe.
+
+        Les conditions initiales ne dépendent pas des paramètres : Σ(0) = 0.
+        Comme dans integrer, les états S, I, R, D sont ramenés à zéro
+        lorsqu'ils deviennent négatifs (trajectoire identique à celle
+        d'integrer) ; les sensibilités, qui peuvent être négatives, ne le
+        sont pas.
+
+        Args/Voir méthode integrer pour les paramètres
+
+        Returns:
+            Tuple: (temps, états (N, pas + 1, 4),
+                    sensibilités (N, pas + 1, 4, 3) avec [..., i, j] = ∂x_i/∂p_j
+                    pour x = (S, I, R, D) et p = (r, a, b))
+        """
+        y0 = np.zeros((self.n_membres, 16))
+        y0[:, ::4] = self._conditions_initiales(conditions_initiales)
+
+        if methode == "euler":
+            solveur = SolveurNumerique.euler
+        elif methode == "rk4":
+            solveur = SolveurNumerique.rk4
+        else:
+            raise ValueError(f"Méthode {methode} non supportée")
+        t, y = solveur(
+            self._modele_sensibilites,
+            y0,
+            t_max,
+            dt,
+            derivee_inplace=True,
+            positif=np.arange(16) % 4 == 0,
+        )
+
+        # Lignes [x_i, ∂x_i/∂(r, a, b)] : (N, pas + 1, 4, 4)
+        y = y.swapaxes(0, 1).reshape(y.shape[1], y.shape[0], 4, 4)
+        return t, y[..., 0], y[..., 1:]
+
+    def resoudre(
+        self,
+        conditions_initiales: pd.DataFrame | dict[str, np.ndarray],
+        t_max: int,
+        dt: float = 1.0,
+        methode: str = "rk4",
+    ) -> pd.DataFrame:
+        """
+        Intègre l'ensemble et renvoie les résultats au format long.
+
+        Args/Voir méthode integrer pour les paramètres
+
+        Returns:
+            DataFrame avec les colonnes membre, temps, S, I, R, D
+        """
+        t, y = self.integrer(conditions_initiales, t_max, dt, methode)
+        return self._creer_dataframe(t, y)
+
+    def _creer_dataframe(self, t: np.ndarray, y: np.ndarray) -> pd.DataFrame:
+        """Mise au format long (une ligne par membre et par pas de temps)."""
+        n_pas = len(t)
+        etats = y.reshape(-1, 4)
+        return pd.DataFrame(
+            {
+                "membre": np.repeat(np.arange(self.n_membres), n_pas),
+                "temps": np.tile(t, self.n_membres),
+                "S": etats[:, 0],
+                "I": etats[:, 1],
+                "R": etats[:, 2],
+                "D": etats[:, 3],
+            }
+        )
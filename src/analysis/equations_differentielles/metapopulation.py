@@ -0,0 +1,388 @@
+import numpy as np
+import pandas as pd
+
+from src.analysis.estimateur_parametres import estimer_parametres_rab
+
+from .solveur import SolveurNumerique
+
+
+class MatriceCreuse:
+    """
+    Matrice creuse (K, K) au format CSR, limitée au produit matrice-vecteur.
+
+    Le produit ne parcourt que les nnz coefficients non nuls : un gather des
+    colonnes puis une somme par ligne (np.bincount), pour un ou plusieurs
+    vecteurs à la fois (dernier axe).
+
+    Exemple d'utilisation:
+    >>> matrice = MatriceCreuse.depuis_coo(lignes, colonnes, valeurs, (K, K))
+    >>> y = matrice @ x  # x de forme (K,) ou (N, K)
+    """
+
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        data: np.ndarray,
+        forme: tuple[int, int],
+    ):
+        """
+        Args:
+            indptr: Début de chaque ligne dans indices/data (K + 1,)
+            indices: Colonnes des coefficients (nnz,)
+            data: Valeurs des coefficients (nnz,)
+            forme: Dimensions de la matrice
+        """
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.forme = tuple(forme)
+        if len(self.indptr) != self.forme[0] + 1 or self.indptr[-1] != len(self.data):
+            raise ValueError("indptr incompatible avec la forme ou les données")
+        if len(self.indices) and (
+            self.indices.min() < 0 or self.indices.max() >= self.forme[1]
+        ):
+            raise ValueError("Indices de colonnes hors de la matrice")
+
+        # Ligne de chaque coefficient, pour la somme par ligne du produit
+        self._lignes = np.repeat(np.arange(self.forme[0]), np.diff(self.indptr))
+        self._lignes_lots = {1: self._lignes}
+
+    @classmethod
+    def depuis_coo(
+        cls,
+        lignes: np.ndarray,
+        colonnes: np.ndarray,
+        valeurs: np.ndarray,
+        forme: tuple[int, int],
+    ) -> "MatriceCreuse":
+        """Construit la matrice à partir de triplets (ligne, colonne, valeur)."""
+        lignes = np.asarray(lignes, dtype=np.int64)
+        colonnes = np.asarray(colonnes, dtype=np.int64)
+        valeurs = np.asarray(valeurs, dtype=float)
+        if len(lignes) and (lignes.min() < 0 or lignes.max() >= forme[0]):
+            raise ValueError("Indices de lignes hors de la matrice")
+
+        ordre = np.lexsort((colonnes, lignes))
+        indptr = np.zeros(forme[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(lignes, minlength=forme[0]), out=indptr[1:])
+        return cls(indptr, colonnes[ordre], valeurs[ordre], forme)
+
+    @property
+    def nnz(self) -> int:
+        """Nombre de coefficients stockés."""
+        return len(self.data)
+
+    def diagonale(self) -> np.ndarray:
+        """Coefficients diagonaux (K,)."""
+        diagonale = np.zeros(min(self.forme))
+        sur_diagonale = self._lignes == self.indices
+        np.add.at(diagonale, self._lignes[sur_diagonale], self.data[sur_diagonale])
+        return diagonale
+
+    def somme_lignes(self) -> np.ndarray:
+        """Somme des coefficients de chaque ligne (K,)."""
+        return np.bincount(self._lignes, weights=self.data, minlength=self.forme[0])
+
+    def produit(self, x: np.ndarray) -> np.ndarray:
+        """
+        Produit matrice-vecteur selon le dernier axe.
+
+        Args:
+            x: Tableau (..., K)
+
+        Returns:
+            Tableau (..., K) des produits A x
+        """
+        x = np.asarray(x, dtype=float)
+        produits = x[..., self.indices] * self.data
+        n_lots = int(np.prod(x.shape[:-1]))
+
+        # Lignes décalées de K par vecteur : une seule somme pour tout le lot
+        lignes = self._lignes_lots.get(n_lots)
+        if lignes is None:
+            decalages = np.arange(n_lots)[:, None] * self.forme[0]
+            lignes = (self._lignes + decalages).ravel()
+            self._lignes_lots[n_lots] = lignes
+
+        resultat = np.bincount(
+            lignes, weights=produits.ravel(), minlength=n_lots * self.forme[0]
+        )
+        return resultat.reshape(x.shape[:-1] + (self.forme[0],))
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        return self.produit(x)
+
+
+class SimulateurSIRDMetapopulation:
+    """
+    Modèle SIRD à K régions couplées par une matrice de mobilité creuse.
+
+    Chaque région i a ses paramètres (r_i, a_i, b_i) et son état en
+    proportions de sa population. Les résidents de i ont une part m_ij de
+    leurs contacts avec les résidents de j (déplacements pendulaires : les
+    populations restent fixes), d'où la force d'infection
+        λ_i = r_i Σ_j C_ij I_j    avec C = m + diag(1 - Σ_j m_ij)
+        dS_i/dt = -λ_i S_i
+        dI_i/dt = λ_i S_i - (a_i + b_i) I_i
+        dR_i/dt = a_i I_i
+        dD_i/dt = b_i I_i
+    Le second membre coûte un produit creux C I (O(nnz)) et non O(K²) : des
+    dizaines de milliers de régions restent intégrables par RK4. Sans
+    mobilité (C = identité), chaque région suit SimulateurSIRD.
+
+    L'état est de forme (K, 4), ou (N, K, 4) pour N scénarios simulés
+    ensemble (paramètres de forme (N, K)).
+
+    Exemple d'utilisation:
+    >>> mobilite = MatriceCreuse.depuis_coo([0, 1], [1, 0], [0.01, 0.02], (2, 2))
+    >>> modele = SimulateurSIRDMetapopulation.depuis_donnees(
+    ...     {"france": df_france, "italy": df_italy}, mobilite
+    ... )
+    >>> t, y = modele.integrer(
+    ...     {"france": df_france, "italy": df_italy}, t_max=365
+    ... )  # y: (pas + 1, K, 4)
+    """
+
+    def __init__(
+        self,
+        parametres: dict[str, np.ndarray | float],
+        mobilite: MatriceCreuse,
+        regions: list[str] = None,
+    ):
+        """
+        Args:
+            parametres: Dictionnaire des paramètres contenant:
+                - r: Taux de contagion, tableau (K,) ou (N, K)
+                - a: Taux de guérison, tableau (K,) ou (N, K)
+                - b: Taux de mortalité, tableau (K,) ou (N, K)
+                Les scalaires sont diffusés à toutes les régions.
+            mobilite: Parts de contacts m_ij entre régions (K, K) ; la
+                diagonale fournie est ignorée et recalculée
+            regions: Noms des régions (par défaut 0 .. K-1)
+        """
+        self.n_regions = mobilite.forme[0]
+        if mobilite.forme != (self.n_regions, self.n_regions):
+            raise ValueError("La matrice de mobilité doit être carrée")
+
+        self.r, self.a, self.b = np.broadcast_arrays(
+            *(
+                np.asarray(parametres[cle], dtype=float)
+                for cle in ("r", "a", "b")
+            ),
+            np.empty(self.n_regions),
+        )[:3]
+        self.regions = list(range(self.n_regions)) if regions is None else regions
+        if len(self.regions) != self.n_regions:
+            raise ValueError("Nombre de noms de régions incompatible")
+
+        self.couplage = self._couplage(mobilite)
+        self._valider_parametres()
+
+    @classmethod
+    def depuis_donnees(
+        cls, donnees: dict[str, pd.DataFrame], mobilite: MatriceCreuse
+    ) -> "SimulateurSIRDMetapopulation":
+        """
+        Modèle dont les paramètres de chaque région sont estimés par
+        estimer_parametres_rab (régions dans l'ordre du dictionnaire).
+        """
+        estimations = [estimer_parametres_rab(df.copy()) for df in donnees.values()]
+        parametres = {
+            cle: np.array([estimation[cle] for estimation in estimations])
+            for cle in ("r", "a", "b")
+        }
+        return cls(parametres, mobilite, regions=list(donnees))
+
+    def _couplage(self, mobilite: MatriceCreuse) -> MatriceCreuse:
+        """Matrice C : parts hors diagonale et part restante sur la diagonale."""
+        lignes = mobilite._lignes
+        hors_diagonale = lignes != mobilite.indices
+        if (mobilite.data[hors_diagonale] < 0).any():
+            raise ValueError("Les parts de mobilité doivent être positives")
+
+        sortantes = np.bincount(
+            lignes[hors_diagonale],
+            weights=mobilite.data[hors_diagonale],
+            minlength=self.n_regions,
+        )
+        if (sortantes > 1).any():
+            raise ValueError("Les parts de mobilité d'une région dépassent 1")
+
+        regions = np.arange(self.n_regions)
+        return MatriceCreuse.depuis_coo(
+            np.concatenate([lignes[hors_diagonale], regions]),
+            np.concatenate([mobilite.indices[hors_diagonale], regions]),
+            np.concatenate([mobilite.data[hors_diagonale], 1 - sortantes]),
+            mobilite.forme,
+        )
+
+    def _valider_parametres(self) -> None:
+        """Validation vectorielle des contraintes sur les paramètres."""
+        if (self.r < 0).any() or (self.a < 0).any() or (self.b < 0).any():
+            raise ValueError("Tous les paramètres doivent être positifs")
+
+        if not ((self.r > 0) & (self.r <= 1)).all():
+            raise ValueError("r doit être dans ]0, 1] pour toutes les régions")
+
+        # Une région avec R0 < 1 peut être alimentée par ses voisines
+        self._taux_sortie = self.a + self.b
+        with np.errstate(divide="ignore"):
+            self.R0 = self.r / self._taux_sortie
+
+    def _modele_sird(
+        self, etat: np.ndarray, t: float, out: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Équations SIRD couplées pour toutes les régions.
+
+        Args:
+            etat: Tenseur d'état (..., K, 4) dont les colonnes sont [S, I, R, D]
+            t: Temps (non utilisé mais requis par le solveur)
+            out: Tampon optionnel (..., K, 4) dans lequel écrire les dérivées
+
+        Returns:
+            Tenseur des dérivées (..., K, 4)
+        """
+        S = etat[..., 0]
+        I = etat[..., 1]
+
+        derivees = np.empty_like(etat) if out is None else out
+        # Force d'infection λ = r (C I), puis λ S dans la colonne 0
+        np.multiply(self.r, self.couplage @ I, out=derivees[..., 0])
+        np.multiply(derivees[..., 0], S, out=derivees[..., 0])
+        np.multiply(self._taux_sortie, I, out=derivees[..., 1])
+        np.subtract(derivees[..., 0], derivees[..., 1], out=derivees[..., 1])
+        np.negative(derivees[..., 0], out=derivees[..., 0])
+        np.multiply(self.a, I, out=derivees[..., 2])
+        np.multiply(self.b, I, out=derivees[..., 3])
+        return derivees
+
+    def _conditions_initiales(
+        self, conditions_initiales: np.ndarray | dict
+    ) -> np.ndarray:
+        """
+        Construit le tenseur d'état initial (..., K, 4).
+
+        Args:
+            conditions_initiales: Tableau (K, 4) ou (N, K, 4), dictionnaire
+                {S, I, R, D} de tableaux (K,), ou dictionnaire {région:
+                DataFrame} dont la première ligne est utilisée
+
+        Returns:
+            États initiaux (..., K, 4) ; I = 0 est conservé dans une région
+            dès qu'une autre région du même scénario compte des infectés
+        """
+        if isinstance(conditions_initiales, dict) and set(conditions_initiales) == set(
+            self.regions
+        ):
+            y0 = np.array(
+                [
+                    [np.asarray(conditions_initiales[region][col])[0] for col in "SIRD"]
+                    for region in self.regions
+                ],
+                dtype=float,
+            )
+        elif isinstance(conditions_initiales, dict):
+            y0 = np.stack(
+                np.broadcast_arrays(
+                    *(
+                        np.asarray(conditions_initiales[col], dtype=float)
+                        for col in "SIRD"
+                    )
+                ),
+                axis=-1,
+            )
+        else:
+            y0 = np.array(conditions_initiales, dtype=float)
+
+        try:
+            y0 = np.broadcast_to(y0, self.r.shape + (4,)).copy()
+        except ValueError as e:
+            raise ValueError(
+                f"Conditions initiales incompatibles avec {self.r.shape} régions"
+            ) from e
+
+        # Plancher d'infectés de SimulateurSIRD, seulement pour un scénario
+        # sans aucun infecté : une région saine ne doit être atteinte que par
+        # la mobilité
+        sans_infectes = ~(y0[..., 1] > 0).any(axis=-1, keepdims=True)
+        y0[..., 1] = np.where(sans_infectes, np.maximum(y0[..., 1], 1e-5), y0[..., 1])
+        return y0
+
+    def integrer(
+        self,
+        conditions_initiales: np.ndarray | dict,
+        t_max: int,
+        dt: float = 1.0,
+        methode: str = "rk4",
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Intègre toutes les régions simultanément.
+
+        Args:
+            conditions_initiales: Voir _conditions_initiales
+            t_max: Durée de simulation (jours)
+            dt: Pas de temps
+            methode: 'euler' ou 'rk4'
+
+        Returns:
+            Tuple: (temps, états) avec états de forme (pas + 1, K, 4), ou
+            (N, pas + 1, K, 4) pour N scénarios
+        """
+        y0 = self._conditions_initiales(conditions_initiales)
+
+        if methode == "euler":
+            t, y = SolveurNumerique.euler(
+                self._modele_sird, y0, t_max, dt, derivee_inplace=True
+            )
+        elif methode == "rk4":
+            t, y = SolveurNumerique.rk4(
+                self._modele_sird, y0, t_max, dt, derivee_inplace=True
+            )
+        else:
+            raise ValueError(f"Méthode {methode} non supportée")
+
+        # Scénarios en premier, comme SimulateurSIRDEnsemble
+        return t, y if y.ndim == 3 else np.moveaxis(y, 0, 1)
+
+    def resoudre(
+        self,
+        conditions_initiales: np.ndarray | dict,
+        t_max: int,
+        dt: float = 1.0,
+        methode: str = "rk4",
+    ) -> pd.DataFrame:
+        """
+        Intègre les régions et renvoie les résultats au format long.
+
+        Args/Voir méthode integrer pour les paramètres
+
+        Returns:
+            DataFrame avec les colonnes region, temps, S, I, R, D (et membre
+            pour plusieurs scénarios)
+        """
+        t, y = self.integrer(conditions_initiales, t_max, dt, methode)
+        if y.ndim == 3:
+            y = y[None]
+
+        n_membres, n_pas = y.shape[:2]
+        # Ordre (membre, région, temps) : une série contiguë par région
+        valeurs = y.transpose(0, 2, 1, 3).reshape(-1, 4)
+        df = pd.DataFrame(
+            {
+                "region": np.tile(
+                    np.repeat(np.asarray(self.regions, dtype=object), n_pas),
+                    n_membres,
+                ),
+                "temps": np.tile(t, n_membres * self.n_regions),
+                "S": valeurs[:, 0],
+                "I": valeurs[:, 1],
+                "R": valeurs[:, 2],
+                "D": valeurs[:, 3],
+            }
+        )
+        if self.r.ndim == 2:
+            membres = np.repeat(np.arange(n_membres), self.n_regions * n_pas)
+            df.insert(0, "membre", membres)
+        return df
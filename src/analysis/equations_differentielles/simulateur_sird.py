@@ -3,7 +3,8 @@ import pandas as pd
 
 from src.data import DataPipeline
 
-from .solveur import SolveurNumerique
+from .ensemble import SimulateurSIRDEnsemble
+from .solveur import Evenement, SolveurNumerique
 
 
 class SimulateurSIRD:
@@ -57,7 +58,9 @@ class SimulateurSIRD:
         if self.R0 < 1:
             raise ValueError(f"R0={self.R0:.2f} < 1 → Pas d'épidémie")
 
-    def _modele_sird(self, etat: np.ndarray, t: float) -> np.ndarray:
+    def _modele_sird(
+        self, etat: np.ndarray, t: float, out: np.ndarray = None
+    ) -> np.ndarray:
         """
         Implémentation vectorielle des équations différentielles du modèle SIRD.
         Utilise la notation vectorielle pour faciliter l'intégration avec les solveurs numériques.
@@ -65,6 +68,7 @@ class SimulateurSIRD:
         Args:
             etat: Vecteur d'état [S, I, R, D]
             t: Temps (non utilisé mais requis par le solveur)
+            out: Tampon optionnel de taille 4 dans lequel écrire les dérivées
 
         Returns:
             Vecteur des dérivées [dS/dt, dI/dt, dR/dt, dD/dt]
@@ -77,20 +81,102 @@ class SimulateurSIRD:
         dI = self.r * S * I - (self.a + self.b) * I  # Variation des infectés
         dR = self.a * I  # Augmentation des guéris
         dD = self.b * I  # Augmentation des décédés
-        return np.array([dS, dI, dR, dD])
+
+        if out is None:
+            return np.array([dS, dI, dR, dD])
+        out[0], out[1], out[2], out[3] = dS, dI, dR, dD
+        return out
+
+    def _jacobienne_sird(self, etat: np.ndarray, t: float) -> np.ndarray:
+        """
+        Jacobienne analytique ∂f/∂[S, I, R, D] du modèle SIRD.
+
+        Args:
+            etat: Vecteur d'état [S, I, R, D]
+            t: Temps (non utilisé mais requis par le solveur)
+
+        Returns:
+            Matrice 4x4 des dérivées partielles
+        """
+        S, I, _, _ = etat
+        return np.array(
+            [
+                [-self.r * I, -self.r * S, 0.0, 0.0],
+                [self.r * I, self.r * S - (self.a + self.b), 0.0, 0.0],
+                [0.0, self.a, 0.0, 0.0],
+                [0.0, self.b, 0.0, 0.0],
+            ]
+        )
+
+    def evenement_pic(self, terminal: bool = False) -> Evenement:
+        """
+        Événement du pic épidémique : dI/dt = 0 lorsque I passe de la
+        croissance à la décroissance.
+        """
+        return Evenement(
+            lambda t, y: self.r * y[0] * y[1] - (self.a + self.b) * y[1],
+            terminal=terminal,
+            direction=-1,
+            nom="pic",
+        )
+
+    def evenement_capacite(
+        self, lits_par_mille: float, terminal: bool = True
+    ) -> Evenement:
+        """
+        Événement de saturation hospitalière : I dépasse Imax = lits_par_mille / 1000.
+
+        Par défaut l'intégration s'arrête au premier dépassement, ce qui évite
+        de simuler une période qui ne sera pas exploitée.
+        """
+        Imax = lits_par_mille / 1000
+        return Evenement(
+            lambda t, y: y[1] - Imax, terminal=terminal, direction=1, nom="capacite"
+        )
+
+    def evenement_extinction(
+        self, epsilon: float = 1e-6, terminal: bool = True
+    ) -> Evenement:
+        """Événement de fin d'épidémie : I redescend sous epsilon."""
+        return Evenement(
+            lambda t, y: y[1] - epsilon,
+            terminal=terminal,
+            direction=-1,
+            nom="extinction",
+        )
 
     def resoudre(
-        self, df: pd.DataFrame, t_max: int, dt: float = 1.0, methode: str = "rk4"
+        self,
+        df: pd.DataFrame,
+        t_max: int,
+        dt: float = 1.0,
+        methode: str = "rk4",
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        evenements: list[Evenement] = None,
     ) -> pd.DataFrame:
         """
         Résout le système d'équations différentielles.
         Combine les conditions initiales avec la méthode numérique choisie.
 
         Args:
-            df: DataFrame contenant les conditions initiales
+            df: DataFrame contenant les conditions initiales (ou SIRDSeries,
+                lue sans copie)
             t_max: Durée de simulation (jours)
-            dt: Pas de temps
-            methode: 'euler' ou 'rk4'
+            dt: Pas de temps (pour 'rk45' : espacement de la grille de sortie)
+            methode: 'euler', 'rk4', 'rk45' (pas adaptatif) ou
+                'euler_implicite' (problèmes raides, grands pas)
+            rtol: Tolérance relative de la méthode 'rk45'
+            atol: Tolérance absolue de la méthode 'rk45'
+            evenements: Événements à localiser pendant l'intégration (voir
+                evenement_pic, evenement_capacite, evenement_extinction) ;
+                non disponibles pour 'euler_implicite'
+
+        Les statistiques d'intégration des méthodes 'rk45' (nombre
+        d'évaluations, pas acceptés et rejetés) et 'euler_implicite'
+        (itérations de Newton par pas) sont conservées dans l'attribut
+        infos_solveur, de même que les occurrences des événements (clé
+        "evenements").
 
         Returns:
             DataFrame avec les résultats de simulation
@@ -99,23 +185,89 @@ class SimulateurSIRD:
         # Note: Les colonnes doivent correspondre à ['S', 'I', 'R', 'D']
         y0 = np.array(
             [
-                df["S"].iloc[0],  # Population saine initiale
-                max(df["I"].iloc[0], 1e-5),  # Infectés initiaux
-                df["R"].iloc[0],  # Guéris initiaux
-                df["D"].iloc[0],  # Décédés initiaux
+                np.asarray(df["S"])[0],  # Population saine initiale
+                max(np.asarray(df["I"])[0], 1e-5),  # Infectés initiaux
+                np.asarray(df["R"])[0],  # Guéris initiaux
+                np.asarray(df["D"])[0],  # Décédés initiaux
             ]
         )
 
         # Sélection de la méthode numérique (abstraction via SolveurNumerique)
+        self.infos_solveur = {}
         if methode == "euler":
-            t, y = SolveurNumerique.euler(self._modele_sird, y0, t_max, dt)
+            t, y = SolveurNumerique.euler(
+                self._modele_sird,
+                y0,
+                t_max,
+                dt,
+                derivee_inplace=True,
+                evenements=evenements,
+                infos=self.infos_solveur,
+            )
         elif methode == "rk4":
-            t, y = SolveurNumerique.rk4(self._modele_sird, y0, t_max, dt)
+            t, y = SolveurNumerique.rk4(
+                self._modele_sird,
+                y0,
+                t_max,
+                dt,
+                derivee_inplace=True,
+                evenements=evenements,
+                infos=self.infos_solveur,
+            )
+        elif methode == "rk45":
+            t, y = SolveurNumerique.rk45(
+                self._modele_sird,
+                y0,
+                t_max,
+                dt,
+                rtol=rtol,
+                atol=atol,
+                derivee_inplace=True,
+                evenements=evenements,
+                infos=self.infos_solveur,
+            )
+        elif methode == "euler_implicite":
+            if evenements:
+                raise ValueError("Événements non supportés par 'euler_implicite'")
+            t, y = SolveurNumerique.euler_implicite(
+                self._modele_sird,
+                self._jacobienne_sird,
+                y0,
+                t_max,
+                dt,
+                infos=self.infos_solveur,
+            )
         else:
             raise ValueError(f"Méthode {methode} non supportée")
 
         return self._creer_dataframe(t, y)
 
+    def sensibilites(
+        self, df: pd.DataFrame, t_max: int, dt: float = 1.0, methode: str = "rk4"
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Trajectoire et sensibilités ∂[S, I, R, D]/∂(r, a, b) en une intégration.
+
+        Le système est augmenté des 12 équations de sensibilité (voir
+        SimulateurSIRDEnsemble._modele_sensibilites), ce qui remplace les
+        simulations supplémentaires des différences finies.
+
+        Args:
+            df: DataFrame contenant les conditions initiales (ou SIRDSeries)
+            t_max: Durée de simulation (jours)
+            dt: Pas de temps
+            methode: 'euler' ou 'rk4'
+
+        Returns:
+            Tuple: (temps, états (pas + 1, 4), sensibilités (pas + 1, 4, 3))
+        """
+        ensemble = SimulateurSIRDEnsemble({"r": self.r, "a": self.a, "b": self.b})
+        conditions = {col: np.asarray(df[col])[0] for col in ["S", "I", "R", "D"]}
+        t, y, sensibilites = ensemble.integrer_sensibilites(
+            conditions, t_max, dt, methode
+        )
+        return t, y[0], sensibilites[0]
+
     def _creer_dataframe(self, t: np.ndarray, y: np.ndarray) -> pd.DataFrame:
         """Formatage des résultats en DataFrame pour faciliter l'analyse et la visualisation."""
         return pd.DataFrame(
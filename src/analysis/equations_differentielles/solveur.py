@@ -2,25 +2,231 @@ from typing import Callable
 
 import numpy as np
 
+# Tableau de Butcher de Dormand-Prince 5(4)
+_DP_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1])
+_DP_A = [
+    np.array([1 / 5]),
+    np.array([3 / 40, 9 / 40]),
+    np.array([44 / 45, -56 / 15, 32 / 9]),
+    np.array([19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729]),
+    np.array([9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656]),
+]
+_DP_B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+# Différence entre les solutions d'ordre 5 et 4 (estimation de l'erreur locale)
+_DP_E = np.array(
+    [-71 / 57600, 0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40]
+)
+# Coefficients de la sortie dense d'ordre 4 (polynôme en θ, θ², θ³, θ⁴)
+_DP_P = np.array(
+    [
+        [1, -8048581381 / 2820520608, 8663915743 / 2820520608, -12715105075 / 11282082432],
+        [0, 0, 0, 0],
+        [0, 131558114200 / 32700410799, -68118460800 / 10900136933, 87487479700 / 32700410799],
+        [0, -1754552775 / 470086768, 14199869525 / 1410260304, -10690763975 / 1880347072],
+        [0, 127303824393 / 49829197408, -318862633887 / 49829197408, 701980252875 / 199316789632],
+        [0, -282668133 / 205662961, 2019193451 / 616988883, -1453857185 / 822651844],
+        [0, 40617522 / 29380423, -110615467 / 29380423, 69997945 / 29380423],
+    ]
+)
+# Puissances θ, θ², θ³, θ⁴ de l'interpolant
+_PUISSANCES = np.arange(1, 5)
+
+
+class Evenement:
+    """
+    Événement g(t, y) = 0 détecté pendant l'intégration.
+
+    Le passage par zéro est localisé à l'intérieur du pas par recherche de
+    racine sur l'interpolant du solveur, ce qui donne une précision bien
+    meilleure que le pas de temps.
+
+    Exemple:
+    >>> pic = Evenement(lambda t, y: y[1] - 0.01, direction=1, nom="seuil")
+    """
+
+    def __init__(
+        self,
+        fonction: Callable[[float, np.ndarray], float],
+        terminal: bool = False,
+        direction: int = 0,
+        nom: str = None,
+    ):
+        """
+        Args:
+            fonction: Fonction scalaire g(t, y) dont on cherche les zéros
+            terminal: Si True, l'intégration s'arrête au premier passage
+            direction: 1 pour un passage croissant (- vers +), -1 pour un
+                passage décroissant, 0 pour les deux
+            nom: Clé sous laquelle les occurrences sont rapportées
+        """
+        if direction not in (-1, 0, 1):
+            raise ValueError("direction doit valoir -1, 0 ou 1")
+        self.fonction = fonction
+        self.terminal = terminal
+        self.direction = direction
+        self.nom = nom
+
+    def __call__(self, t: float, y: np.ndarray) -> float:
+        return float(self.fonction(t, y))
+
+
+class _SuiviEvenements:
+    """Surveille une liste d'événements pas après pas."""
+
+    def __init__(self, evenements: list[Evenement], t0: float, y0: np.ndarray):
+        self.evenements = evenements
+        self.noms = [ev.nom or f"evenement_{i}" for i, ev in enumerate(evenements)]
+        self.g = np.array([ev(t0, y0) for ev in evenements])
+        self.temps = [[] for _ in evenements]
+        self.etats = [[] for _ in evenements]
+
+    def _passage(self, g0: float, g1: float, direction: int) -> bool:
+        """Vrai si g change de signe (dans la direction demandée) sur le pas."""
+        if g0 == 0 or np.sign(g0) == np.sign(g1):
+            return False
+        return direction == 0 or np.sign(g1 - g0) == direction
+
+    @staticmethod
+    def _racine(g: Callable[[float], float], t0, t1, g0, g1, tol=1e-12, max_iter=60):
+        """Localise le zéro de g sur [t0, t1] (regula falsi, variante Illinois)."""
+        cote = 0
+        for _ in range(max_iter):
+            t = (t0 * g1 - t1 * g0) / (g1 - g0)
+            if t1 - t0 <= tol * max(1.0, abs(t1)):
+                break
+            gt = g(t)
+            if gt == 0:
+                return t
+            if np.sign(gt) == np.sign(g1):
+                t1, g1 = t, gt
+                if cote == -1:
+                    g0 /= 2
+                cote = -1
+            else:
+                t0, g0 = t, gt
+                if cote == 1:
+                    g1 /= 2
+                cote = 1
+        return t
+
+    def verifier(
+        self,
+        t0: float,
+        t1: float,
+        y1: np.ndarray,
+        creer_interpolant: Callable[[], Callable[[float], np.ndarray]],
+    ) -> tuple[float, np.ndarray] | None:
+        """
+        Recherche les événements sur le pas [t0, t1].
+
+        Args:
+            t0, t1: Bornes du pas
+            y1: État en fin de pas
+            creer_interpolant: Construit (seulement si nécessaire) l'interpolant
+                y(t) du pas
+
+        Returns:
+            (t, y) du premier événement terminal rencontré, sinon None
+        """
+        g1 = np.array([ev(t1, y1) for ev in self.evenements])
+        interpolant = None
+        occurrences = []
+
+        for i, ev in enumerate(self.evenements):
+            if not self._passage(self.g[i], g1[i], ev.direction):
+                continue
+            if interpolant is None:
+                interpolant = creer_interpolant()
+            if g1[i] == 0:
+                t_ev = t1
+            else:
+                t_ev = self._racine(
+                    lambda t: ev(t, interpolant(t)), t0, t1, self.g[i], g1[i]
+                )
+            occurrences.append((t_ev, i))
+
+        self.g = g1
+        arret = None
+        for t_ev, i in sorted(occurrences):
+            if arret is not None and t_ev > arret[0]:
+                break
+            y_ev = interpolant(t_ev)
+            self.temps[i].append(t_ev)
+            self.etats[i].append(y_ev)
+            if self.evenements[i].terminal and arret is None:
+                arret = (t_ev, y_ev)
+        return arret
+
+    def resultats(self) -> dict[str, dict[str, np.ndarray]]:
+        """Occurrences par événement : {nom: {"t": temps, "y": états}}."""
+        return {
+            nom: {"t": np.array(temps), "y": np.array(etats)}
+            for nom, temps, etats in zip(self.noms, self.temps, self.etats)
+        }
+
 
 class SolveurNumerique:
     """Classe contenant des méthodes numériques pour résoudre des équations différentielles."""
 
+    @staticmethod
+    def _evaluateur(
+        fonction_derivee: Callable, derivee_inplace: bool
+    ) -> Callable[[np.ndarray, float, np.ndarray], np.ndarray]:
+        """
+        Uniformise l'appel à la fonction dérivée sous la forme f(y, t, tampon).
+
+        Si derivee_inplace est vrai, la fonction écrit directement dans le tampon
+        via son argument out= ; sinon le résultat renvoyé y est recopié.
+        """
+        if derivee_inplace:
+            return lambda y, t, tampon: fonction_derivee(y, t, out=tampon)
+
+        def evaluer(y, t, tampon):
+            tampon[...] = fonction_derivee(y, t)
+            return tampon
+
+        return evaluer
+
+    @staticmethod
+    def _ramener_positif(etat: np.ndarray, positif: bool | np.ndarray) -> None:
+        """Ramène à zéro les composantes négatives (toutes ou celles du masque)."""
+        if positif is True:
+            np.maximum(etat, 0, out=etat)
+        elif positif is not False:
+            np.maximum(etat, 0, out=etat, where=positif)
+
     @staticmethod
     def euler(
         fonction_derivee: Callable,
         y0: np.ndarray,
         t_max: float,
         dt: float,
-    ) -> tuple[np.ndarray, list[np.ndarray]]:
+        derivee_inplace: bool = False,
+        evenements: list[Evenement] = None,
+        infos: dict = None,
+        positif: bool | np.ndarray = True,
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
         Résout un système d'EDO avec la méthode d'Euler.
 
+        Le tableau des états (n_pas + 1, *y0.shape) est préalloué et les
+        tampons intermédiaires sont réutilisés d'un pas à l'autre.
+
         Args:
             fonction_derivee: Fonction calculant les dérivées (dy/dt = f(y, t))
             y0: Vecteur d'état initial
             t_max: Temps final de simulation
             dt: Pas de temps
+            derivee_inplace: Si True, la fonction est appelée sous la forme
+                f(y, t, out=tampon) et écrit ses dérivées dans le tampon fourni
+            evenements: Événements à détecter pendant l'intégration ; un
+                événement terminal tronque la sortie à l'instant détecté
+            infos: Dictionnaire optionnel complété avec les occurrences des
+                événements (clé "evenements")
+            positif: Si True, les états sont ramenés à zéro lorsqu'ils
+                deviennent négatifs ; un masque booléen (diffusable sur y0)
+                limite ce plancher à ses composantes (état augmenté de
+                sensibilités, qui peuvent être négatives)
 
         Returns:
             Tuple: (temps, états)
@@ -31,18 +237,68 @@ class SolveurNumerique:
         # Grille temporelle
         t = np.linspace(0, t_max, n_steps + 1)
 
-        # Historique des états
-        y = [y0]
+        # Historique des états (préalloué)
+        y0 = np.asarray(y0, dtype=float)
+        y = np.empty((n_steps + 1,) + y0.shape)
+        y[0] = y0
+
+        evaluer = SolveurNumerique._evaluateur(fonction_derivee, derivee_inplace)
+        dy = np.empty_like(y0)
+        suivi = _SuiviEvenements(evenements, t[0], y0) if evenements else None
 
         for _ in range(n_steps):
             # Calcul de la dérivée à l'instant t
-            dy = fonction_derivee(y[-1], t[_])
+            evaluer(y[_], t[_], dy)
             # Formule d'Euler explicite
-            y_new = y[-1] + dt * dy
+            np.multiply(dy, dt, out=dy)
+            np.add(y[_], dy, out=y[_ + 1])
             # Empêche les valeurs négatives
-            y.append(np.maximum(y_new, 0))
+            SolveurNumerique._ramener_positif(y[_ + 1], positif)
+
+            if suivi is not None:
+                # Interpolant linéaire du schéma d'Euler
+                arret = suivi.verifier(
+                    t[_],
+                    t[_ + 1],
+                    y[_ + 1],
+                    lambda y_a=y[_], y_b=y[_ + 1], t_a=t[_]: (
+                        lambda s: y_a + (s - t_a) / dt * (y_b - y_a)
+                    ),
+                )
+                if arret is not None:
+                    t, y = SolveurNumerique._tronquer(t, y, _ + 1, arret)
+                    break
+
+        if suivi is not None and infos is not None:
+            infos["evenements"] = suivi.resultats()
 
-        return t, np.array(y)
+        return t, y
+
+    @staticmethod
+    def _tronquer(
+        t: np.ndarray, y: np.ndarray, indice: int, arret: tuple[float, np.ndarray]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Remplace le point d'indice donné par l'événement terminal et coupe la suite."""
+        t = t[: indice + 1].copy()
+        y = y[: indice + 1]
+        t[indice], y[indice] = arret
+        return t, y
+
+    @staticmethod
+    def _hermite(
+        t0: float, h: float, y0: np.ndarray, f0: np.ndarray, y1: np.ndarray, f1: np.ndarray
+    ) -> Callable[[float], np.ndarray]:
+        """Interpolant cubique d'Hermite d'un pas à partir des valeurs et pentes aux bornes."""
+
+        def interpolant(s: float) -> np.ndarray:
+            theta = (s - t0) / h
+            h00 = 2 * theta**3 - 3 * theta**2 + 1
+            h10 = theta**3 - 2 * theta**2 + theta
+            h01 = -2 * theta**3 + 3 * theta**2
+            h11 = theta**3 - theta**2
+            return h00 * y0 + h10 * h * f0 + h01 * y1 + h11 * h * f1
+
+        return interpolant
 
     @staticmethod
     def rk4(
@@ -50,26 +306,380 @@ class SolveurNumerique:
         y0: np.ndarray,
         t_max: float,
         dt: float,
-    ) -> tuple[np.ndarray, list[np.ndarray]]:
+        derivee_inplace: bool = False,
+        evenements: list[Evenement] = None,
+        infos: dict = None,
+        positif: bool | np.ndarray = True,
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
         Résout un système d'EDO avec la méthode de Runge-Kutta d'ordre 4.
 
+        Les événements sont localisés sur l'interpolant cubique d'Hermite du
+        pas (la pente de fin de pas n'est évaluée qu'en cas de passage).
+
         Args/Voir méthode Euler pour les paramètres
         """
         n_steps = int(t_max / dt)
         t = np.linspace(0, t_max, n_steps + 1)
-        y = [y0]
+
+        y0 = np.asarray(y0, dtype=float)
+        y = np.empty((n_steps + 1,) + y0.shape)
+        y[0] = y0
+
+        evaluer = SolveurNumerique._evaluateur(fonction_derivee, derivee_inplace)
+
+        # Tampons réutilisés à chaque pas : pentes et état intermédiaire
+        k1, k2, k3, k4 = (np.empty_like(y0) for _ in range(4))
+        etat = np.empty_like(y0)
+        increment = np.empty_like(y0)
+        suivi = _SuiviEvenements(evenements, t[0], y0) if evenements else None
 
         for _ in range(n_steps):
+            y_courant = y[_]
+
             # Calcul des 4 coefficients caractéristiques de RK4
-            k1 = fonction_derivee(y[-1], t[_]) # Pente au début de l'intervalle
-            k2 = fonction_derivee(y[-1] + dt / 2 * k1, t[_] + dt / 2) # Pente au milieu (utilisant k1)
-            k3 = fonction_derivee(y[-1] + dt / 2 * k2, t[_] + dt / 2) # Pente au milieu (utilisant k2)
-            k4 = fonction_derivee(y[-1] + dt * k3, t[_] + dt) # Pente à la fin de l'intervalle
+            evaluer(y_courant, t[_], k1)  # Pente au début de l'intervalle
 
-            # Combinaison pondérée des coefficients
-            y_new = y[-1] + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+            np.multiply(k1, dt / 2, out=etat)
+            np.add(y_courant, etat, out=etat)
+            evaluer(etat, t[_] + dt / 2, k2)  # Pente au milieu (utilisant k1)
+
+            np.multiply(k2, dt / 2, out=etat)
+            np.add(y_courant, etat, out=etat)
+            evaluer(etat, t[_] + dt / 2, k3)  # Pente au milieu (utilisant k2)
+
+            np.multiply(k3, dt, out=etat)
+            np.add(y_courant, etat, out=etat)
+            evaluer(etat, t[_] + dt, k4)  # Pente à la fin de l'intervalle
+
+            # Combinaison pondérée des coefficients : k1 + 2*k2 + 2*k3 + k4
+            np.multiply(k2, 2, out=increment)
+            np.add(k1, increment, out=increment)
+            np.multiply(k3, 2, out=etat)
+            np.add(increment, etat, out=increment)
+            np.add(increment, k4, out=increment)
+            np.multiply(increment, dt / 6, out=increment)
+            np.add(y_courant, increment, out=y[_ + 1])
             # Maintien des valeurs positives
-            y.append(np.maximum(y_new, 0))
+            SolveurNumerique._ramener_positif(y[_ + 1], positif)
+
+            if suivi is not None:
+                arret = suivi.verifier(
+                    t[_],
+                    t[_ + 1],
+                    y[_ + 1],
+                    lambda y_a=y_courant, f_a=k1, y_b=y[_ + 1], t_a=t[_]: (
+                        SolveurNumerique._hermite(
+                            t_a, dt, y_a, f_a, y_b, fonction_derivee(y_b, t_a + dt)
+                        )
+                    ),
+                )
+                if arret is not None:
+                    t, y = SolveurNumerique._tronquer(t, y, _ + 1, arret)
+                    break
+
+        if suivi is not None and infos is not None:
+            infos["evenements"] = suivi.resultats()
+
+        return t, y
+
+    @staticmethod
+    def euler_implicite(
+        fonction_derivee: Callable,
+        jacobienne: Callable[[np.ndarray, float], np.ndarray],
+        y0: np.ndarray,
+        t_max: float,
+        dt: float,
+        tol: float = 1e-10,
+        max_iter: int = 20,
+        infos: dict = None,
+        positif: bool = True,
+        max_divisions: int = 12,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Résout un système d'EDO avec la méthode d'Euler implicite (rétrograde).
+
+        À chaque pas, l'équation y_{n+1} = y_n + dt * f(y_{n+1}, t_{n+1}) est
+        résolue par une méthode de Newton amortie, avec la jacobienne fournie :
+        la correction est réduite de moitié tant que l'itéré a une composante
+        négative (si positif) ou que le résidu ne décroît pas. Aux grands pas,
+        l'équation peut avoir des racines sans sens physique (I < 0) : la
+        projection écarte ces racines. Si Newton échoue, le pas est découpé
+        en deux sous-pas, récursivement.
+
+        Args:
+            fonction_derivee: Fonction calculant les dérivées (dy/dt = f(y, t))
+            jacobienne: Fonction renvoyant la matrice ∂f/∂y (forme (..., d, d)
+                pour un état de forme (..., d))
+            y0: Vecteur d'état initial
+            t_max: Temps final de simulation
+            dt: Pas de temps
+            tol: Tolérance relative sur la correction de Newton
+            max_iter: Nombre maximal d'itérations de Newton par sous-pas
+            infos: Dictionnaire optionnel complété avec les statistiques
+                d'intégration (iterations_newton et sous_pas par pas, nfev,
+                njev)
+            positif: Si True, les itérés de Newton doivent rester positifs
+            max_divisions: Nombre maximal de découpages d'un pas en deux
+
+        Returns:
+            Tuple: (temps, états)
+
+        Raises:
+            RuntimeError: Si Newton échoue encore au plus petit sous-pas
+        """
+        n_steps = int(t_max / dt)
+        t = np.linspace(0, t_max, n_steps + 1)
+
+        y0 = np.asarray(y0, dtype=float)
+        y = np.empty((n_steps + 1,) + y0.shape)
+        y[0] = y0
+
+        identite = np.eye(y0.shape[-1])
+        compteurs = {"nfev": 0, "njev": 0}
+        iterations = np.zeros(n_steps, dtype=int)
+        sous_pas = np.zeros(n_steps, dtype=int)
+
+        def newton(y_n: np.ndarray, t_suivant: float, h: float):
+            """Racine positive de G(z) = z - y_n - h f(z), ou None si échec."""
+            z = y_n.copy()
+            residu = z - y_n - h * fonction_derivee(z, t_suivant)
+            norme = np.max(np.abs(residu))
+            compteurs["nfev"] += 1
+            for iteration in range(1, max_iter + 1):
+                if norme == 0:
+                    return z, iteration - 1
+                matrice = identite - h * jacobienne(z, t_suivant)
+                compteurs["njev"] += 1
+                correction = np.linalg.solve(matrice, -residu[..., None])[..., 0]
+
+                # Amortissement : positivité puis décroissance du résidu
+                marge = tol * (1 + np.max(np.abs(y_n)))
+                facteur = 1.0
+                while facteur >= 2**-10:
+                    candidat = z + facteur * correction
+                    if not positif or np.min(candidat) >= -marge:
+                        if positif:
+                            np.maximum(candidat, 0, out=candidat)
+                        residu_candidat = (
+                            candidat - y_n - h * fonction_derivee(candidat, t_suivant)
+                        )
+                        compteurs["nfev"] += 1
+                        norme_candidat = np.max(np.abs(residu_candidat))
+                        # Décroissance suffisante, ou résidu au niveau de l'arrondi
+                        if norme_candidat <= max((1 - 1e-4 * facteur) * norme, marge):
+                            break
+                    facteur /= 2
+                else:
+                    return None
+
+                pas_newton = np.max(np.abs(candidat - z))
+                z, residu, norme = candidat, residu_candidat, norme_candidat
+                if pas_newton <= tol * (1 + np.max(np.abs(z))):
+                    return z, iteration
+            return None
+
+        def avancer(y_n: np.ndarray, t_n: float, h: float, profondeur: int):
+            """Avance de h, en deux demi-pas si Newton échoue."""
+            resultat = newton(y_n, t_n + h, h)
+            if resultat is not None:
+                return resultat[0], resultat[1], 1
+            if profondeur == max_divisions:
+                raise RuntimeError(
+                    f"Newton n'a pas convergé à t={t_n + h:.6g} "
+                    f"(sous-pas minimal {h:.3g})"
+                )
+            milieu, n_iter_1, n_pas_1 = avancer(y_n, t_n, h / 2, profondeur + 1)
+            fin, n_iter_2, n_pas_2 = avancer(milieu, t_n + h / 2, h / 2, profondeur + 1)
+            return fin, n_iter_1 + n_iter_2, n_pas_1 + n_pas_2
+
+        for _ in range(n_steps):
+            y[_ + 1], iterations[_], sous_pas[_] = avancer(y[_], t[_], dt, 0)
+
+        if infos is not None:
+            infos.update(
+                {
+                    "iterations_newton": iterations,
+                    "sous_pas": sous_pas,
+                    "nfev": compteurs["nfev"],
+                    "njev": compteurs["njev"],
+                }
+            )
+
+        return t, y
+
+    @staticmethod
+    def _norme_rms(valeurs: np.ndarray) -> float:
+        """Norme quadratique moyenne utilisée pour le contrôle d'erreur."""
+        return float(np.sqrt(np.mean(np.square(valeurs))))
+
+    @staticmethod
+    def rk45(
+        fonction_derivee: Callable,
+        y0: np.ndarray,
+        t_max: float,
+        dt: float = 1.0,
+        rtol: float = 1e-6,
+        atol: float = 1e-9,
+        t_eval: np.ndarray = None,
+        derivee_inplace: bool = False,
+        evenements: list[Evenement] = None,
+        infos: dict = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Résout un système d'EDO avec la méthode adaptative de Dormand-Prince 5(4).
+
+        Le pas est ajusté à chaque itération pour que l'erreur locale estimée
+        reste sous atol + rtol * |y|. Les pas rejetés sont recommencés avec un
+        pas réduit. Les états sont restitués sur la grille demandée par
+        l'interpolant continu d'ordre 4 de la méthode, indépendamment des pas
+        réellement effectués.
+
+        Args:
+            fonction_derivee: Fonction calculant les dérivées (dy/dt = f(y, t))
+            y0: Vecteur d'état initial
+            t_max: Temps final de simulation
+            dt: Espacement de la grille de sortie (ignoré si t_eval est fourni)
+            rtol: Tolérance relative
+            atol: Tolérance absolue
+            t_eval: Grille de sortie croissante dans [0, t_max]
+            derivee_inplace: Voir méthode Euler
+            evenements: Événements localisés sur l'interpolant continu ; un
+                événement terminal arrête l'intégration et la grille de sortie
+                est coupée à l'instant détecté
+            infos: Dictionnaire optionnel complété avec les statistiques
+                d'intégration (nfev, n_pas_acceptes, n_pas_rejetes) et les
+                occurrences des événements (clé "evenements")
+
+        Returns:
+            Tuple: (temps, états) sur la grille de sortie
+
+        Raises:
+            RuntimeError: Si le pas devient trop petit pour progresser
+        """
+        if t_eval is None:
+            t_eval = np.linspace(0, t_max, int(t_max / dt) + 1)
+        else:
+            t_eval = np.asarray(t_eval, dtype=float)
+            if np.any(np.diff(t_eval) < 0) or t_eval[0] < 0 or t_eval[-1] > t_max:
+                raise ValueError("t_eval doit être croissant et inclus dans [0, t_max]")
+
+        y0 = np.asarray(y0, dtype=float)
+        y_sortie = np.empty((len(t_eval),) + y0.shape)
+
+        evaluer = SolveurNumerique._evaluateur(fonction_derivee, derivee_inplace)
+        nfev = 0
+
+        # K[0..5] : étapes de la méthode, K[6] : dérivée au point d'arrivée (FSAL)
+        K = np.empty((7,) + y0.shape)
+        evaluer(y0, 0.0, K[0])
+        nfev += 1
+
+        # Choix du pas initial (Hairer, Nørsett & Wanner)
+        echelle = atol + np.abs(y0) * rtol
+        d0 = SolveurNumerique._norme_rms(y0 / echelle)
+        d1 = SolveurNumerique._norme_rms(K[0] / echelle)
+        h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        f1 = np.empty_like(y0)
+        evaluer(y0 + h0 * K[0], h0, f1)
+        nfev += 1
+        d2 = SolveurNumerique._norme_rms((f1 - K[0]) / echelle) / h0
+        if max(d1, d2) <= 1e-15:
+            h1 = max(1e-6, h0 * 1e-3)
+        else:
+            h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+        h = min(100 * h0, h1, t_max) if t_max > 0 else 0.0
+
+        t = 0.0
+        y = y0.copy()
+        i_sortie = np.searchsorted(t_eval, 0.0, side="right")
+        y_sortie[:i_sortie] = y0
+        n_acceptes = n_rejetes = 0
+        etat = np.empty_like(y0)
+        suivi = _SuiviEvenements(evenements, 0.0, y0) if evenements else None
+        arret = None
+
+        while t < t_max:
+            h = min(h, t_max - t)
+            if h < 1e-12 * max(1.0, abs(t)):
+                raise RuntimeError(f"Pas d'intégration trop petit à t={t:.6g}")
+
+            pas_rejete = False
+            while True:
+                # Étapes intermédiaires
+                for s, a_s in enumerate(_DP_A, start=1):
+                    np.add(y, h * np.tensordot(a_s, K[:s], axes=1), out=etat)
+                    evaluer(etat, t + _DP_C[s] * h, K[s])
+                y_nouveau = y + h * np.tensordot(_DP_B, K[:6], axes=1)
+                evaluer(y_nouveau, t + h, K[6])
+                nfev += 6
+
+                # Estimation de l'erreur locale
+                erreur = h * np.tensordot(_DP_E, K, axes=1)
+                echelle = atol + np.maximum(np.abs(y), np.abs(y_nouveau)) * rtol
+                norme_erreur = SolveurNumerique._norme_rms(erreur / echelle)
+
+                if norme_erreur < 1:
+                    facteur = 10.0 if norme_erreur == 0 else 0.9 * norme_erreur**-0.2
+                    facteur = min(10.0, facteur)
+                    if pas_rejete:
+                        facteur = min(1.0, facteur)
+                    break
+
+                # Pas rejeté : réduction et nouvelle tentative
+                n_rejetes += 1
+                pas_rejete = True
+                h *= max(0.2, 0.9 * norme_erreur**-0.2)
+                if h < 1e-12 * max(1.0, abs(t)):
+                    raise RuntimeError(f"Pas d'intégration trop petit à t={t:.6g}")
+
+            # Interpolant continu du pas : y(t + θh) = y + h * Σ Q_k θ^k
+            Q = np.tensordot(_DP_P.T, K, axes=1)
+            t_nouveau = t_max if t + h >= t_max else t + h
+
+            if suivi is not None:
+                arret = suivi.verifier(
+                    t,
+                    t_nouveau,
+                    y_nouveau,
+                    lambda t_a=t, y_a=y, h_a=h, Q_a=Q: (
+                        lambda s: y_a
+                        + h_a
+                        * np.tensordot(((s - t_a) / h_a) ** _PUISSANCES, Q_a, axes=1)
+                    ),
+                )
+                if arret is not None:
+                    t_nouveau = arret[0]
+
+            # Sortie dense sur les points de la grille contenus dans ]t, t_nouveau]
+            # (l'instant d'un événement terminal est ajouté séparément)
+            i_fin = np.searchsorted(
+                t_eval, t_nouveau, side="left" if arret is not None else "right"
+            )
+            if i_fin > i_sortie:
+                theta = (t_eval[i_sortie:i_fin] - t) / h
+                puissances = theta[:, None] ** _PUISSANCES
+                y_sortie[i_sortie:i_fin] = y + h * np.tensordot(puissances, Q, axes=1)
+                i_sortie = i_fin
+
+            if arret is not None:
+                # Grille coupée à l'instant de l'événement terminal
+                t_eval = np.append(t_eval[:i_sortie], arret[0])
+                y_sortie = np.concatenate([y_sortie[:i_sortie], arret[1][None]])
+                n_acceptes += 1
+                break
+
+            t = t_nouveau
+            y = y_nouveau
+            K[0] = K[6]
+            n_acceptes += 1
+            h *= facteur
+
+        if infos is not None:
+            infos.update(
+                {"nfev": nfev, "n_pas_acceptes": n_acceptes, "n_pas_rejetes": n_rejetes}
+            )
+            if suivi is not None:
+                infos["evenements"] = suivi.resultats()
 
-        return t, np.array(y)
+        return t_eval, y_sortie
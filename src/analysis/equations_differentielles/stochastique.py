@@ -0,0 +1,291 @@
+import numpy as np
+import pandas as pd
+
+
+class SimulateurSIRDStochastique:
+    """
+    Simule des réalisations stochastiques du modèle SIRD en effectifs entiers.
+
+    Les transitions sont celles du modèle déterministe, écrites sur les
+    effectifs absolus (N = S + I + R + D) :
+        infection  S -> I  au taux r S I / N
+        guérison   I -> R  au taux a I
+        décès      I -> D  au taux b I
+    Aux petits effectifs, la discrétisation compte : une chaîne de
+    transmission peut s'éteindre avant de devenir une épidémie.
+
+    Une réalisation est une extinction précoce (épidémie mineure) lorsque
+    I atteint 0 avant t_max alors que le nombre total d'infections reste
+    inférieur à seuil_epidemie fois les susceptibles initiaux. Toute
+    épidémie finit par s'éteindre : c'est la taille finale qui sépare les
+    deux issues, dont les distributions sont disjointes pour R0 > 1. Partant
+    de I0 infectés, la probabilité d'extinction précoce vaut environ
+    (1 / R0) ** I0 pour R0 > 1 et 1 sinon ; le tau-leaping la sous-estime
+    de quelques points pour dt = 0.25 (premiers infectés traités par pas).
+
+    Deux méthodes, vectorisées sur les réplicats (np.random.Generator) :
+    - 'ssa' : algorithme de Gillespie exact, un événement par pas et par
+      réplicat ; le coût croît avec le nombre d'événements (petites
+      populations, débuts et fins d'épidémie)
+    - 'tau' : tau-leaping binomial, les transitions d'un pas dt sont tirées
+      par lois binomiales (effectifs jamais négatifs) ; le coût ne dépend
+      que de t_max / dt (populations nationales)
+
+    Exemple d'utilisation:
+    >>> simulateur = SimulateurSIRDStochastique({"r": 0.3, "a": 0.1, "b": 0.01})
+    >>> resultats = simulateur.simuler(donnees, t_max=365, n_replicats=1000)
+    >>> resultats["probabilite_extinction"]  # ≈ 1 / R0 avec 1 infecté
+    >>> resultats["distribution_jour_pic"]  # P(pic au jour j)
+    """
+
+    def __init__(self, parametres: dict[str, float], seuil_ssa: float = 1e4):
+        """
+        Args:
+            parametres: Dictionnaire des paramètres contenant:
+                - r: Taux de contagion (0 < r <= 1)
+                - a: Taux de guérison (a >= 0)
+                - b: Taux de mortalité (b >= 0)
+            seuil_ssa: Population en dessous de laquelle la méthode 'auto'
+                utilise l'algorithme exact
+        """
+        self.r = parametres["r"]
+        self.a = parametres["a"]
+        self.b = parametres["b"]
+        self.seuil_ssa = seuil_ssa
+        self._valider_parametres()
+
+    def _valider_parametres(self) -> None:
+        """Validation des contraintes sur les paramètres."""
+        if any(val < 0 for val in [self.r, self.a, self.b]):
+            raise ValueError("Tous les paramètres doivent être positifs")
+
+        if not 0 < self.r <= 1:
+            raise ValueError("r doit être dans ]0, 1]")
+
+        # R0 < 1 n'est pas une erreur : l'extinction est alors le cas typique
+        # (a = b = 0 : aucune sortie de I, R0 infini)
+        taux_sortie = self.a + self.b
+        self.R0 = np.inf if taux_sortie == 0 else self.r / taux_sortie
+
+    @staticmethod
+    def _conditions_initiales(
+        conditions_initiales: pd.DataFrame | dict[str, float],
+    ) -> np.ndarray:
+        """
+        Effectifs initiaux entiers [S, I, R, D].
+
+        Args:
+            conditions_initiales: DataFrame (première ligne des colonnes
+                'S_abs', 'I_abs', 'R_abs', 'D_abs') ou dictionnaire
+                {S, I, R, D} d'effectifs
+        """
+        if isinstance(conditions_initiales, pd.DataFrame):
+            valeurs = [
+                conditions_initiales[f"{col}_abs"].iloc[0]
+                for col in ["S", "I", "R", "D"]
+            ]
+        else:
+            valeurs = [conditions_initiales[col] for col in ["S", "I", "R", "D"]]
+
+        y0 = np.rint(np.asarray(valeurs, dtype=float)).astype(np.int64)
+        if (y0 < 0).any():
+            raise ValueError("Les effectifs initiaux doivent être positifs")
+        return y0
+
+    def simuler(
+        self,
+        conditions_initiales: pd.DataFrame | dict[str, float],
+        t_max: int = 365,
+        n_replicats: int = 1000,
+        methode: str = "auto",
+        dt: float = 0.25,
+        seed: int | np.random.SeedSequence = None,
+        seuil_epidemie: float = 0.1,
+    ) -> dict:
+        """
+        Simule n_replicats réalisations indépendantes.
+
+        Args:
+            conditions_initiales: Voir _conditions_initiales
+            t_max: Durée de simulation (jours)
+            n_replicats: Nombre de réalisations
+            methode: 'ssa', 'tau' ou 'auto' (selon seuil_ssa)
+            dt: Pas du tau-leaping (1/dt entier)
+            seed: Graine du générateur
+            seuil_epidemie: Part des susceptibles initiaux infectés en
+                dessous de laquelle une épidémie éteinte est mineure ; à
+                choisir sous la taille finale déterministe lorsque R0 est
+                proche de 1
+
+        Returns:
+            Dictionnaire avec:
+                - t: Jours (t_max + 1,)
+                - etats: Effectifs journaliers (n_replicats, t_max + 1, 4)
+                - taille_finale: Nombre total d'infections à t_max
+                - extinction: Réplicats éteints avant t_max sans devenir
+                  une épidémie (taille_finale < seuil_epidemie S0)
+                - temps_extinction: Date à laquelle I atteint 0 (NaN sinon)
+                - probabilite_extinction: Probabilité d'extinction précoce
+                - jour_pic, pic: Jour et effectif du maximum de I
+                - distribution_jour_pic: Series de P(pic au jour j)
+        """
+        y0 = self._conditions_initiales(conditions_initiales)
+        rng = np.random.default_rng(seed)
+
+        if methode == "auto":
+            methode = "ssa" if y0.sum() <= self.seuil_ssa else "tau"
+        if methode == "ssa":
+            etats, temps_extinction = self._gillespie(y0, t_max, n_replicats, rng)
+        elif methode == "tau":
+            etats, temps_extinction = self._tau_leaping(
+                y0, t_max, n_replicats, dt, rng
+            )
+        else:
+            raise ValueError(f"Méthode {methode} non supportée")
+
+        t = np.arange(t_max + 1)
+        # Premier maximum de I de chaque réplicat
+        jour_pic = np.argmax(etats[:, :, 1], axis=1)
+        # Infections cumulées : sorties de S depuis le début
+        taille_finale = y0[0] - etats[:, -1, 0]
+        extinction = (etats[:, -1, 1] == 0) & (taille_finale < seuil_epidemie * y0[0])
+        return {
+            "t": t,
+            "etats": etats,
+            "taille_finale": taille_finale,
+            "extinction": extinction,
+            "temps_extinction": temps_extinction,
+            "probabilite_extinction": extinction.mean(),
+            "jour_pic": jour_pic,
+            "pic": etats[np.arange(n_replicats), jour_pic, 1],
+            "distribution_jour_pic": pd.Series(
+                np.bincount(jour_pic, minlength=t_max + 1) / n_replicats,
+                index=pd.Index(t, name="Jour"),
+                name="probabilite_pic",
+            ),
+        }
+
+    def _gillespie(
+        self, y0: np.ndarray, t_max: int, n_replicats: int, rng: np.random.Generator
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Algorithme de Gillespie, un événement par pas pour tous les réplicats.
+
+        Les réplicats terminés (t > t_max ou I = 0, état absorbant) sont
+        retirés des calculs ; chaque pas ne porte que sur les actifs.
+
+        Returns:
+            Tuple: (états journaliers, dates d'extinction)
+        """
+        population = y0.sum()
+        etats = np.empty((n_replicats, t_max + 1, 4), dtype=np.int64)
+        temps_extinction = np.full(n_replicats, np.nan)
+
+        y = np.tile(y0, (n_replicats, 1))
+        t = np.zeros(n_replicats)
+        # Prochain jour à enregistrer ; l'état du jour j est celui en vigueur à t = j
+        jour = np.zeros(n_replicats, dtype=np.int64)
+        actifs = np.arange(n_replicats)
+
+        while len(actifs):
+            S = y[actifs, 0]
+            I = y[actifs, 1]
+            taux_infection = self.r * S * I / population
+            taux_total = taux_infection + (self.a + self.b) * I
+
+            # Date du prochain événement (infini si I = 0 : état absorbant)
+            with np.errstate(divide="ignore"):
+                t_suivant = t[actifs] + rng.exponential(size=len(actifs)) / taux_total
+
+            # Enregistrement des jours écoulés avant l'événement
+            limite = np.minimum(np.floor(t_suivant), t_max).astype(np.int64)
+            while True:
+                a_enregistrer = jour[actifs] <= limite
+                if not a_enregistrer.any():
+                    break
+                indices = actifs[a_enregistrer]
+                etats[indices, jour[indices]] = y[indices]
+                jour[indices] += 1
+
+            eteints = I == 0
+            temps_extinction[actifs[eteints & (t[actifs] == 0)]] = 0.0
+            termines = t_suivant > t_max
+            en_cours = ~termines
+            actifs, taux_infection, taux_total = (
+                actifs[en_cours],
+                taux_infection[en_cours],
+                taux_total[en_cours],
+            )
+            t[actifs] = t_suivant[en_cours]
+
+            # Choix de l'événement proportionnellement aux taux
+            u = rng.random(len(actifs)) * taux_total
+            infection = u < taux_infection
+            deces = ~infection & (u < taux_infection + self.b * y[actifs, 1])
+            guerison = ~infection & ~deces
+
+            y[actifs[infection], 0] -= 1
+            y[actifs[infection], 1] += 1
+            y[actifs[~infection], 1] -= 1
+            y[actifs[guerison], 2] += 1
+            y[actifs[deces], 3] += 1
+
+            # Extinction : date du dernier retrait
+            fin = actifs[y[actifs, 1] == 0]
+            temps_extinction[fin] = t[fin]
+
+        return etats, temps_extinction
+
+    def _tau_leaping(
+        self,
+        y0: np.ndarray,
+        t_max: int,
+        n_replicats: int,
+        dt: float,
+        rng: np.random.Generator,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Tau-leaping binomial : sur un pas dt, chaque susceptible est infecté
+        avec la probabilité 1 - exp(-r I dt / N), chaque infecté sort avec la
+        probabilité 1 - exp(-(a + b) dt), par décès avec la proportion
+        b / (a + b).
+
+        Returns:
+            Tuple: (états journaliers, dates d'extinction à dt près)
+        """
+        pas = round(1 / dt)
+        if pas < 1 or not np.isclose(pas * dt, 1):
+            raise ValueError(f"1/dt doit être entier: dt={dt}")
+
+        population = y0.sum()
+        taux_sortie = self.a + self.b
+        p_sortie = -np.expm1(-taux_sortie * dt)
+        p_deces = self.b / taux_sortie if taux_sortie > 0 else 0.0
+
+        etats = np.empty((n_replicats, t_max + 1, 4), dtype=np.int64)
+        temps_extinction = np.full(n_replicats, np.nan)
+        S, I, R, D = (np.full(n_replicats, valeur) for valeur in y0)
+        etats[:, 0] = y0
+        temps_extinction[I == 0] = 0.0
+
+        for k in range(1, t_max * pas + 1):
+            p_infection = -np.expm1(-self.r * dt / population * I)
+            infections = rng.binomial(S, p_infection)
+            sorties = rng.binomial(I, p_sortie)
+            deces = rng.binomial(sorties, p_deces)
+
+            S -= infections
+            I += infections - sorties
+            R += sorties - deces
+            D += deces
+
+            eteints = (I == 0) & np.isnan(temps_extinction)
+            temps_extinction[eteints] = k * dt
+            if k % pas == 0:
+                jour = k // pas
+                etats[:, jour, 0] = S
+                etats[:, jour, 1] = I
+                etats[:, jour, 2] = R
+                etats[:, jour, 3] = D
+
+        return etats, temps_extinction
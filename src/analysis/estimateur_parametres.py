@@ -10,6 +10,7 @@ def estimer_parametres_rab(df: pd.DataFrame) -> dict[str, float]:
 
     Args:
         df: DataFrame contenant les colonnes 'I', 'S', 'I_abs', 'R_abs', 'D_abs'
+            (ou SIRDSeries : les colonnes sont lues sans copie)
 
     Returns:
         Dictionnaire avec les paramètres:
@@ -17,26 +18,134 @@ def estimer_parametres_rab(df: pd.DataFrame) -> dict[str, float]:
             - a: Taux de guérison
             - b: Taux de mortalité
     """
-    # Création d'un DataFrame temporaire pour l'intégration
-    df_integration = pd.DataFrame({"I_abs": df["I_abs"].values}, index=df.index)
-
     # Initialisation de l'intégrateur personnalisé
-    integrateur = Integration(df=df_integration, col="I_abs", h=1.0)
+    integrateur = Integration(df=df, col="I_abs", h=1.0)
 
     # Calcul de l'intégrale avec notre méthode Simpson
     integral_I_abs = integrateur.simpson()
 
     # Calcul des paramètres a et b
-    a = df["R_abs"].iloc[-1] / integral_I_abs
-    b = df["D_abs"].iloc[-1] / integral_I_abs
+    a = np.asarray(df["R_abs"])[-1] / integral_I_abs
+    b = np.asarray(df["D_abs"])[-1] / integral_I_abs
 
     # Calcul de r avec validation des valeurs
-    df["dI_dt"] = np.gradient(df["I"], 1)
-    condition_valide = (df["S"] * df["I"] > 1e-9) & (df["I"] > 1e-6)
+    S = np.asarray(df["S"], dtype=float)
+    I = np.asarray(df["I"], dtype=float)
+    dI_dt = np.gradient(I, 1)
+    if isinstance(df, pd.DataFrame):
+        df["dI_dt"] = dI_dt
+    condition_valide = (S * I > 1e-9) & (I > 1e-6)
 
-    r_values = (df["dI_dt"][condition_valide] + (a + b) * df["I"][condition_valide]) / (
-        df["S"][condition_valide] * df["I"][condition_valide]
+    r_values = (dI_dt[condition_valide] + (a + b) * I[condition_valide]) / (
+        S[condition_valide] * I[condition_valide]
     )
-    r = r_values.median()
+    r = np.nanmedian(r_values) if r_values.size else np.nan
 
     return {"r": float(r), "a": float(a), "b": float(b)}
+
+
+def estimer_taux_vaccination(df: pd.DataFrame) -> float:
+    """
+    Estime le taux de vaccination v du modèle SIRDV (flux S -> V = v S).
+
+    La colonne V des données est la proportion de la population vaccinée
+    chaque jour : v est la médiane de V / S sur les jours de vaccination.
+
+    Args:
+        df: DataFrame (ou SIRDSeries) contenant les colonnes 'S' et 'V'
+
+    Returns:
+        Taux de vaccination (NaN sans jour de vaccination)
+    """
+    S = np.asarray(df["S"], dtype=float)
+    V = np.asarray(df["V"], dtype=float)
+    valides = (V > 0) & (S > 1e-9)
+    return float(np.median(V[valides] / S[valides])) if valides.any() else np.nan
+
+
+def estimer_parametres_glissants(
+    donnees: pd.DataFrame | dict[str, pd.DataFrame],
+    fenetre: int = 28,
+    methode: str = "simpson",
+) -> pd.DataFrame | dict[str, pd.DataFrame]:
+    """
+    Estime r(t), a(t) et b(t) sur toutes les fenêtres glissantes en O(n).
+
+    Sur une fenêtre [t0, t1], les équations dR/dt = a I, dD/dt = b I et
+    dI/dt = r S I - (a + b) I intégrées donnent :
+        a = (R(t1) - R(t0)) / ∫I        b = (D(t1) - D(t0)) / ∫I
+        r = (I(t1) - I(t0) + (a + b) ∫I) / ∫SI
+    Chaque intégrale de fenêtre est une différence d'intégrales cumulées
+    (Integration.integrale_cumulee) : toutes les positions sont obtenues
+    ensemble, sans dérivée numérique ni boucle sur les fenêtres. Les pays de
+    même longueur sont traités dans un seul bloc (jours, pays).
+
+    Les DataFrames d'entrée ne sont pas modifiés.
+
+    Args:
+        donnees: DataFrame SIRD (colonnes 'S', 'I', 'I_abs', 'R_abs',
+            'D_abs') ou dictionnaire {pays: DataFrame}
+        fenetre: Nombre de jours de chaque fenêtre
+        methode: Méthode d'intégration cumulée ('simpson', 'trapeze'...)
+
+    Returns:
+        DataFrame (ou dictionnaire de DataFrames) des colonnes r, a, b,
+        indexé par le dernier jour de chaque fenêtre ; NaN lorsque les
+        intégrales de la fenêtre sont nulles
+    """
+    if isinstance(donnees, pd.DataFrame):
+        return estimer_parametres_glissants({None: donnees}, fenetre, methode)[None]
+    if fenetre < 2:
+        raise ValueError("La fenêtre doit contenir au moins 2 jours")
+
+    # Regroupement des pays par longueur de série
+    groupes = {}
+    for pays, df in donnees.items():
+        if len(df) < fenetre:
+            raise ValueError(f"Série trop courte pour {pays}: {len(df)} < {fenetre}")
+        groupes.setdefault(len(df), []).append(pays)
+
+    resultats = {}
+    for n, liste_pays in groupes.items():
+        # Blocs (n, K) : une colonne par pays
+        colonnes = {
+            col: np.column_stack(
+                [np.asarray(donnees[pays][col], dtype=float) for pays in liste_pays]
+            )
+            for col in ["S", "I", "I_abs", "R_abs", "D_abs"]
+        }
+        K = len(liste_pays)
+
+        # Intégrales cumulées de I_abs, I et S*I en un seul appel (n, 3K)
+        integrandes = np.hstack(
+            [colonnes["I_abs"], colonnes["I"], colonnes["S"] * colonnes["I"]]
+        )
+        cumul = Integration.depuis_tableau(integrandes, h=1.0).integrale_cumulee(
+            methode
+        )
+        # Intégrales et variations sur chaque fenêtre [k, k + fenetre - 1]
+        sur_fenetre = cumul[fenetre - 1 :] - cumul[: n - fenetre + 1]
+        integrale_I_abs = sur_fenetre[:, :K]
+        integrale_I = sur_fenetre[:, K : 2 * K]
+        integrale_SI = sur_fenetre[:, 2 * K :]
+
+        def variation(col):
+            return colonnes[col][fenetre - 1 :] - colonnes[col][: n - fenetre + 1]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            valide = integrale_I_abs > 0
+            a = np.where(valide, variation("R_abs") / integrale_I_abs, np.nan)
+            b = np.where(valide, variation("D_abs") / integrale_I_abs, np.nan)
+            r = np.where(
+                integrale_SI > 1e-12,
+                (variation("I") + (a + b) * integrale_I) / integrale_SI,
+                np.nan,
+            )
+
+        for k, pays in enumerate(liste_pays):
+            resultats[pays] = pd.DataFrame(
+                {"r": r[:, k], "a": a[:, k], "b": b[:, k]},
+                index=donnees[pays].index[fenetre - 1 :],
+            )
+
+    return {pays: resultats[pays] for pays in donnees}
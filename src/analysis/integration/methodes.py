@@ -1,64 +1,180 @@
 import numpy as np
-import pandas as pd
 
 
 class Integration:
     """
-    df: Le DataFrame(csv) contenant les données.
-    col: Le nom de la colonne contenant les valeurs y.
+    df: Le DataFrame(csv) contenant les données (ou une SIRDSeries).
+    col: Le nom de la colonne contenant les valeurs y (ou une liste de
+         colonnes, intégrées simultanément par integrale_cumulee).
     h : le pas entre xi+1 et xi
+
+    Les valeurs sont copiées une fois dans un tableau NumPy contigu : toutes
+    les méthodes sont vectorisées et ne dépendent pas de l'index du DataFrame.
     """
 
     def __init__(self, df, col, h):
         self.df = df
         self.col = col
         self.h = h
-        self.n = len(df)
+        # Vue sans copie pour une colonne float64 (DataFrame ou np.memmap)
+        self.y = np.ascontiguousarray(np.asarray(df[col], dtype=float))
+        self.n = len(self.y)
+
+    @classmethod
+    def depuis_tableau(cls, valeurs, h):
+        """
+        Construit un intégrateur directement à partir d'un tableau de valeurs.
+
+        Un tableau (n, m) donne m séries intégrées simultanément le long de
+        l'axe 0 : chaque méthode renvoie alors un tableau (m,) (ou (n, m)
+        pour integrale_cumulee).
+        """
+        # Sans DataFrame intermédiaire : le tableau est utilisé tel quel
+        integrateur = cls.__new__(cls)
+        integrateur.df = None
+        integrateur.col = None
+        integrateur.h = h
+        integrateur.y = np.ascontiguousarray(valeurs, dtype=float)
+        integrateur.n = len(integrateur.y)
+        return integrateur
+
+    def _zero(self):
+        """Intégrale nulle (scalaire, ou une par colonne)."""
+        return np.zeros(self.y.shape[1:])[()]
 
     def trapeze(self):
-        premiere_valeur = self.df.loc[0, self.col]  # Valeur au début de l’intervalle
-        derniere_valeur = self.df.loc[
-            self.n - 1, self.col
-        ]  # Valeur à la fin de l’intervalle
-        somme_trapeze = 0
-        # Somme des valeurs internes
-        for i in range(1, self.n - 1):
-            somme_trapeze += self.df.loc[self.df.index[i], self.col]
+        y = self.y
+        if self.n < 2:
+            return self._zero()
         # Application de la formule du trapèze
-        integrale_trapeze = (self.h / 2) * (
-            premiere_valeur + derniere_valeur + 2 * somme_trapeze
-        )
-        return integrale_trapeze
+        return (self.h / 2) * (y[0] + y[-1] + 2 * y[1:-1].sum(axis=0))
 
     def simpson(self):
-        fist_value = self.df.loc[self.df.index[0], self.col]
-        last_value = self.df.loc[self.df.index[-1], self.col]
-        if self.n % 2 == 0:
-            added_row = self.df.iloc[[-1]].copy()
-            self.df = pd.concat(
-                [self.df.iloc[:877], added_row, self.df.iloc[877:]], ignore_index=True
-            )
-        somme_simpson = 0
-        # Test pour coeff et somme
-        for i in range(1, self.n - 1):
-            coeff = 4 if i % 2 != 0 else 2
-            somme_simpson += coeff * self.df.loc[self.df.index[i], self.col]
+        """
+        Méthode de Simpson composite pour un nombre quelconque de points.
 
-        simpson_integrale = (self.h / 3) * (fist_value + last_value + somme_simpson)
-        return simpson_integrale
+        Avec un nombre impair d'intervalles, la règle 1/3 est appliquée sur
+        tous les intervalles sauf les trois derniers, traités par la règle 3/8.
+        """
+        y = self.y
+        m = self.n - 1  # Nombre d'intervalles
+        if m < 1:
+            return self._zero()
+        if m == 1:
+            return self.trapeze()
+
+        # Nombre d'intervalles traités par la règle 1/3 (pair)
+        m_13 = m if m % 2 == 0 else m - 3
+        integrale = self._zero()
+        if m_13 > 0:
+            # Coefficients 1, 4, 2, 4, ..., 2, 4, 1
+            integrale = (self.h / 3) * (
+                y[0]
+                + y[m_13]
+                + 4 * y[1:m_13:2].sum(axis=0)
+                + 2 * y[2 : m_13 - 1 : 2].sum(axis=0)
+            )
+        if m_13 < m:
+            # Règle 3/8 sur les trois derniers intervalles
+            integrale += (3 * self.h / 8) * (
+                y[-4] + 3 * y[-3] + 3 * y[-2] + y[-1]
+            )
+        return integrale
 
     def rect_gauche(self):
-        somme_rectangle_gauche = 0
         # Somme des hauteurs des rectangles à gauche
-        for i in range(0, self.n - 1):
-            somme_rectangle_gauche += self.df.loc[self.df.index[i], self.col]
-        # Calcul de l’intégrale par la méthode des rectangles à gauche
-        return self.h * somme_rectangle_gauche
+        return self.h * self.y[:-1].sum(axis=0)
 
     def rect_droite(self):
         # Somme des hauteurs des rectangles à droite
-        somme_rectangle_droite = 0
-        for i in range(1, self.n):
-            somme_rectangle_droite += self.df.loc[self.df.index[i], self.col]
-        # Calcul de l’intégrale par la méthode des rectangles à droite
-        return self.h * somme_rectangle_droite
+        return self.h * self.y[1:].sum(axis=0)
+
+    @staticmethod
+    def poids(n, h, methode="simpson"):
+        """
+        Poids de quadrature w tels que l'intégrale vaille w @ y.
+
+        Les règles composites sont linéaires en y : une intégrale pondérée
+        (ré-échantillonnage, sous-ensemble de points) se calcule alors par
+        un produit scalaire, pour de nombreux vecteurs à la fois.
+
+        Args:
+            n: Nombre de points
+            h: Pas entre deux points
+            methode: 'simpson', 'trapeze', 'rect_gauche' ou 'rect_droite'
+                (mêmes règles que les méthodes du même nom)
+        """
+        w = np.zeros(n)
+        m = n - 1  # Nombre d'intervalles
+        if m < 1:
+            return w
+
+        if methode == "trapeze" or (methode == "simpson" and m == 1):
+            w[:] = h
+            w[[0, -1]] = h / 2
+        elif methode == "rect_gauche":
+            w[:-1] = h
+        elif methode == "rect_droite":
+            w[1:] = h
+        elif methode == "simpson":
+            m_13 = m if m % 2 == 0 else m - 3
+            if m_13 > 0:
+                w[1:m_13:2] = 4 * h / 3
+                w[2 : m_13 - 1 : 2] = 2 * h / 3
+                w[[0, m_13]] = h / 3
+            if m_13 < m:
+                w[-4:] += (3 * h / 8) * np.array([1, 3, 3, 1])
+        else:
+            raise ValueError(f"Méthode {methode} non supportée")
+
+        return w
+
+    def integrale_cumulee(self, methode="trapeze"):
+        """
+        Intégrales cumulées F[k] = ∫ de x_0 à x_k, pour tous les k en O(n).
+
+        Args:
+            methode: 'trapeze', 'simpson', 'rect_gauche' ou 'rect_droite'
+
+        Returns:
+            Tableau de taille n avec F[0] = 0 (ou (n, m) si plusieurs
+            colonnes sont intégrées)
+
+        Pour 'simpson', les préfixes d'un nombre pair d'intervalles utilisent
+        la règle 1/3 ; le dernier intervalle d'un préfixe impair est intégré
+        par la parabole passant par les trois derniers points. La même règle
+        vaut pour tous les préfixes, dernier compris : une différence
+        F[j] - F[i] est cohérente quelle que soit la fenêtre. Pour un nombre
+        impair d'intervalles, la dernière valeur diffère donc de simpson()
+        (règle 3/8 en fin) d'un O(h⁴).
+        """
+        y = self.y
+        n = self.n
+        cumul = np.zeros(y.shape)
+        if n < 2:
+            return cumul
+
+        if methode == "trapeze":
+            cumul[1:] = np.cumsum((self.h / 2) * (y[:-1] + y[1:]), axis=0)
+        elif methode == "rect_gauche":
+            cumul[1:] = self.h * np.cumsum(y[:-1], axis=0)
+        elif methode == "rect_droite":
+            cumul[1:] = self.h * np.cumsum(y[1:], axis=0)
+        elif methode == "simpson":
+            if n == 2:
+                cumul[1] = (self.h / 2) * (y[0] + y[1])
+                return cumul
+            # Préfixes pairs : somme des paires d'intervalles [x_2j, x_2j+2]
+            paires = (self.h / 3) * (y[:-2:2] + 4 * y[1:-1:2] + y[2::2])
+            cumul[2::2] = np.cumsum(paires, axis=0)
+            # Premier intervalle : parabole sur x_0, x_1, x_2
+            cumul[1] = (self.h / 12) * (5 * y[0] + 8 * y[1] - y[2])
+            # Préfixes impairs k >= 3 : F[k-1] + parabole sur x_k-2, x_k-1, x_k
+            k = np.arange(3, n, 2)
+            cumul[k] = cumul[k - 1] + (self.h / 12) * (
+                -y[k - 2] + 8 * y[k - 1] + 5 * y[k]
+            )
+        else:
+            raise ValueError(f"Méthode {methode} non supportée")
+
+        return cumul
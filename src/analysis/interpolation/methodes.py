@@ -1,8 +1,159 @@
 import numpy as np
-from numpy.polynomial import Polynomial
+from numpy.polynomial import polynomial as P
+from numpy.polynomial import polyutils
 
 import pandas as pd
 
+class SplineCubique:
+    """
+    Spline cubique naturelle dont les coefficients sont calculés une seule fois.
+
+    Sur l'intervalle [x_i, x_i+1] :
+        s(x) = a_i + b_i dx + c_i dx² + d_i dx³,  dx = x - x_i
+    En dehors des données, la spline est prolongée par ses tangentes aux
+    extrémités : droite passant par (x_0, y_0) de pente s'(x_0) à gauche, par
+    (x_n, y_n) de pente s'(x_n) à droite (prolongement continu et dérivable).
+
+    y peut être de forme (n,) ou (n, m) : les m colonnes partagent les mêmes
+    nœuds et sont traitées en un seul balayage.
+    """
+
+    def __init__(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        n = len(x) - 1
+
+        if n < 1:
+            raise ValueError("Au moins 2 points sont nécessaires pour l'interpolation.")
+
+        # Étape 1 : Calcul des pas h et des valeurs alpha
+        h = np.diff(x)
+        h_col = h.reshape((-1,) + (1,) * (y.ndim - 1))  # h diffusé sur les colonnes
+        pentes = np.diff(y, axis=0) / h_col
+        alpha = np.zeros_like(y)
+        alpha[1:n] = 3 * (pentes[1:] - pentes[:-1])
+
+        # Étape 2 : Résolution du système tridiagonal (algorithme de Thomas),
+        # chaque itération traite toutes les colonnes à la fois
+        l = np.ones(n + 1)
+        mu = np.zeros(n + 1)
+        z = np.zeros_like(y)
+        diag = 2 * (x[2:] - x[:-2])
+        for i in range(1, n):
+            l[i] = diag[i - 1] - h[i - 1] * mu[i - 1]
+            mu[i] = h[i] / l[i]
+            z[i] = (alpha[i] - h[i - 1] * z[i - 1]) / l[i]
+
+        # Étape 3 : Remontée et calcul des coefficients a, b, c, d
+        c = np.zeros_like(y)
+        for j in range(n - 1, -1, -1):
+            c[j] = z[j] - mu[j] * c[j + 1]
+
+        self.x = x
+        self.n = n
+        self.a = y[:-1]
+        self.c = c
+        self.b = pentes - h_col * (2 * c[:-1] + c[1:]) / 3
+        self.d = (c[1:] - c[:-1]) / (3 * h_col)
+        # Tangente en x_n pour le prolongement à droite
+        self._y_fin = y[-1]
+        self._pente_fin = self.b[-1] + h_col[-1] * (
+            2 * c[-2] + 3 * self.d[-1] * h_col[-1]
+        )
+
+        # Intégrales cumulées sur les intervalles complets (pour integrale)
+        integrales = (
+            self.a * h_col
+            + self.b * h_col**2 / 2
+            + c[:-1] * h_col**3 / 3
+            + self.d * h_col**4 / 4
+        )
+        self._cumul = np.concatenate(
+            [np.zeros((1,) + y.shape[1:]), np.cumsum(integrales, axis=0)]
+        )
+
+    def _localiser(self, x_val):
+        """Indice d'intervalle et écart dx pour chaque point (recherche dichotomique)."""
+        x_val = np.asarray(x_val, dtype=float)
+        i = np.clip(np.searchsorted(self.x, x_val, side="right") - 1, 0, self.n - 1)
+        dx = x_val - self.x[i]
+        if self.a.ndim > 1:
+            dx = dx[..., None]
+        return x_val, i, dx
+
+    def _ecart_fin(self, x_val):
+        """Écart x - x_n (diffusé sur les colonnes)."""
+        ecart = x_val - self.x[-1]
+        return ecart[..., None] if self.a.ndim > 1 else ecart
+
+    def _masques(self, x_val):
+        """Masques des points extrapolés à gauche et à droite."""
+        gauche = x_val < self.x[0]
+        droite = x_val > self.x[-1]
+        if self.a.ndim > 1:
+            gauche, droite = gauche[..., None], droite[..., None]
+        return gauche, droite
+
+    def __call__(self, x_val):
+        """Évalue la spline en un point ou un tableau de points."""
+        x_val, i, dx = self._localiser(x_val)
+        valeurs = self.a[i] + dx * (self.b[i] + dx * (self.c[i] + dx * self.d[i]))
+
+        # Prolongement par les tangentes aux extrémités
+        gauche, droite = self._masques(x_val)
+        valeurs = np.where(gauche, self.a[0] + self.b[0] * dx, valeurs)
+        valeurs = np.where(
+            droite, self._y_fin + self._pente_fin * self._ecart_fin(x_val), valeurs
+        )
+        return valeurs[()]  # Scalaire NumPy pour une entrée scalaire
+
+    def derivee(self, x_val, ordre=1):
+        """
+        Dérivée d'ordre 1, 2 ou 3 de la spline.
+
+        Hors des données, la dérivée est celle du prolongement linéaire.
+        """
+        x_val, i, dx = self._localiser(x_val)
+        gauche, droite = self._masques(x_val)
+        if ordre == 1:
+            valeurs = self.b[i] + dx * (2 * self.c[i] + 3 * self.d[i] * dx)
+            exterieur = np.where(droite, self._pente_fin, self.b[0])
+        elif ordre == 2:
+            valeurs = 2 * self.c[i] + 6 * self.d[i] * dx
+            exterieur = 0.0
+        elif ordre == 3:
+            valeurs = 6 * self.d[i] + 0 * dx
+            exterieur = 0.0
+        else:
+            raise ValueError("L'ordre de dérivation doit valoir 1, 2 ou 3")
+
+        return np.where(gauche | droite, exterieur, valeurs)[()]
+
+    def primitive(self, x_val):
+        """Primitive F(x) = ∫ de x_0 à x de la spline (prolongement linéaire inclus)."""
+        x_val, i, dx = self._localiser(x_val)
+        valeurs = self._cumul[i] + dx * (
+            self.a[i]
+            + dx * (self.b[i] / 2 + dx * (self.c[i] / 3 + dx * self.d[i] / 4))
+        )
+
+        gauche, droite = self._masques(x_val)
+        # À gauche : ∫ de x_0 à x de a_0 + b_0 (u - x_0)
+        valeurs = np.where(gauche, dx * (self.a[0] + self.b[0] * dx / 2), valeurs)
+        # À droite : ∫ de x_n à x de y_n + s'(x_n) (u - x_n)
+        ecart = self._ecart_fin(x_val)
+        valeurs = np.where(
+            droite,
+            self._cumul[-1] + ecart * (self._y_fin + self._pente_fin * ecart / 2),
+            valeurs,
+        )
+        return valeurs[()]
+
+    def integrale(self, borne_inf, borne_sup):
+        """Intégrale de la spline entre deux bornes (scalaires ou tableaux)."""
+        return self.primitive(borne_sup) - self.primitive(borne_inf)
+
+
 # Cette classe fournit plusieurs méthodes d'interpolation et d'extrapolation 
 # basées sur un DataFrame contenant une série de données (x, y).
 
@@ -27,7 +178,9 @@ class Interpolation:
     """
     Classe pour effectuer des interpolations sur des données contenues dans un DataFrame.
     df : Le DataFrame contenant les données.
-    col : Le nom de la colonne contenant les valeurs y.
+    col : Le nom de la colonne contenant les valeurs y, ou une liste de
+          colonnes (par exemple S, I, R, D) traitées en un seul appel : les
+          résultats ont alors une dernière dimension par colonne.
 
     """
 
@@ -36,112 +189,101 @@ class Interpolation:
         self.col = col
         self.x = self.df.index.to_numpy()
         self.y = self.df[col].to_numpy()
+        # Spline et polynômes calculés à la première utilisation puis réutilisés
+        self._spline = None
+        self._polynomes = {}
 
-    def spline_cubique_naturelle(self, x_val=None):
-        x_data = self.x
-        y = self.y
-        n = len(x_data) - 1
-
-        if n < 1:
-            raise ValueError("Au moins 2 points sont nécessaires pour l'interpolation.")
+    def spline_cubique(self):
+        """Renvoie la spline cubique naturelle des données (calculée une seule fois)."""
+        if self._spline is None:
+            self._spline = SplineCubique(self.x, self.y)
+        return self._spline
 
-        # Étape 1 : Calcul des pas h et des valeurs alpha
-        h = [x_data[i + 1] - x_data[i] for i in range(n)]
-        alpha = [0.0] * (n + 1)
-        for i in range(1, n):
-            alpha[i] = (3 / h[i]) * (y[i + 1] - y[i]) - (3 / h[i - 1]) * (
-                y[i] - y[i - 1]
-            )
-
-        # Étape 2 : Résolution du système tridiagonal
-        l = [1.0] + [0.0] * n
-        mu = [0.0] * (n + 1)
-        z = [0.0] * (n + 1)
-
-        for i in range(1, n):
-            l[i] = 2 * (x_data[i + 1] - x_data[i - 1]) - h[i - 1] * mu[i - 1]
-            mu[i] = h[i] / l[i]
-            z[i] = (alpha[i] - h[i - 1] * z[i - 1]) / l[i]
-
-        l[n] = 1.0
-        z[n] = 0.0
-
-        # Étape 3 : Calcul des coefficients a, b, c, d
-        c = [0.0] * (n + 1)
-        b = [0.0] * n
-        d = [0.0] * n
-        a = y[:-1]
-
-        for j in range(n - 1, -1, -1):
-            c[j] = z[j] - mu[j] * c[j + 1]
-            b[j] = (y[j + 1] - y[j]) / h[j] - h[j] * (2 * c[j] + c[j + 1]) / 3
-            d[j] = (c[j + 1] - c[j]) / (3 * h[j])
-
-        # Fonction d'évaluation du spline sur l'intervalle correspondant
-        def evaluer_spline(x_eval):
-            for i in range(n):
-                if x_data[i] <= x_eval <= x_data[i + 1]:
-                    dx = x_eval - x_data[i]
-                    return a[i] + b[i] * dx + c[i] * dx**2 + d[i] * dx**3
-            if x_eval < x_data[0]:
-                i = 0
-                dx = x_eval - x_data[i]
-                return a[i] + b[i] * dx
-            else:
-                i = n - 1
-                dx = x_eval - x_data[i]
-                return a[i] + b[i] * dx
+    def spline_cubique_naturelle(self, x_val=None):
+        """
+        Évalue la spline cubique naturelle en x_val (scalaire ou tableau),
+        ou renvoie ses coefficients si x_val n'est pas fourni.
+        """
+        spline = self.spline_cubique()
 
         if x_val is not None:
-            return evaluer_spline(x_val)
+            return spline(x_val)
 
         return {
-            "a": a,
-            "b": b,
-            "c": c[:-1],
-            "d": d,
-            "intervalles": list(zip(x_data[:-1], x_data[1:])),
+            "a": spline.a,
+            "b": spline.b,
+            "c": spline.c[:-1],
+            "d": spline.d,
+            "intervalles": list(zip(self.x[:-1], self.x[1:])),
         }
-    def ajustement_polynomiale_moindres_carres(self, degre=34, x_val=None):
 
-        x = self.x
-        y = self.y
-
-        # Normalisation des données pour la stabilité numérique
-        x_min, x_max = np.min(x), np.max(x)
-        y_min, y_max = np.min(y), np.max(y)
-
-        x_normalise = (x - x_min) / (x_max - x_min)
-        y_normalise = (y - y_min) / (y_max - y_min)
-
-        # Ajustement du polynôme sur les données normalisées
-        poly_normalise = Polynomial.fit(x_normalise, y_normalise, degre)
+    def _polynome(self, degre):
+        """
+        Ajuste (une seule fois par degré) le polynôme des moindres carrés sur
+        toutes les colonnes : une seule résolution partage la matrice de
+        Vandermonde entre les colonnes.
+        """
+        cle = (tuple(self.col) if isinstance(self.col, list) else self.col, degre)
+        if cle not in self._polynomes:
+            x = self.x
+            y = self.y
+
+            # Normalisation des données pour la stabilité numérique
+            x_min, x_max = np.min(x), np.max(x)
+            y_min, y_max = np.min(y, axis=0), np.max(y, axis=0)
+            # Colonne constante : pas de mise à l'échelle
+            y_echelle = np.where(y_max > y_min, y_max - y_min, 1.0)
+
+            x_normalise = (x - x_min) / (x_max - x_min)
+            y_normalise = (y - y_min) / y_echelle
+
+            # Ajustement du polynôme sur les données normalisées, exprimé comme
+            # Polynomial.fit dans la fenêtre [-1, 1]
+            domaine = polyutils.getdomain(x_normalise)
+            coefficients = P.polyfit(
+                polyutils.mapdomain(x_normalise, domaine, [-1, 1]), y_normalise, degre
+            )
+            self._polynomes[cle] = (
+                coefficients, domaine, x_min, x_max, y_min, y_echelle
+            )
+        return self._polynomes[cle]
 
-        if x_val is not None:
-            x_val_normalise = (x_val - x_min) / (x_max - x_min)
-            resultat_normalise = poly_normalise(x_val_normalise)
-            resultat = resultat_normalise * (y_max - y_min) + y_min
-            return resultat
+    def ajustement_polynomiale_moindres_carres(self, degre=34, x_val=None):
+        """
+        Évalue le polynôme des moindres carrés en x_val (scalaire ou tableau).
+
+        Le polynôme est mis en cache par (colonne, degré) : les appels suivants
+        ne font qu'une évaluation.
+        """
+        if x_val is None:
+            raise ValueError("Veuillez fournir une valeur x_val pour l'évaluation.")
+
+        coefficients, domaine, x_min, x_max, y_min, y_echelle = self._polynome(degre)
+        x_val_normalise = (np.asarray(x_val, dtype=float) - x_min) / (x_max - x_min)
+        resultat_normalise = P.polyval(
+            polyutils.mapdomain(x_val_normalise, domaine, [-1, 1]), coefficients
+        )
+        if coefficients.ndim > 1:
+            # polyval renvoie (colonnes, points) : on remet les points en premier
+            resultat_normalise = np.moveaxis(resultat_normalise, 0, -1)
+        resultat = resultat_normalise * y_echelle + y_min
+        return resultat[()]
 
-        raise ValueError("Veuillez fournir une valeur x_val pour l'évaluation.")
     def interpolation_lineaire_extrapolation(self, x_val):
+        """
+        Interpolation linéaire en x_val (scalaire ou tableau), avec extrapolation
+        par la pente du premier ou du dernier intervalle hors des données.
+        """
         x = self.x
         y = self.y
 
-        if x_val < x[0]:
-            # Extrapolation à gauche
-            slope = (y[1] - y[0]) / (x[1] - x[0])
-            return y[0] + slope * (x_val - x[0])
-        elif x_val > x[-1]:
-            # Extrapolation à droite
-            slope = (y[-1] - y[-2]) / (x[-1] - x[-2])
-            return y[-1] + slope * (x_val - x[-1])
-        else:
-            # Interpolation linéaire classique
-            for i in range(len(x) - 1):
-                if x[i] <= x_val <= x[i + 1]:
-                    slope = (y[i + 1] - y[i]) / (x[i + 1] - x[i])
-                    return y[i] + slope * (x_val - x[i])
-
-
-
+        # Recherche dichotomique de l'intervalle [x_i, x_i+1] contenant x_val ;
+        # hors des données, le premier ou le dernier intervalle est prolongé
+        x_val = np.asarray(x_val, dtype=float)
+        i = np.clip(np.searchsorted(x, x_val, side="right") - 1, 0, len(x) - 2)
+        dx = x_val - x[i]
+        h = x[i + 1] - x[i]
+        if y.ndim > 1:
+            dx, h = dx[..., None], h[..., None]
+        slope = (y[i + 1] - y[i]) / h
+        return (y[i] + slope * dx)[()]
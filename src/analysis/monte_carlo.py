@@ -0,0 +1,213 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.equations_differentielles.ensemble import SimulateurSIRDEnsemble
+from src.analysis.quantiles import HistogrammeQuantiles
+
+SORTIES = ("I", "D", "occupation")
+
+
+def prevision_monte_carlo(
+    df: pd.DataFrame | dict,
+    distributions: dict,
+    t_max: int = 180,
+    n_trajectoires: int = 100_000,
+    niveaux: tuple[float, ...] = (0.05, 0.25, 0.5, 0.75, 0.95),
+    lits_par_mille: float = None,
+    taux_hospitalisation: float = 1.0,
+    workers: int = None,
+    seed: int = None,
+    taille_lot: int = 5000,
+    dt: float = 1.0,
+    methode: str = "rk4",
+) -> dict:
+    """
+    Prévision Monte-Carlo : bandes de quantiles journalières de I, D et de
+    l'occupation des lits.
+
+    Chaque trajectoire tire (r, a, b, I0) selon `distributions` et part de
+    la dernière ligne des données (S0 = S + I - I0, R et D observés). Les
+    trajectoires sont simulées par lots avec SimulateurSIRDEnsemble ; chaque
+    lot est versé dans un HistogrammeQuantiles (une variable par jour et par
+    sortie) puis libéré : la mémoire ne dépend que de taille_lot et de t_max,
+    pas du nombre de trajectoires.
+
+    L'occupation est la proportion de lits nécessaires rapportée à la
+    capacité : taux_hospitalisation * I / (lits_par_mille / 1000). La
+    probabilité de saturation (occupation > 1) est comptée exactement.
+
+    Les lots sont répartis sur un pool de processus. Chaque lot a sa graine,
+    issue de SeedSequence(seed).spawn : le résultat ne dépend pas du nombre
+    de processus.
+
+    Spécifications acceptées dans `distributions` (clés r, a, b, I0) :
+        - un nombre : valeur constante
+        - ("uniforme", min, max)
+        - ("normale", moyenne, ecart_type)
+        - ("lognormale", mu, sigma) : paramètres du logarithme
+        - ("triangulaire", min, mode, max)
+        - ("empirique", valeurs) : tirage avec remise (ex. réplicats bootstrap)
+    Une clé absente vaut l'observation (I0) ou est une erreur (r, a, b). Les
+    tirages sont tronqués au domaine valide : r dans ]0, 1], a, b >= 0 et
+    0 <= I0 <= S + I.
+
+    Args:
+        df: Données SIRD (colonnes 'S', 'I', 'R', 'D', et éventuellement
+            'lits_par_mille') ou dictionnaire des valeurs initiales
+        distributions: Spécifications des paramètres (voir ci-dessus)
+        t_max: Horizon de prévision (jours)
+        n_trajectoires: Nombre de trajectoires simulées
+        niveaux: Niveaux des quantiles renvoyés
+        lits_par_mille: Capacité hospitalière (par défaut celle des données)
+        taux_hospitalisation: Proportion des infectés occupant un lit
+        workers: Nombre de processus (None ou 1 : exécution séquentielle)
+        seed: Graine de la prévision
+        taille_lot: Nombre de trajectoires simulées ensemble
+        dt: Pas de temps (1/dt entier : les sorties restent journalières)
+        methode: 'euler' ou 'rk4'
+
+    Returns:
+        Dictionnaire avec:
+            - I, D, occupation: DataFrame (jours, niveaux) des quantiles
+            - moyenne: DataFrame (jours, sorties) des moyennes exactes
+            - probabilite_saturation: Series de P(occupation > 1) par jour
+            - n_trajectoires: Nombre de trajectoires simulées
+    """
+    inconnues = set(distributions) - {"r", "a", "b", "I0"}
+    if inconnues:
+        raise ValueError(f"Paramètres inconnus: {sorted(inconnues)}")
+    manquants = {"r", "a", "b"} - set(distributions)
+    if manquants:
+        raise ValueError(f"Distributions manquantes: {sorted(manquants)}")
+
+    pas = round(1 / dt)
+    if pas < 1 or not np.isclose(pas * dt, 1):
+        raise ValueError(f"1/dt doit être entier: dt={dt}")
+
+    initiales = {
+        col: float(np.asarray(df[col], dtype=float)[-1]) for col in ("S", "I", "R", "D")
+    }
+    if lits_par_mille is None:
+        if "lits_par_mille" not in df:
+            raise ValueError("lits_par_mille absent des données")
+        lits_par_mille = float(np.asarray(df["lits_par_mille"], dtype=float)[-1])
+    capacite = lits_par_mille / 1000 / taux_hospitalisation
+
+    n_lots = -(-n_trajectoires // taille_lot)
+    graines = np.random.SeedSequence(seed).spawn(n_lots)
+    tailles = [
+        min(taille_lot, n_trajectoires - k * taille_lot) for k in range(n_lots)
+    ]
+    lots = list(zip(graines, tailles))
+
+    calculer = partial(
+        _simuler_lots,
+        distributions,
+        initiales,
+        capacite=capacite,
+        t_max=t_max,
+        dt=dt,
+        methode=methode,
+    )
+    if workers is None or workers <= 1:
+        histogramme, saturations = calculer(lots)
+    else:
+        # Une tâche par processus : un accumulateur par processus, fusionnés
+        groupes = [lots[k::workers] for k in range(workers) if lots[k::workers]]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partiels = list(executor.map(calculer, groupes))
+        histogramme, saturations = partiels[0]
+        for partiel, compte in partiels[1:]:
+            histogramme.fusionner(partiel)
+            saturations += compte
+
+    # Variables de l'accumulateur ordonnées (jour, sortie)
+    jours = pd.Index(np.arange(t_max + 1), name="Jour")
+    quantiles = histogramme.quantiles(niveaux).reshape(len(jours), len(SORTIES), -1)
+    moyenne = histogramme.moyenne.reshape(len(jours), len(SORTIES))
+
+    resultats = {
+        sortie: pd.DataFrame(quantiles[:, j], index=jours, columns=list(niveaux))
+        for j, sortie in enumerate(SORTIES)
+    }
+    resultats["moyenne"] = pd.DataFrame(moyenne, index=jours, columns=list(SORTIES))
+    resultats["probabilite_saturation"] = pd.Series(
+        saturations / histogramme.n, index=jours, name="probabilite_saturation"
+    )
+    resultats["n_trajectoires"] = histogramme.n
+    return resultats
+
+
+def _tirer(
+    rng: np.random.Generator, specification: float | tuple, n: int
+) -> np.ndarray:
+    """Tire n valeurs selon une spécification de distribution."""
+    if np.isscalar(specification):
+        return np.full(n, float(specification))
+
+    loi, *arguments = specification
+    if loi == "uniforme":
+        return rng.uniform(*arguments, size=n)
+    if loi == "normale":
+        return rng.normal(*arguments, size=n)
+    if loi == "lognormale":
+        return rng.lognormal(*arguments, size=n)
+    if loi == "triangulaire":
+        return rng.triangular(*arguments, size=n)
+    if loi == "empirique":
+        return rng.choice(np.asarray(arguments[0], dtype=float), size=n)
+    raise ValueError(f"Distribution {loi} non supportée")
+
+
+def _simuler_lots(
+    distributions: dict,
+    initiales: dict[str, float],
+    lots: list[tuple[np.random.SeedSequence, int]],
+    capacite: float,
+    t_max: int,
+    dt: float,
+    methode: str,
+) -> tuple[HistogrammeQuantiles, np.ndarray]:
+    """Simule et accumule les trajectoires d'une liste de lots (un processus)."""
+    pas = round(1 / dt)
+    # Proportions et occupations : de 1e-12 à 1e3 (débordements comptés)
+    histogramme = HistogrammeQuantiles(
+        n_variables=(t_max + 1) * len(SORTIES),
+        minimum=1e-12,
+        maximum=1e3,
+        classes_par_decade=50,
+    )
+    saturations = np.zeros(t_max + 1, dtype=np.int64)
+
+    for graine, taille in lots:
+        rng = np.random.default_rng(graine)
+        # Ordre de tirage fixe : r, a, b puis I0
+        r = np.clip(_tirer(rng, distributions["r"], taille), 1e-9, 1.0)
+        a = np.maximum(_tirer(rng, distributions["a"], taille), 0.0)
+        b = np.maximum(_tirer(rng, distributions["b"], taille), 0.0)
+
+        disponibles = initiales["S"] + initiales["I"]
+        I0 = _tirer(rng, distributions.get("I0", initiales["I"]), taille)
+        I0 = np.clip(I0, 0.0, disponibles)
+
+        ensemble = SimulateurSIRDEnsemble({"r": r, "a": a, "b": b})
+        _, y = ensemble.integrer(
+            {"S": disponibles - I0, "I": I0, "R": initiales["R"], "D": initiales["D"]},
+            t_max,
+            dt,
+            methode,
+        )
+
+        # Sorties journalières (taille, jours, 3), accumulées jour par jour
+        y = y[:, ::pas]
+        sorties = np.empty(y.shape[:2] + (len(SORTIES),))
+        sorties[:, :, 0] = y[:, :, 1]
+        sorties[:, :, 1] = y[:, :, 3]
+        np.divide(y[:, :, 1], capacite, out=sorties[:, :, 2])
+        histogramme.ajouter(sorties.reshape(taille, -1))
+        saturations += (sorties[:, :, 2] > 1).sum(axis=0)
+
+    return histogramme, saturations
@@ -0,0 +1,126 @@
+import numpy as np
+
+
+class HistogrammeQuantiles:
+    """
+    Accumulateur de quantiles en flux, à mémoire bornée et fusionnable.
+
+    Les valeurs sont comptées dans des classes logarithmiques de |x| (une
+    série pour les valeurs positives, une pour les négatives, une classe
+    centrale pour |x| < minimum et deux classes de débordement). La mémoire
+    ne dépend pas du nombre de valeurs ajoutées et deux accumulateurs de
+    mêmes paramètres se fusionnent par simple addition des comptes : chaque
+    processus accumule ses réplicats, le processus principal fusionne.
+
+    L'erreur relative d'un quantile est bornée par la largeur d'une classe
+    (10^(1/classes_par_decade) - 1, soit 1,2 % pour 200 classes par décade).
+
+    Exemple d'utilisation:
+    >>> histogramme = HistogrammeQuantiles(n_variables=3)
+    >>> histogramme.ajouter(echantillons)  # tableau (m, 3)
+    >>> histogramme.quantiles([0.025, 0.5, 0.975])  # tableau (3, 3)
+    """
+
+    def __init__(
+        self,
+        n_variables: int = 1,
+        minimum: float = 1e-8,
+        maximum: float = 1e4,
+        classes_par_decade: int = 200,
+    ):
+        """
+        Args:
+            n_variables: Nombre de variables accumulées en parallèle
+            minimum: Plus petite valeur absolue résolue
+            maximum: Plus grande valeur absolue résolue
+            classes_par_decade: Nombre de classes par puissance de 10
+        """
+        if not 0 < minimum < maximum:
+            raise ValueError("Il faut 0 < minimum < maximum")
+        self.parametres = (n_variables, minimum, maximum, classes_par_decade)
+        self.n_variables = n_variables
+
+        n_decades = np.log10(maximum / minimum)
+        n_classes = int(np.ceil(n_decades * classes_par_decade))
+        positives = np.geomspace(minimum, maximum, n_classes + 1)
+        # Bornes ordonnées : classes négatives, classe centrale, positives
+        self.bornes = np.concatenate([-positives[::-1], positives])
+        # Comptes : débordement bas, 2 n_classes + 1 classes, débordement haut
+        self.comptes = np.zeros((n_variables, len(self.bornes) + 1), dtype=np.int64)
+
+        self.n = 0
+        self.somme = np.zeros(n_variables)
+        self.min = np.full(n_variables, np.inf)
+        self.max = np.full(n_variables, -np.inf)
+
+    def ajouter(self, valeurs: np.ndarray) -> None:
+        """
+        Ajoute un lot de valeurs (les NaN sont ignorés).
+
+        Args:
+            valeurs: Tableau (m,) pour une variable, (m, n_variables) sinon
+        """
+        valeurs = np.asarray(valeurs, dtype=float).reshape(-1, self.n_variables)
+        manquantes = np.isnan(valeurs)
+
+        # Classe de chaque valeur, décalée par variable : un seul comptage
+        n_classes = self.comptes.shape[1]
+        indices = np.searchsorted(self.bornes, valeurs, side="right")
+        indices += np.arange(self.n_variables) * n_classes
+        self.comptes += np.bincount(
+            indices[~manquantes], minlength=self.comptes.size
+        ).reshape(self.comptes.shape)
+
+        self.somme += np.where(manquantes, 0.0, valeurs).sum(axis=0)
+        minima = np.where(manquantes, np.inf, valeurs).min(axis=0)
+        maxima = np.where(manquantes, -np.inf, valeurs).max(axis=0)
+        np.minimum(self.min, minima, out=self.min)
+        np.maximum(self.max, maxima, out=self.max)
+        self.n += len(valeurs)
+
+    def fusionner(self, autre: "HistogrammeQuantiles") -> "HistogrammeQuantiles":
+        """Ajoute les comptes d'un autre accumulateur de mêmes paramètres."""
+        if autre.parametres != self.parametres:
+            raise ValueError("Accumulateurs de paramètres différents")
+        self.comptes += autre.comptes
+        self.n += autre.n
+        self.somme += autre.somme
+        np.minimum(self.min, autre.min, out=self.min)
+        np.maximum(self.max, autre.max, out=self.max)
+        return self
+
+    @property
+    def moyenne(self) -> np.ndarray:
+        """Moyenne exacte de chaque variable."""
+        with np.errstate(invalid="ignore"):
+            return self.somme / self.comptes.sum(axis=1)
+
+    def quantiles(self, q: list[float] | np.ndarray) -> np.ndarray:
+        """
+        Quantiles approchés par interpolation linéaire dans les classes.
+
+        Args:
+            q: Niveaux dans [0, 1]
+
+        Returns:
+            Tableau (n_variables, len(q)) ; NaN pour une variable sans valeur
+        """
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        resultats = np.full((self.n_variables, len(q)), np.nan)
+        for j in range(self.n_variables):
+            cumul = np.cumsum(self.comptes[j])
+            total = cumul[-1]
+            if total == 0:
+                continue
+            # Bornes de chaque classe ; débordements bornés par min et max
+            gauche = np.concatenate([[self.min[j]], self.bornes])
+            droite = np.concatenate([self.bornes, [self.max[j]]])
+            cible = q * total
+            classe = np.searchsorted(cumul, cible, side="left")
+            classe = np.minimum(classe, len(cumul) - 1)
+            avant = np.where(classe > 0, cumul[classe - 1], 0)
+            fraction = (cible - avant) / np.maximum(self.comptes[j][classe], 1)
+            valeurs = gauche[classe] + fraction * (droite[classe] - gauche[classe])
+            # Les bornes de classe sont ramenées dans l'étendue observée
+            resultats[j] = np.clip(valeurs, self.min[j], self.max[j])
+        return resultats
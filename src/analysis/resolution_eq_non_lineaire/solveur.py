@@ -9,6 +9,7 @@ class ResolutionSIRD:
 
         Args:
             df: DataFrame avec colonnes 'S', 'I', 'R', 'D' indexé par 'Jour'
+                (ou SIRDSeries, utilisée sans copie)
             parametres: Dictionnaire avec clés 'r', 'a', 'b'
         """
         columns_necessaires = ['S', 'I', 'R', 'D']
@@ -20,9 +21,10 @@ class ResolutionSIRD:
         self.r = parametres["r"]
         self.a = parametres["a"]
         self.b = parametres["b"]
-        self.Imax = df["lits_par_mille"].iloc[0] / 1000
+        self.Imax = np.asarray(df["lits_par_mille"])[0] / 1000
         self._valider_parametres()
-        self.df = df.copy()
+        # Une série binaire est en lecture seule : inutile de la copier
+        self.df = df.copy() if isinstance(df, pd.DataFrame) else df
 
     def _valider_parametres(self):
         """Validation des contraintes sur les paramètres."""
@@ -38,9 +40,9 @@ class ResolutionSIRD:
         """
         Trouve l'indice du pic épidémique en détectant le changement de signe de dI/dt.
         """
-        t = self.df.index.values
-        S = self.df["S"].values
-        I = self.df["I"].values
+        t = np.asarray(self.df.index)
+        S = np.asarray(self.df["S"])
+        I = np.asarray(self.df["I"])
         dI_dt = self.r * I * S - (self.a + self.b) * I
         changements_signe = np.where(np.diff(np.sign(dI_dt)) < 0)[0]
         if len(changements_signe) == 0:
@@ -52,15 +54,16 @@ class ResolutionSIRD:
         pic_index = self.index_pic_epidimique()
         if pic_index is None:
             return None
-        return 1 - self.df.loc[pic_index, 'S']
+        jours = np.asarray(self.df.index)
+        return 1 - np.asarray(self.df["S"])[jours == pic_index][0]
 
     def temps_critique(self):
         """Trouve le premier indice où I dépasse la capacité hospitalière Imax."""
-        I = self.df["I"].values
-        for i, val in enumerate(I):
-            if val > self.Imax:
-                return i+1
-        return None  # Aucun dépassement
+        I = np.asarray(self.df["I"])
+        depassements = np.flatnonzero(I > self.Imax)
+        if len(depassements) == 0:
+            return None  # Aucun dépassement
+        return int(depassements[0]) + 1
         #nombre de reproduction
     def reproduction(self):
         r=self.r
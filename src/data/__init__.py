@@ -1,9 +1,13 @@
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import pandas as pd
 
+from .cache import ProcessedCache
 from .cleaner import DataCleaner
 from .fetcher import DataFetcher
+from .series import SIRDSeries
 from .validator import DataValidator
 
 
@@ -17,19 +21,38 @@ class DataPipeline:
     3. Validation de qualité (DataValidator)
     4. Sortie des données prêtes pour l'analyse
 
+    Les données nettoyées sont mises en cache (data/processed/<pays>/cache) :
+    une exécution répétée sans changement du fichier brut ni des paramètres
+    ne refait pas le nettoyage, et un fichier brut allongé de quelques jours
+    ne fait recalculer que la fin de série. La validation porte sur les
+    données en mémoire ; les CSV sont écrits en arrière-plan
+    (pipeline.wait() attend la fin de l'écriture et relève son erreur).
+
     Exemple:
     >>> pipeline = DataPipeline(country="brazil")
     >>> data = pipeline.run(start_date="2020-03-01", end_date="2022-01-01")
     """
 
-    def __init__(self, country: str = "France"):
+    # Arguments de run transmis par run_many à _process
+    RUN_MANY_OPTIONS = (
+        "start_date",
+        "end_date",
+        "tolerance",
+        "smoothing",
+        "window_size",
+    )
+
+    def __init__(self, country: str = "France", streaming: bool = False):
         """
         Initialise le pipeline pour un pays spécifique.
 
         Args:
             country: Nom du pays ou code ISO3 (validation automatique)
+            streaming: Si True, le CSV brut est lu par blocs sans cache
+                colonnaire (mémoire bornée, adapté aux petits conteneurs)
         """
         self.country = country.strip().lower()
+        self.streaming = streaming
         self._init_paths()
 
     def _init_paths(self):
@@ -52,6 +75,8 @@ class DataPipeline:
         tolerance: float = 0.01,
         smoothing: bool = True,
         window_size: int = 7,
+        binary: bool = False,
+        refresh: bool = False,
     ) -> pd.DataFrame:
         """
         Exécute le pipeline complet de traitement des données.
@@ -60,6 +85,9 @@ class DataPipeline:
             start_date: Date de début au format YYYY-MM-DD
             end_date: Date de fin au format YYYY-MM-DD
             tolerance: Tolérance pour la validation des données
+            binary: Écrit aussi les séries au format binaire (voir open_series)
+            refresh: Revalide le fichier brut auprès du serveur (requête
+                conditionnelle, seul un fichier modifié est retéléchargé)
 
         Returns:
             DataFrame d'entraînement validé
@@ -68,28 +96,74 @@ class DataPipeline:
             RuntimeError: Si une étape du pipeline échoue
         """
         try:
-            # Étape 1: Acquisition des données
-            raw_data = DataFetcher(self.raw_path).fetch_data()
-
-            # Étape 2: Nettoyage et transformation
+            fetcher = DataFetcher(self.raw_path, use_cache=not self.streaming)
             cleaner = DataCleaner(
                 processed_path=self.processed_path,
                 country=self.country,
                 smoothing=smoothing,
                 window_size=window_size,
             )
-            cleaned_data = cleaner.clean_and_save(
-                raw_data, start_date=start_date, end_date=end_date
-            )
-            self.population = cleaner.population
 
-            # Étape 3: Validation de qualité
-            validator = DataValidator(
+            # Cache des données nettoyées : fichier brut + paramètres
+            cache = ProcessedCache(self.processed_path / "cache")
+            if refresh:
+                fetcher.refresh()
+            fingerprint = fetcher.source_fingerprint()
+            params = {
+                "country": self.country,
+                "start_date": start_date,
+                "end_date": end_date,
+                "tolerance": tolerance,
+                "smoothing": smoothing,
+                "window_size": window_size,
+            }
+            key = cache.key(fingerprint, params)
+            entry = cache.get(fingerprint, params)
+
+            if entry is None:
+                # Étape 1: Acquisition des données
+                raw_data = fetcher.fetch_data(
+                    columns=DataCleaner.RAW_COLUMNS, countries=[self.country]
+                )
+
+                # Étape 2: Nettoyage (incrémental si un résultat antérieur existe)
+                cleaned = cleaner.clean_and_save(
+                    raw_data,
+                    save=False,
+                    start_date=start_date,
+                    end_date=end_date,
+                    previous=cache.latest(params),
+                )
+                entry = {
+                    "raw": cleaner.raw_data,
+                    "sird": cleaner.sird_data,
+                    "population": cleaner.population,
+                    **cleaned,
+                }
+                cache.put(fingerprint, params, entry)
+            self.population = entry["population"]
+
+            # Étape 3: Validation en mémoire ; les CSV et les métadonnées ne
+            # sont réécrits (en arrière-plan) que s'ils ne correspondent pas
+            # déjà à cette entrée
+            self.wait()
+            persist = cache.current() != key
+            if persist:
+                # Les CSV ne désignent une entrée qu'une fois réécrits
+                cache.set_current(None)
+            self.validator = DataValidator(
                 country=self.country,
                 processed_path=self.processed_path,
                 tolerance=tolerance,
             )
-            validation_report = validator.validate()
+            validation_report = self.validator.validate(
+                {"train": entry["train"], "test": entry["test"]},
+                persist=persist,
+                asynchronous=True,
+                on_persisted=lambda: cache.set_current(key),
+            )
+            if binary:
+                self._write_series(entry, key)
 
             return validation_report[split]
 
@@ -97,3 +171,157 @@ class DataPipeline:
             raise RuntimeError(
                 f"Échec du pipeline pour {self.country}: {str(e)}"
             ) from e
+
+    def open_series(self, split: str = "train") -> SIRDSeries:
+        """
+        Ouvre une série binaire écrite par run(binary=True), sans la lire.
+
+        Exemple:
+        >>> serie = DataPipeline("france").open_series("train")
+        >>> SimulateurSIRD(parametres).resoudre(serie, t_max=200)
+        """
+        return SIRDSeries(self.processed_path / f"sird_{self.country}_{split}")
+
+    def _write_series(self, entry: dict, key: str):
+        """Écrit les séries binaires si elles ne proviennent pas déjà de l'entrée."""
+        for split in ("train", "test"):
+            base_path = self.processed_path / f"sird_{self.country}_{split}"
+            header_path = base_path.with_suffix(".json")
+            if header_path.exists():
+                with open(header_path) as f:
+                    if json.load(f).get("entry") == key:
+                        continue
+            SIRDSeries.write(entry[split], base_path, entry["population"], entry=key)
+
+    def wait(self):
+        """
+        Attend la fin de l'écriture des CSV lancée par le dernier run.
+
+        Raises:
+            Exception: L'erreur levée par l'écriture, le cas échéant
+        """
+        validator = getattr(self, "validator", None)
+        if validator is not None:
+            validator.wait()
+
+    def _process(
+        self,
+        raw_data: pd.DataFrame,
+        start_date: str = None,
+        end_date: str = None,
+        tolerance: float = 0.01,
+        smoothing: bool = True,
+        window_size: int = 7,
+    ) -> dict:
+        """Nettoie et valide les données brutes du pays (étapes 2 et 3)."""
+        # Les CSV réécrits ne correspondent plus à une entrée du cache
+        ProcessedCache(self.processed_path / "cache").set_current(None)
+
+        # Étape 2: Nettoyage et transformation
+        cleaner = DataCleaner(
+            processed_path=self.processed_path,
+            country=self.country,
+            smoothing=smoothing,
+            window_size=window_size,
+        )
+        cleaned = cleaner.clean_and_save(
+            raw_data, save=False, start_date=start_date, end_date=end_date
+        )
+        self.population = cleaner.population
+
+        # Étape 3: Validation en mémoire, puis écriture des CSV
+        validator = DataValidator(
+            country=self.country,
+            processed_path=self.processed_path,
+            tolerance=tolerance,
+        )
+        return validator.validate(cleaned)
+
+    @classmethod
+    def run_many(
+        cls, countries: list[str], workers: int = None, **options
+    ) -> dict[str, dict]:
+        """
+        Exécute le pipeline pour plusieurs pays en parallèle.
+
+        Le dataset brut n'est lu qu'une fois ; chaque processus reçoit
+        uniquement les lignes de son pays. L'échec d'un pays n'interrompt pas
+        le lot.
+
+        Args:
+            countries: Noms de pays ou codes ISO3
+            workers: Nombre de processus (None ou 1 : exécution séquentielle)
+            **options: Arguments de run (start_date, end_date, tolerance,
+                smoothing, window_size)
+
+        Returns:
+            {"results": {pays: rapport de validation},
+             "failures": {pays: message d'erreur}}
+            Un pays demandé sous plusieurs noms (ex. "France" et "FRA") n'est
+            traité qu'une fois ; son rapport figure sous chacun des noms.
+
+        Raises:
+            ValueError: Si une option n'est pas acceptée par le traitement
+
+        Exemple:
+        >>> batch = DataPipeline.run_many(["France", "Italy", "MAR"], workers=4)
+        >>> batch["results"]["france"]["train"]
+        """
+        # Options vérifiées avant la lecture : une option invalide ferait
+        # échouer chaque pays dans _process
+        unsupported = sorted(set(options) - set(cls.RUN_MANY_OPTIONS))
+        if unsupported:
+            raise ValueError(f"Options non supportées par run_many: {unsupported}")
+
+        raw_path = Path(__file__).resolve().parents[2] / "data/raw"
+        raw_data = DataFetcher(raw_path).fetch_data(columns=DataCleaner.RAW_COLUMNS)
+
+        # Lignes de chaque pays, par nom ou code ISO3
+        rows = raw_data.groupby(raw_data["location"].str.lower()).indices
+        rows.update(raw_data.groupby(raw_data["iso_code"].str.lower()).indices)
+
+        results, failures = {}, {}
+        tasks = {}
+        requested = {}  # Nom OWID -> noms demandés
+        for country in countries:
+            key = country.strip().lower()
+            if key not in rows:
+                failures[key] = f"Pays '{country}' non trouvé dans les données brutes"
+                continue
+            # Le pays est traité sous son nom OWID (même si demandé en ISO3),
+            # une seule fois : deux tâches écriraient le même répertoire
+            country_data = raw_data.iloc[rows[key]]
+            name = country_data["location"].iat[0]
+            tasks.setdefault(name, country_data)
+            requested.setdefault(name, []).append(key)
+
+        outcomes = {}
+        if workers is None or workers <= 1:
+            for name, country_data in tasks.items():
+                try:
+                    outcomes[name] = (True, _run_country(name, country_data, options))
+                except Exception as e:
+                    outcomes[name] = (False, str(e))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_run_country, name, country_data, options): name
+                    for name, country_data in tasks.items()
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        outcomes[name] = (True, future.result())
+                    except Exception as e:
+                        outcomes[name] = (False, str(e))
+
+        for name, (success, outcome) in outcomes.items():
+            for key in requested[name]:
+                (results if success else failures)[key] = outcome
+
+        return {"results": results, "failures": failures}
+
+
+def _run_country(country: str, raw_data: pd.DataFrame, options: dict) -> dict:
+    """Traitement d'un pays dans un processus de run_many."""
+    return DataPipeline(country)._process(raw_data, **options)
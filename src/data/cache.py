@@ -0,0 +1,106 @@
+import hashlib
+import json
+import pickle
+from pathlib import Path
+
+
+class ProcessedCache:
+    """
+    Cache des données nettoyées, indexé par l'empreinte du fichier brut.
+
+    Chaque entrée est identifiée par l'empreinte du fichier brut (taille et
+    date de modification, voir DataFetcher.source_fingerprint) et les
+    paramètres de nettoyage. Le contenu du fichier n'est pas relu : une
+    modification qui conserve la taille et la date de modification n'est pas
+    détectée. Un pointeur par jeu de paramètres désigne la
+    dernière entrée calculée : lorsque le fichier brut change, elle sert de
+    point de départ au recalcul incrémental de la fin de série.
+
+    Structure:
+    - <clé>.pkl : données d'une entrée (empreinte brute + paramètres)
+    - <paramètres>.json : pointeur vers la dernière entrée des paramètres
+    - current.json : entrée correspondant aux CSV présents dans le répertoire
+    """
+
+    def __init__(self, cache_path: Path):
+        """
+        Args:
+            cache_path: Répertoire du cache (créé si nécessaire)
+        """
+        self.cache_path = cache_path
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _digest(content: dict) -> str:
+        """Condensat SHA-256 d'un dictionnaire sérialisable en JSON."""
+        encoded = json.dumps(content, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()[:32]
+
+    def key(self, fingerprint: dict, params: dict) -> str:
+        """Clé d'une entrée : empreinte du fichier brut et paramètres."""
+        return self._digest({"source": fingerprint, "params": params})
+
+    def get(self, fingerprint: dict, params: dict) -> dict | None:
+        """Renvoie l'entrée exacte si elle existe, None sinon."""
+        return self._load(self.key(fingerprint, params))
+
+    def latest(self, params: dict) -> dict | None:
+        """Dernière entrée calculée avec ces paramètres, quelle que soit la source."""
+        pointer = self.cache_path / f"{self._digest(params)}.json"
+        if not pointer.exists():
+            return None
+        with open(pointer) as f:
+            return self._load(json.load(f)["entry"])
+
+    def put(self, fingerprint: dict, params: dict, entry: dict) -> str:
+        """
+        Enregistre une entrée et remplace la précédente des mêmes paramètres.
+
+        Returns:
+            Clé de l'entrée enregistrée
+        """
+        key = self.key(fingerprint, params)
+        tmp_path = self.cache_path / f"{key}.pkl.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(self.cache_path / f"{key}.pkl")
+
+        # Mise à jour du pointeur, suppression de l'entrée devenue obsolète
+        pointer = self.cache_path / f"{self._digest(params)}.json"
+        if pointer.exists():
+            with open(pointer) as f:
+                previous = json.load(f)["entry"]
+            if previous != key:
+                (self.cache_path / f"{previous}.pkl").unlink(missing_ok=True)
+        with open(pointer, "w") as f:
+            json.dump({"entry": key, "params": params}, f, default=str)
+
+        return key
+
+    def current(self) -> str | None:
+        """Clé de l'entrée dont les CSV sont actuellement sur disque."""
+        marker = self.cache_path / "current.json"
+        if not marker.exists():
+            return None
+        with open(marker) as f:
+            return json.load(f)["entry"]
+
+    def set_current(self, key: str | None):
+        """Enregistre (ou invalide avec None) l'entrée écrite en CSV."""
+        marker = self.cache_path / "current.json"
+        if key is None:
+            marker.unlink(missing_ok=True)
+        else:
+            with open(marker, "w") as f:
+                json.dump({"entry": key}, f)
+
+    def _load(self, key: str) -> dict | None:
+        path = self.cache_path / f"{key}.pkl"
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (pickle.UnpicklingError, EOFError):
+            # Entrée corrompue : recalcul complet
+            return None
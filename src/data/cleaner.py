@@ -9,6 +9,48 @@ class DataCleaner:
     avec gestion des valeurs manquantes et validation des entrées.
     """
 
+    # Colonnes du dataset OWID utilisées par le nettoyage
+    RAW_COLUMNS = [
+        "location",
+        "iso_code",
+        "date",
+        "population",
+        "total_cases",
+        "total_deaths",
+        "people_fully_vaccinated",
+        "hospital_beds_per_thousand",
+    ]
+
+    # Colonnes produites par le calcul SIRD
+    SIRD_COLUMNS = [
+        "date",
+        "S",
+        "I",
+        "R",
+        "D",
+        "S_abs",
+        "I_abs",
+        "R_abs",
+        "D_abs",
+        "V",
+        "V_abs",
+        "lits_par_mille",
+    ]
+
+    # Colonnes lissées par moyenne mobile
+    SMOOTHED_COLUMNS = [
+        "S",
+        "I",
+        "R",
+        "D",
+        "V",
+        "S_abs",
+        "I_abs",
+        "R_abs",
+        "D_abs",
+        "V_abs",
+    ]
+
     def __init__(
         self,
         processed_path: Path,
@@ -50,6 +92,7 @@ class DataCleaner:
         save: bool = True,
         start_date: str = "2020-01-01",
         end_date: str = "2023-12-31",
+        previous: dict = None,
     ) -> dict[str, pd.DataFrame]:
         """
         Pipeline complet de nettoyage.
@@ -67,9 +110,16 @@ class DataCleaner:
             save: Sauvegarde les résultats en CSV si True
             start_date: Date de début au format YYYY-MM-DD
             end_date: Date de fin au format YYYY-MM-DD
+            previous: Résultat d'un nettoyage antérieur avec les mêmes
+                paramètres ({"raw": lignes brutes, "sird": données complètes}).
+                Si les données brutes n'ont fait que s'allonger, seule la fin
+                de série est recalculée.
 
         Returns:
             dict: { "train": DataFrame, "test": DataFrame }
+
+        Après l'appel, raw_data et sird_data contiennent les lignes brutes du
+        pays et les données SIRD avant découpe (réutilisables comme previous).
         """
         # Pipeline de traitement
         try:
@@ -77,11 +127,18 @@ class DataCleaner:
             df = self._filter_country_data(global_df)
             # Filtrage date
             df = self._filter_dates(df, start_date, end_date)
-            # Calcul des compartiments SIRD
-            df = self._calculate_sird(df)
-            # Lissage des données si nécessaire
-            if self.smoothing:
-                df = self._smooth_data(df)
+            self.raw_data = df
+
+            sird = None
+            if previous is not None:
+                sird = self._update_tail(df, previous)
+            if sird is None:
+                # Calcul des compartiments SIRD
+                sird = self._calculate_sird(df.copy())
+                # Lissage des données si nécessaire
+                if self.smoothing:
+                    sird = self._smooth_data(sird)
+            df = self.sird_data = sird
             # Split train/test
             train, test = self._split_data(df)
         except KeyError as e:
@@ -93,12 +150,105 @@ class DataCleaner:
 
         return {"train": train, "test": test}
 
+    def clean_panel(
+        self,
+        global_df: pd.DataFrame,
+        start_date: str = None,
+        end_date: str = None,
+    ) -> pd.DataFrame:
+        """
+        Calcule les compartiments SIRD de tous les pays en une seule passe.
+
+        Mêmes règles que _calculate_sird et _smooth_data, appliquées par
+        opérations groupées (groupby) sur l'ensemble du dataset au lieu d'un
+        pays à la fois. Les pays ayant moins de jours que le minimum requis
+        sont ignorés.
+
+        Args:
+            global_df: DataFrame brut de l'OWID (colonnes RAW_COLUMNS)
+            start_date: Date de début au format YYYY-MM-DD
+            end_date: Date de fin au format YYYY-MM-DD
+
+        Returns:
+            DataFrame au format long indexé par (location, Jour)
+        """
+        MIN_DAYS = 50  # Minimum requis pour l'analyse temporelle
+
+        df = global_df[self.RAW_COLUMNS].copy()
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+        if start_date:
+            df = df[df["date"] >= pd.to_datetime(start_date)]
+        if end_date:
+            df = df[df["date"] <= pd.to_datetime(end_date)]
+
+        # Pays contigus et ordonnés par date
+        df = df.sort_values(["location", "date"], kind="stable")
+        counts = df.groupby("location", sort=False)["date"].transform("size")
+        df = df[counts >= MIN_DAYS].reset_index(drop=True)
+        groups = df.groupby("location", sort=False)
+
+        # Population de la première ligne de chaque pays
+        first_rows = groups.cumcount() == 0
+        population = (
+            df["population"].where(first_rows).groupby(df["location"]).transform("max")
+        )
+
+        # Nettoyage des colonnes d'intérêt
+        total_cases = groups["total_cases"].ffill().clip(lower=0)
+        df["D_abs"] = groups["total_deaths"].ffill().clip(lower=0)
+
+        # Calcul des infectés : somme glissante des nouveaux cas
+        new_cases = total_cases.groupby(df["location"]).diff().fillna(0).clip(lower=0)
+        df["I_abs"] = (
+            new_cases.groupby(df["location"], sort=False)
+            .rolling(window=14, min_periods=1)
+            .sum()
+            .droplevel(0)
+        )
+
+        # Recovered = total_cases - infected - deaths
+        df["R_abs"] = (total_cases - df["I_abs"] - df["D_abs"]).clip(lower=0)
+
+        # Susceptibles = population - tout le reste
+        df["S_abs"] = (population - df["I_abs"] - df["R_abs"] - df["D_abs"]).clip(
+            lower=0
+        )
+
+        # Doses absolues
+        vaccinated = groups["people_fully_vaccinated"].ffill()
+        df["V_abs"] = vaccinated.groupby(df["location"]).diff().fillna(0)
+
+        # Normalisation par la population
+        for col in ["S", "I", "R", "D", "V"]:
+            df[col] = (df[f"{col}_abs"] / population).clip(0, 1)
+
+        # Premier nombre de lits renseigné de chaque pays
+        df["lits_par_mille"] = groups["hospital_beds_per_thousand"].transform("first")
+
+        # Ajout du jour relatif
+        df["Jour"] = (df["date"] - groups["date"].transform("min")).dt.days + 1
+        df = df.set_index(["location", "Jour"])[self.SIRD_COLUMNS].fillna(0)
+
+        # Lissage groupé de toutes les colonnes en une opération
+        if self.smoothing:
+            smoothed = self.SMOOTHED_COLUMNS
+            df[smoothed] = (
+                df[smoothed]
+                .groupby(level="location", sort=False)
+                .rolling(window=self.window_size, min_periods=1)
+                .mean()
+                .droplevel(0)
+            )
+
+        return df
+
     def _filter_country_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Filtre les données pour le pays spécifié avec gestion d'erreur améliorée."""
         col_name = "iso_code" if self.use_iso_code else "location"
         country_id = self.country.upper() if self.use_iso_code else self.country
 
-        filtered = df[df[col_name] == country_id].copy()
+        # Comparaison insensible à la casse ("United States" / "united states")
+        filtered = df[df[col_name].str.lower() == country_id.lower()].copy()
 
         if filtered.empty:
             available = df[col_name].unique().tolist()
@@ -134,7 +284,67 @@ class DataCleaner:
 
         return df
 
-    def _calculate_sird(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _update_tail(self, df: pd.DataFrame, previous: dict) -> pd.DataFrame | None:
+        """
+        Recalcule uniquement la fin de série à partir d'un nettoyage antérieur.
+
+        Les n lignes brutes déjà traitées doivent être inchangées. Les fenêtres
+        glissantes (14 jours pour I, window_size pour le lissage) ne dépendent
+        que des 14 + window_size jours précédents : seule cette zone de contexte
+        et les nouvelles lignes sont recalculées, le début est repris tel quel.
+
+        Returns:
+            Données SIRD complètes, ou None si un recalcul complet est requis
+        """
+        old_raw = previous["raw"]
+        n_old = len(old_raw)
+        if len(df) < n_old or not df.iloc[:n_old].reset_index(drop=True).equals(
+            old_raw.reset_index(drop=True)
+        ):
+            return None
+
+        # Le nombre de lits retenu est le premier renseigné : il doit être connu
+        # dans la partie déjà traitée, sinon il change pour toute la série
+        known_beds = df["hospital_beds_per_thousand"].notna().to_numpy()
+        if known_beds.any() and known_beds.argmax() >= n_old:
+            return None
+
+        self.population = df["population"].iloc[0]
+        if len(df) == n_old:
+            return previous["sird"]
+
+        start = n_old - (14 + self.window_size)
+        if start <= 0:
+            return None
+
+        # Contexte + nouvelles lignes ; les colonnes complétées par ffill
+        # reprennent la dernière valeur connue avant le contexte
+        tail = df.iloc[start:].copy()
+        for col in ["total_cases", "total_deaths", "people_fully_vaccinated"]:
+            known = df[col].iloc[:start].dropna()
+            if not known.empty and pd.isna(tail[col].iat[0]):
+                tail[col] = tail[col].astype(float)
+                tail.iloc[0, tail.columns.get_loc(col)] = known.iat[-1]
+
+        beds = df["hospital_beds_per_thousand"].dropna()
+        tail = self._calculate_sird(
+            tail,
+            population=self.population,
+            beds=beds.iat[0] if not beds.empty else 0,
+            first_date=df["date"].min(),
+        )
+        if self.smoothing:
+            tail = self._smooth_data(tail)
+
+        return pd.concat([previous["sird"].iloc[:n_old], tail.iloc[n_old - start :]])
+
+    def _calculate_sird(
+        self,
+        df: pd.DataFrame,
+        population: float = None,
+        beds: float = None,
+        first_date=None,
+    ) -> pd.DataFrame:
         """
         Calcule les compartiments SIRD à partir des données brutes.
 
@@ -145,8 +355,13 @@ class DataCleaner:
         - Décédés (D): Total des décès cumulés
 
         Les valeurs sont stockées en absolu et en proportion de la population.
+
+        population, beds et first_date permettent de traiter une fin de série
+        avec les constantes et l'origine des jours de la série complète.
         """
-        self.population = df["population"].iloc[0]
+        if population is None:
+            population = df["population"].iloc[0]
+        self.population = population
 
         # Nettoyage des colonnes d'intérêt
         df["total_cases"] = df["total_cases"].ffill().clip(lower=0)
@@ -172,30 +387,18 @@ class DataCleaner:
             df[col] = (df[f"{col}_abs"] / self.population).clip(0, 1)
 
         # Moyenne des lits disponibles par 1000 personnes (valeur constante pour tout le pays)
-        beds = df["hospital_beds_per_thousand"].dropna()
-        beds_value = beds.iloc[0] if not beds.empty else 0
-        df["lits_par_mille"] = beds_value
+        if beds is None:
+            beds = df["hospital_beds_per_thousand"].dropna()
+            beds = beds.iloc[0] if not beds.empty else 0
+        df["lits_par_mille"] = beds
 
         # Ajout du jour relatif
-        df["Jour"] = (df["date"] - df["date"].min()).dt.days + 1
+        if first_date is None:
+            first_date = df["date"].min()
+        df["Jour"] = (df["date"] - first_date).dt.days + 1
         df = df.set_index("Jour").sort_index()
 
-        return df[
-            [
-                "date",
-                "S",
-                "I",
-                "R",
-                "D",
-                "S_abs",
-                "I_abs",
-                "R_abs",
-                "D_abs",
-                "V",
-                "V_abs",
-                "lits_par_mille",
-            ]
-        ].fillna(0)
+        return df[self.SIRD_COLUMNS].fillna(0)
 
     def _smooth_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -1,5 +1,12 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import requests
 from tqdm import tqdm
@@ -10,40 +17,90 @@ class DataFetcher:
     Classe responsable du téléchargement et du chargement des données brutes COVID-19
     """
 
-    def __init__(self, raw_path: Path):
+    def __init__(
+        self,
+        raw_path: Path,
+        use_cache: bool = True,
+        url: str = None,
+        timeout: float = 30.0,
+        retries: int = 3,
+        gzip: bool = True,
+    ):
         """
         Args:
             raw_path: Répertoire de stockage des données brutes
+            use_cache: Si True, le CSV est converti une fois en cache colonnaire
+                binaire (un fichier .npy par colonne) relu ensuite sans parsing
+            url: URL source (par défaut le dataset OWID ; un serveur local peut
+                s'y substituer)
+            timeout: Délai maximal de connexion et entre deux paquets (s)
+            retries: Nombre de reprises après une coupure réseau
+            gzip: Accepte un transfert compressé (hors reprise d'un .part)
+
+        Attributs:
             url: URL source du dataset
             file_path: Chemin complet vers le fichier CSV téléchargé
+            cache_path: Répertoire du cache colonnaire
+            manifest_path: Manifeste du téléchargement (ETag, SHA-256...)
         """
         # Par défaut : <project_root>/data/raw
         self.raw_path = raw_path or Path(__file__).resolve().parents[2] / "data/raw"
         self.raw_path.mkdir(parents=True, exist_ok=True)
 
-        self.url = "https://covid.ourworldindata.org/data/owid-covid-data.csv"
+        self.url = url or "https://covid.ourworldindata.org/data/owid-covid-data.csv"
+        self.timeout = timeout
+        self.retries = retries
+        self.gzip = gzip
         self.file_path = self.raw_path / "owid-covid-data.csv"
+        self.manifest_path = self.raw_path / "owid-covid-data.manifest.json"
+        self.use_cache = use_cache
+        self.cache_path = self.raw_path / "owid-cache"
 
-    def fetch_data(self) -> pd.DataFrame:
+    def fetch_data(
+        self,
+        columns: list[str] = None,
+        countries: list[str] = None,
+        chunksize: int = 100_000,
+        refresh: bool = False,
+    ) -> pd.DataFrame:
         """
-        Télécharge (si nécessaire) et charge le dataset complet
+        Télécharge (si nécessaire) et charge le dataset
+
+        Args:
+            columns: Colonnes à charger (toutes par défaut)
+            countries: Pays à charger, par nom ou code ISO3, insensible à la
+                casse (tous par défaut)
+            chunksize: Sans cache, nombre de lignes lues par bloc lorsque des
+                pays sont demandés : seules leurs lignes sont conservées, la
+                mémoire reste bornée par un bloc plus le résultat
+            refresh: Revalide le fichier local auprès du serveur (voir refresh)
 
         Returns:
-            pd.DataFrame: DataFrame contenant toutes les données mondiales
+            pd.DataFrame: DataFrame contenant les données demandées
 
         Raises:
             ConnectionError: Si le téléchargement échoue
             FileNotFoundError: Si le fichier local est introuvable après téléchargement
             pd.errors.ParserError: Si le parsing CSV échoue
+            ValueError: Si un pays ou une colonne demandé(e) est introuvable
         """
         try:
-            if not self.file_path.exists():
+            if refresh:
+                self.refresh()
+            elif not self.file_path.exists():
                 self._download_dataset()
 
+            if self.use_cache:
+                return self._load_from_cache(columns, countries)
+
+            if countries is not None:
+                return self._stream_countries(columns, countries, chunksize)
+
             # Chargement avec vérification des dates
             return pd.read_csv(
                 self.file_path,
-                parse_dates=["date"],
+                usecols=columns,
+                parse_dates=["date"] if columns is None or "date" in columns else None,
             )
 
         except pd.errors.ParserError as e:
@@ -51,43 +108,407 @@ class DataFetcher:
                 f"Erreur de parsing du fichier {self.file_path}: {str(e)}"
             ) from e
 
-    def _download_dataset(self):
+    def source_fingerprint(self) -> dict:
+        """
+        Empreinte du fichier brut (taille et date de modification en ns).
+
+        Télécharge le dataset s'il est absent. L'empreinte change dès que le
+        fichier est remplacé : elle sert de clé aux caches dérivés du CSV.
+        Une modification qui conserve taille et date n'est pas détectée.
+        """
+        if not self.file_path.exists():
+            self._download_dataset()
+        stat = self.file_path.stat()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _stream_countries(
+        self, columns: list[str], countries: list[str], chunksize: int
+    ) -> pd.DataFrame:
         """
-        Télécharge le dataset avec gestion des erreurs et barre de progression
+        Lit le CSV par blocs et ne conserve que les lignes des pays demandés.
 
         Raises:
-            ConnectionError: Pour les erreurs réseau
-            requests.HTTPError: Pour les réponses HTTP non valides
+            ValueError: Si l'un des pays demandés est absent (comme avec le
+                cache colonnaire)
         """
+        keys = {c.strip().lower() for c in countries}
+        usecols = None
+        if columns is not None:
+            usecols = list(dict.fromkeys(columns + ["location", "iso_code"]))
+
+        reader = pd.read_csv(
+            self.file_path,
+            usecols=usecols,
+            parse_dates=["date"] if usecols is None or "date" in usecols else None,
+            chunksize=chunksize,
+        )
+        parts = []
+        found = set()
+        with reader:
+            for chunk in reader:
+                # Type string : un bloc sans code ISO (agrégats) reste lisible
+                locations = chunk["location"].astype("string").str.lower()
+                iso_codes = chunk["iso_code"].astype("string").str.lower()
+                mask = locations.isin(keys) | iso_codes.isin(keys)
+                if mask.any():
+                    parts.append(chunk[mask])
+                    found.update(locations[mask])
+                    found.update(iso_codes[mask])
+
+        missing = keys - found
+        if missing:
+            raise ValueError(
+                f"Pays {sorted(missing)} non trouvés dans {self.file_path}"
+            )
+
+        df = pd.concat(parts, ignore_index=True)
+        return df if columns is None else df[columns]
+
+    def _cache_is_valid(self) -> bool:
+        """Vérifie que le cache correspond au fichier CSV actuel (taille et date)."""
+        manifest_path = self.cache_path / "manifest.json"
+        if not manifest_path.exists():
+            return False
+        with open(manifest_path) as f:
+            source = json.load(f).get("source", {})
+        return source == self.source_fingerprint()
+
+    def _build_cache(self):
+        """
+        Convertit le CSV en cache colonnaire (parsing complet effectué une seule fois).
+
+        Structure:
+        - <colonne>.npy : un tableau par colonne, lignes triées par pays
+        - manifest.json : types, catégories et plage de lignes de chaque pays
+
+        Les colonnes numériques sont stockées en float32 lorsque la conversion
+        est exacte, en float64 sinon ; les chaînes sont codées en entiers
+        (catégories) et les dates en jours depuis 1970-01-01 (int32).
+
+        Chaque construction a son propre répertoire temporaire : deux
+        processus qui reconstruisent en même temps ne se gênent pas (voir
+        _install_cache).
+        """
+        df = pd.read_csv(self.file_path, parse_dates=["date"], low_memory=False)
+        df = df.sort_values("location", kind="stable").reset_index(drop=True)
+
+        tmp_path = Path(
+            tempfile.mkdtemp(
+                prefix=f"{self.cache_path.name}.", suffix=".tmp", dir=self.raw_path
+            )
+        )
         try:
-            # Configuration de la requête avec timeout
-            response = requests.get(
-                self.url,
-                stream=True,
+            self._write_cache(df, tmp_path)
+            self._install_cache(tmp_path)
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def _write_cache(self, df: pd.DataFrame, tmp_path: Path):
+        """Écrit les colonnes et le manifeste du cache dans tmp_path."""
+        columns = {}
+        for col in df.columns:
+            serie = df[col]
+            if col == "date":
+                values = serie.to_numpy("datetime64[D]").astype(np.int32)
+                columns[col] = {"kind": "date"}
+            elif pd.api.types.is_numeric_dtype(serie):
+                values = serie.to_numpy(dtype=np.float64)
+                narrow = values.astype(np.float32)
+                if np.array_equal(narrow.astype(np.float64), values, equal_nan=True):
+                    values = narrow
+                columns[col] = {"kind": "numeric"}
+            else:
+                codes, categories = pd.factorize(serie)
+                values = codes.astype(np.int16 if len(categories) < 2**15 else np.int32)
+                columns[col] = {"kind": "category", "categories": categories.tolist()}
+            np.save(tmp_path / f"{col}.npy", values)
+
+        # Index des lignes par pays (lignes contiguës après le tri)
+        locations = df["location"].to_numpy()
+        starts = np.flatnonzero(np.r_[True, locations[1:] != locations[:-1]])
+        stops = np.r_[starts[1:], len(df)]
+        rows = {
+            str(locations[start]): [int(start), int(stop)]
+            for start, stop in zip(starts, stops)
+        }
+        iso_codes = {
+            str(df["iso_code"].iat[start]): str(locations[start]) for start in starts
+        }
+
+        manifest = {
+            "source": self.source_fingerprint(),
+            "n_rows": len(df),
+            "columns": columns,
+            "rows": rows,
+            "iso_codes": iso_codes,
+        }
+        with open(tmp_path / "manifest.json", "w") as f:
+            json.dump(manifest, f)
+
+    def _install_cache(self, tmp_path: Path):
+        """
+        Remplace le cache par le répertoire construit dans tmp_path.
+
+        L'ancien cache est renommé à côté, le nouveau renommé à sa place, puis
+        l'ancien supprimé : aucun fichier n'est effacé d'un cache en place.
+        Si un autre processus a installé son cache entre-temps, celui-ci est
+        conservé (même source) et tmp_path est abandonné.
+        """
+        old_path = tmp_path.with_suffix(".old")
+        try:
+            os.rename(self.cache_path, old_path)
+        except FileNotFoundError:
+            old_path = None
+        try:
+            os.rename(tmp_path, self.cache_path)
+        except OSError:
+            # Répertoire cible non vide : cache installé par un autre processus
+            pass
+        if old_path is not None:
+            shutil.rmtree(old_path, ignore_errors=True)
+
+    def _load_from_cache(
+        self, columns: list[str] = None, countries: list[str] = None
+    ) -> pd.DataFrame:
+        """
+        Lit les colonnes et les pays demandés depuis le cache colonnaire.
+
+        Si un autre processus remplace le cache pendant la lecture (entre les
+        deux renommages de _install_cache), la lecture est reprise.
+        """
+        attempts = 3
+        for attempt in range(attempts):
+            try:
+                return self._read_cache(columns, countries)
+            except FileNotFoundError:
+                if attempt == attempts - 1:
+                    raise
+
+    def _read_cache(
+        self, columns: list[str] = None, countries: list[str] = None
+    ) -> pd.DataFrame:
+        """Lecture du cache (reconstruit s'il ne correspond plus au CSV)."""
+        if not self._cache_is_valid():
+            self._build_cache()
+
+        with open(self.cache_path / "manifest.json") as f:
+            manifest = json.load(f)
+
+        columns = list(manifest["columns"]) if columns is None else columns
+        missing = set(columns) - set(manifest["columns"])
+        if missing:
+            raise ValueError(f"Colonnes absentes du dataset: {missing}")
+
+        # Plages de lignes des pays demandés (nom ou code ISO3)
+        if countries is None:
+            ranges = [(0, manifest["n_rows"])]
+        else:
+            by_name = {name.lower(): name for name in manifest["rows"]}
+            by_name.update(
+                {iso.lower(): name for iso, name in manifest["iso_codes"].items()}
             )
+            ranges = []
+            for country in countries:
+                name = by_name.get(country.strip().lower())
+                if name is None:
+                    raise ValueError(
+                        f"Pays '{country}' non trouvé. "
+                        f"Disponibles: {list(manifest['rows'])[:5]}..."
+                    )
+                ranges.append(tuple(manifest["rows"][name]))
+
+        data = {}
+        for col in columns:
+            # Lecture en mémoire projetée : seules les lignes utiles sont lues
+            values = np.load(self.cache_path / f"{col}.npy", mmap_mode="r")
+            values = np.concatenate([values[start:stop] for start, stop in ranges])
+            info = manifest["columns"][col]
+            if info["kind"] == "date":
+                data[col] = pd.to_datetime(
+                    values.astype("datetime64[D]").astype("datetime64[ns]")
+                )
+            elif info["kind"] == "category":
+                categories = np.array(info["categories"], dtype=object)
+                data[col] = np.where(values >= 0, categories[values], np.nan)
+            else:
+                data[col] = values.astype(np.float64)
+
+        return pd.DataFrame(data, columns=columns)
+
+    def refresh(self) -> bool:
+        """
+        Revalide le fichier local auprès du serveur et le met à jour si besoin.
+
+        La requête est conditionnelle (If-None-Match / If-Modified-Since avec
+        l'ETag et la date du dernier téléchargement) : un fichier inchangé
+        n'est pas retransféré.
+
+        Returns:
+            True si un nouveau fichier a été téléchargé, False sinon
+        """
+        return self._download_dataset(conditional=self.file_path.exists())
+
+    def verify(self) -> bool:
+        """Vérifie le fichier local contre la somme SHA-256 du manifeste."""
+        manifest = self._read_manifest()
+        if not self.file_path.exists() or "sha256" not in manifest:
+            return False
+        digest = hashlib.sha256()
+        with open(self.file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest() == manifest["sha256"]
+
+    def _read_manifest(self) -> dict:
+        """Manifeste du dernier téléchargement (validateurs HTTP, somme, taille)."""
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path) as f:
+            return json.load(f)
+
+    def _download_dataset(self, conditional: bool = False) -> bool:
+        """
+        Télécharge le dataset avec reprise, revalidation et contrôle d'intégrité
+
+        Le transfert est écrit dans <fichier>.part puis renommé atomiquement.
+        Après une coupure, il reprend à la fin du .part (en-tête Range, avec
+        If-Range pour s'assurer que la version distante n'a pas changé),
+        jusqu'à `retries` tentatives. La somme SHA-256, l'ETag et la date
+        Last-Modified sont enregistrés dans le manifeste.
+
+        Args:
+            conditional: Requête conditionnelle avec les validateurs du manifeste
+
+        Returns:
+            True si un fichier a été téléchargé, False si le serveur répond 304
+
+        Raises:
+            ConnectionError: Pour les erreurs réseau (après les tentatives)
+            requests.HTTPError: Pour les réponses HTTP non valides
+        """
+        manifest = self._read_manifest() if conditional else {}
+        for attempt in range(self.retries + 1):
+            try:
+                return self._transfer(manifest)
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.Timeout,
+            ) as e:
+                # Coupure : le .part est conservé et la tentative suivante reprend
+                if attempt == self.retries:
+                    raise ConnectionError(f"Erreur de connexion: {str(e)}") from e
+                time.sleep(min(2**attempt, 30))
+            except requests.exceptions.RequestException as e:
+                raise ConnectionError(f"Erreur de connexion: {str(e)}") from e
+
+    def _transfer(self, manifest: dict) -> bool:
+        """Une tentative de téléchargement (voir _download_dataset)."""
+        part_path = self.file_path.with_name(self.file_path.name + ".part")
+        part_info_path = part_path.with_name(part_path.name + ".json")
+        offset = part_path.stat().st_size if part_path.exists() else 0
+
+        headers = {}
+        if offset and part_info_path.exists():
+            with open(part_info_path) as f:
+                validator = json.load(f).get("validator")
+            # Les octets de Range désignent le fichier brut : pas de compression
+            headers["Range"] = f"bytes={offset}-"
+            headers["Accept-Encoding"] = "identity"
+            if validator:
+                headers["If-Range"] = validator
+        else:
+            offset = 0
+            headers["Accept-Encoding"] = "gzip" if self.gzip else "identity"
+        if manifest.get("etag"):
+            headers["If-None-Match"] = manifest["etag"]
+        if manifest.get("last_modified"):
+            headers["If-Modified-Since"] = manifest["last_modified"]
+
+        with requests.get(
+            self.url, headers=headers, stream=True, timeout=self.timeout
+        ) as response:
+            if response.status_code == 304:
+                return False
+            if response.status_code == 416:
+                # Partie locale invalide pour la version distante : on repart de zéro
+                part_path.unlink(missing_ok=True)
+                part_info_path.unlink(missing_ok=True)
+                raise requests.exceptions.ConnectionError("Reprise refusée (416)")
             response.raise_for_status()
+            if response.status_code != 206:
+                offset = 0  # Réponse complète (nouvelle version ou Range ignoré)
+
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            with open(part_info_path, "w") as f:
+                json.dump({"validator": etag or last_modified}, f)
+
+            self._save_with_progress(response, part_path, offset)
+
+        # Contrôle de taille, somme de contrôle puis remplacement atomique
+        size = part_path.stat().st_size
+        expected = self._expected_size(response, offset)
+        if expected is not None and size != expected:
+            # Traité comme une coupure : la tentative suivante reprend le .part
+            raise requests.exceptions.ChunkedEncodingError(
+                f"Téléchargement incomplet: {size}/{expected} octets"
+            )
+
+        digest = hashlib.sha256()
+        with open(part_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+
+        os.replace(part_path, self.file_path)
+        part_info_path.unlink(missing_ok=True)
 
-            # Sauvegarde avec barre de progression
-            self._save_with_progress(response)
+        manifest = {
+            "url": self.url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "sha256": digest.hexdigest(),
+            "size": size,
+        }
+        with open(self.manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        return True
 
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"Erreur de connexion: {str(e)}") from e
+    @staticmethod
+    def _expected_size(response: requests.Response, offset: int) -> int | None:
+        """Taille attendue du fichier complet, si le serveur l'annonce."""
+        content_range = response.headers.get("Content-Range", "")
+        if response.status_code == 206 and "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            return int(total) if total.isdigit() else None
+        # Avec compression, Content-Length est la taille compressée
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            return None
+        length = response.headers.get("Content-Length")
+        return offset + int(length) if length is not None else None
 
-    def _save_with_progress(self, response: requests.Response):
+    def _save_with_progress(
+        self, response: requests.Response, path: Path, offset: int = 0
+    ):
         """
         Sauvegarde le contenu de la réponse avec barre de progression
 
         Args:
             response: Objet Response de requests
+            path: Fichier de destination
+            offset: Octets déjà présents (reprise) ; 0 pour écraser le fichier
 
         Returns:
             None: Écrit le fichier sur le disque
         """
-        total_size = int(response.headers.get("content-length", 0))
+        total_size = offset + int(response.headers.get("content-length", 0))
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            total_size = None  # Taille compressée : la taille finale est inconnue
 
-        with open(self.file_path, "wb") as f, tqdm(
+        with open(path, "ab" if offset else "wb") as f, tqdm(
             desc=f"Téléchargement {self.file_path.name}",
             total=total_size,
+            initial=offset,
             unit="B",
             unit_scale=True,
             unit_divisor=1024,
@@ -0,0 +1,138 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class SIRDSeries:
+    """
+    Série SIRD d'un pays au format binaire, ouverte par projection mémoire.
+
+    Structure (à côté des CSV):
+    - <nom>.bin : bloc contigu (n_champs, n_jours), une ligne par colonne
+      (Jour, date en jours depuis 1970-01-01, puis les colonnes SIRD)
+    - <nom>.json : en-tête (champs, type, taille, population, lits, dates)
+
+    L'ouverture ne lit que l'en-tête : son coût ne dépend pas de la longueur
+    de la série et les pages du fichier sont partagées entre processus.
+    Chaque colonne est une vue np.memmap contiguë, en lecture seule, qui se
+    substitue à une colonne de DataFrame pour SimulateurSIRD,
+    estimer_parametres_rab et ResolutionSIRD.
+
+    Exemple:
+    >>> SIRDSeries.write(train_df, path / "sird_france_train", population)
+    >>> serie = SIRDSeries(path / "sird_france_train")
+    >>> serie["I"]  # np.memmap, sans copie ni parsing
+    """
+
+    def __init__(self, base_path: Path):
+        """
+        Args:
+            base_path: Chemin des fichiers sans extension (<nom>.bin/.json)
+        """
+        base_path = Path(base_path)
+        with open(base_path.with_suffix(".json")) as f:
+            header = json.load(f)
+
+        self.header = header
+        self.population = header["population"]
+        self.lits_par_mille = header["lits_par_mille"]
+        self.date_min = pd.Timestamp(header["date_min"])
+        self.date_max = pd.Timestamp(header["date_max"])
+        self._fields = {name: i for i, name in enumerate(header["fields"])}
+        self._block = np.memmap(
+            base_path.with_suffix(".bin"),
+            dtype=header["dtype"],
+            mode="r",
+            shape=(len(header["fields"]), header["n_rows"]),
+        )
+
+    @property
+    def columns(self) -> list[str]:
+        """Colonnes de la série (hors index Jour), comme DataFrame.columns."""
+        return self.header["fields"][1:]
+
+    @property
+    def index(self) -> np.ndarray:
+        """Jours relatifs (entiers), comme l'index Jour des DataFrame."""
+        return self._block[0].astype(np.int64)
+
+    def __len__(self) -> int:
+        return self.header["n_rows"]
+
+    def __contains__(self, col: str) -> bool:
+        return col in self._fields and col != "Jour"
+
+    def __getitem__(self, col: str) -> np.ndarray:
+        """Colonne en vue mémoire (les dates sont converties en datetime64)."""
+        if col not in self._fields:
+            raise KeyError(col)
+        values = self._block[self._fields[col]]
+        if col == "date":
+            return values.astype(np.int64).astype("datetime64[D]").astype(
+                "datetime64[ns]"
+            )
+        return values
+
+    def to_frame(self) -> pd.DataFrame:
+        """Copie de la série en DataFrame indexé par Jour (format des CSV)."""
+        df = pd.DataFrame({col: self[col] for col in self.columns})
+        df.index = pd.Index(self.index, name="Jour")
+        return df
+
+    @staticmethod
+    def write(
+        df: pd.DataFrame,
+        base_path: Path,
+        population: float,
+        dtype: str = "float64",
+        entry: str = None,
+    ) -> Path:
+        """
+        Écrit une série indexée par Jour au format binaire.
+
+        Args:
+            df: Données SIRD (index Jour, colonne date et colonnes numériques)
+            base_path: Chemin des fichiers sans extension
+            population: Population du pays
+            dtype: 'float64' ou 'float32' (moitié moins de pages, mais une
+                copie en float64 est faite par les calculs)
+            entry: Clé de l'entrée du cache dont proviennent les données
+
+        Returns:
+            Chemin du fichier .bin
+        """
+        base_path = Path(base_path)
+        columns = [col for col in df.columns if col != "date"]
+        fields = ["Jour", "date"] + columns
+
+        block = np.empty((len(fields), len(df)), dtype=dtype)
+        block[0] = df.index.to_numpy()
+        block[1] = df["date"].to_numpy("datetime64[D]").astype(np.int64)
+        block[2:] = df[columns].to_numpy(dtype=float).T
+
+        beds = df["lits_par_mille"].iloc[0] if "lits_par_mille" in df else None
+        header = {
+            "fields": fields,
+            "dtype": np.dtype(dtype).name,
+            "n_rows": len(df),
+            "population": float(population),
+            "lits_par_mille": None if beds is None else float(beds),
+            "date_min": df["date"].min().isoformat() if len(df) else None,
+            "date_max": df["date"].max().isoformat() if len(df) else None,
+            "entry": entry,
+        }
+
+        # Bloc écrit avant l'en-tête : un en-tête présent désigne un bloc complet
+        bin_path = base_path.with_suffix(".bin")
+        tmp_path = bin_path.with_name(bin_path.name + ".tmp")
+        block.tofile(tmp_path)
+        tmp_path.replace(bin_path)
+        header_path = base_path.with_suffix(".json")
+        tmp_path = header_path.with_name(header_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(header, f, indent=2)
+        tmp_path.replace(header_path)
+
+        return bin_path
@@ -1,6 +1,10 @@
 import json
+import os
+import threading
 from pathlib import Path
+from typing import Callable
 
+import numpy as np
 import pandas as pd
 
 
@@ -42,10 +46,25 @@ class DataValidator:
                 f"Dossier de données introuvable: {self.processed_path}"
             )
 
-    def validate(self) -> dict[str, pd.DataFrame]:
+    def validate(
+        self,
+        frames: dict[str, pd.DataFrame] = None,
+        persist: bool = True,
+        asynchronous: bool = False,
+        on_persisted: Callable[[], None] = None,
+    ) -> dict[str, pd.DataFrame]:
         """
         Exécute le pipeline complet de validation.
 
+        Args:
+            frames: Données en mémoire {"train", "test"} produites par
+                DataCleaner (indexées par Jour). Par défaut, les fichiers CSV
+                du dossier sont relus.
+            persist: Avec frames, écrit les CSV et les métadonnées sur disque
+            asynchronous: Écriture dans un thread (voir wait)
+            on_persisted: Appelé une fois l'écriture terminée avec succès
+                (dans le thread d'écriture en mode asynchrone)
+
         Returns:
             Résultats avec métadonnées :
             - "train": DataFrame d'entraînement validé
@@ -55,70 +74,170 @@ class DataValidator:
         Raises:
             ValueError: Si une validation échoue
         """
-        # Chargement des données
-        train_df = self._load_and_validate_split("train")
-        test_df = self._load_and_validate_split("test")
+        if frames is None:
+            # Chargement des données
+            train_df = self._load_split("train")
+            test_df = self._load_split("test")
+        else:
+            # Même forme que les CSV relus : Jour en colonne, index par défaut
+            train_df = frames["train"].reset_index()
+            test_df = frames["test"].reset_index()
+
+        metadata = self._validate_block(train_df, test_df)
+
+        if frames is None:
+            self._save_metadata(metadata)
+        elif persist:
+            args = (frames["train"], frames["test"], metadata, on_persisted)
+            if asynchronous:
+                self._writer_error = None
+                self._writer = threading.Thread(target=self._persist_async, args=args)
+                self._writer.start()
+            else:
+                self._persist(*args)
 
-        metadata = self._generate_metadata(pd.concat([train_df, test_df]))
         return {"train": train_df, "test": test_df, "metadata": metadata}
 
-    def _load_and_validate_split(self, split_type: str) -> pd.DataFrame:
-        """Pipeline de validation pour un ensemble (train/test)"""
+    def wait(self):
+        """
+        Attend la fin d'une écriture asynchrone lancée par validate.
+
+        Raises:
+            Exception: L'erreur levée par l'écriture, le cas échéant
+        """
+        writer = getattr(self, "_writer", None)
+        if writer is not None:
+            writer.join()
+            self._writer = None
+        error = getattr(self, "_writer_error", None)
+        if error is not None:
+            self._writer_error = None
+            raise error
+
+    def _load_split(self, split_type: str) -> pd.DataFrame:
+        """Chargement d'un ensemble (train/test) depuis son fichier CSV"""
         file_path = self.processed_path / f"sird_{self.country}_{split_type}.csv"
 
         # Chargement avec vérification d'existence
         if not file_path.exists():
             raise FileNotFoundError(f"Fichier {split_type} manquant: {file_path}")
 
-        df = pd.read_csv(file_path, parse_dates=["date"])
+        return pd.read_csv(file_path, parse_dates=["date"])
+
+    def _validate_block(
+        self, train_df: pd.DataFrame, test_df: pd.DataFrame
+    ) -> dict:
+        """
+        Contrôles de qualité et statistiques des deux ensembles en une passe.
+
+        Les colonnes numériques des deux ensembles sont réunies dans un seul
+        bloc NumPy (S, I, R, D en tête) : valeurs manquantes, bornes, sommes
+        S+I+R+D et métriques sont calculées sur ce bloc, sans copie
+        intermédiaire par colonne ni concaténation des DataFrames.
+        """
+        splits = {"train": train_df, "test": test_df}
 
         # Contrôles de qualité
         required = ["date", "S", "I", "R", "D"]
-        if not set(required).issubset(df.columns):
-            raise ValueError(
-                f"Colonnes manquantes dans {split_type} : {set(required) - set(df.columns)}"
-            )
-
-        if df.isnull().values.any():
-            raise ValueError(f"Valeurs manquantes détectées dans {split_type}")
+        for split_type, df in splits.items():
+            if not set(required).issubset(df.columns):
+                raise ValueError(
+                    f"Colonnes manquantes dans {split_type} : {set(required) - set(df.columns)}"
+                )
+
+        sird = ["S", "I", "R", "D"]
+        others = [
+            col
+            for col in train_df.columns
+            if col not in sird and pd.api.types.is_numeric_dtype(train_df[col])
+        ]
+        columns = sird + others
+        n_train = len(train_df)
+        block = np.empty((n_train + len(test_df), len(columns)))
+        block[:n_train] = train_df[columns].to_numpy(dtype=float)
+        block[n_train:] = test_df[columns].to_numpy(dtype=float)
+        dates = np.concatenate(
+            [df["date"].to_numpy("datetime64[ns]") for df in (train_df, test_df)]
+        )
 
-        for col in ["S", "I", "R", "D"]:
-            if not df[col].between(0, 1).all():
+        # Lignes incomplètes (toutes colonnes numériques et date)
+        missing = np.isnan(block).any(axis=1) | np.isnat(dates)
+        values = block[:, :4]
+        out_of_range = (values < 0) | (values > 1)
+        bad_rows = np.abs(values.sum(axis=1) - 1) > self.tolerance
+
+        bounds = {"train": slice(0, n_train), "test": slice(n_train, None)}
+        for split_type, rows in bounds.items():
+            if missing[rows].any():
+                raise ValueError(f"Valeurs manquantes détectées dans {split_type}")
+            invalid = out_of_range[rows].any(axis=0)
+            if invalid.any():
+                col = sird[int(invalid.argmax())]
                 raise ValueError(f"Valeurs hors de [0,1] dans {col} ({split_type})")
-
-        total = df[["S", "I", "R", "D"]].sum(axis=1)
-        bad_rows = (total - 1).abs() > self.tolerance
-        if bad_rows.any():
-            print(f"{bad_rows.sum()} lignes invalides dans {split_type} (S+I+R+D ≠ 1)")
-
-        return df
-
-    def _generate_metadata(self, df: pd.DataFrame) -> dict:
-        """Génère un rapport de qualité des données"""
-        metadata = {
+            n_bad = int(bad_rows[rows].sum())
+            if n_bad:
+                print(f"{n_bad} lignes invalides dans {split_type} (S+I+R+D ≠ 1)")
+
+        return self._generate_metadata(values, dates)
+
+    def _generate_metadata(self, values: np.ndarray, dates: np.ndarray) -> dict:
+        """Génère un rapport de qualité des données à partir du bloc (n, 4)"""
+        n = len(values)
+        if n:
+            means = values.mean(axis=0)
+            maxs, mins = values.max(axis=0), values.min(axis=0)
+        else:
+            means = maxs = mins = np.full(4, np.nan)
+        nan_counts = np.isnan(values).sum(axis=0)
+
+        return {
             "pays": self.country,
-            "periode_jours": len(df),
-            "date_min": df["date"].min().isoformat(),
-            "date_max": df["date"].max().isoformat(),
+            "periode_jours": n,
+            "date_min": pd.Timestamp(dates.min()).isoformat() if n else None,
+            "date_max": pd.Timestamp(dates.max()).isoformat() if n else None,
             "metriques": {
                 col: {
-                    "moyenne": df[col].mean(),
-                    "max": df[col].max(),
-                    "min": df[col].min(),
-                    "nan_count": df[col].isna().sum(),
+                    "moyenne": float(means[j]),
+                    "max": float(maxs[j]),
+                    "min": float(mins[j]),
+                    "nan_count": int(nan_counts[j]),
                 }
-                for col in ["S", "I", "R", "D"]
+                for j, col in enumerate(["S", "I", "R", "D"])
             },
             "validation": {
                 "tolerance": self.tolerance,
                 "date_validation": pd.Timestamp.now().isoformat(),
-                "status": "SUCCES" if not df.empty else "ECHEC",
+                "status": "SUCCES" if n else "ECHEC",
             },
         }
 
-        # Sauvegarde du rapport
+    def _persist_async(self, *args):
+        """Écriture dans le thread : l'erreur est conservée pour wait."""
+        try:
+            self._persist(*args)
+        except Exception as e:
+            self._writer_error = e
+
+    def _persist(
+        self,
+        train: pd.DataFrame,
+        test: pd.DataFrame,
+        metadata: dict,
+        on_persisted: Callable[[], None] = None,
+    ):
+        """Écrit les CSV (même format que DataCleaner) puis les métadonnées."""
+        base_name = f"sird_{self.country}"
+        for split_type, df in (("train", train), ("test", test)):
+            path = self.processed_path / f"{base_name}_{split_type}.csv"
+            tmp_path = path.with_name(path.name + ".tmp")
+            df.to_csv(tmp_path, index=True)
+            os.replace(tmp_path, path)
+        self._save_metadata(metadata)
+        if on_persisted is not None:
+            on_persisted()
+
+    def _save_metadata(self, metadata: dict):
+        """Sauvegarde du rapport"""
         metadata_path = self.processed_path / f"metadata_{self.country}.json"
         with open(metadata_path, "w") as f:
             json.dump(metadata, f, indent=2, default=str)
-
-        return metadata
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.analysis.equations_differentielles.simulateur_sird import SimulateurSIRD
+
+CONDITIONS_INITIALES = pd.DataFrame({"S": [0.99], "I": [0.01], "R": [0.0], "D": [0.0]})
+
+
+@pytest.mark.parametrize(
+    "parametres",
+    [
+        {"r": 1.0, "a": 0.005, "b": 0.001},
+        {"r": 0.35, "a": 0.1, "b": 0.02},
+    ],
+)
+def test_grand_pas_proche_de_rk4(parametres):
+    """Euler implicite à dt=5 reste positif et proche d'un RK4 fin."""
+    simulateur = SimulateurSIRD(parametres)
+    implicite = simulateur.resoudre(
+        CONDITIONS_INITIALES, t_max=1000, dt=5, methode="euler_implicite"
+    )
+    reference = simulateur.resoudre(
+        CONDITIONS_INITIALES, t_max=1000, dt=0.01, methode="rk4"
+    ).iloc[::500]
+
+    colonnes = ["S", "I", "R", "D"]
+    y = implicite[colonnes].to_numpy()
+    ecart = np.abs(y - reference[colonnes].to_numpy())
+
+    assert (y >= 0).all()
+    np.testing.assert_allclose(y.sum(axis=1), 1.0, atol=1e-8)
+    # Schéma d'ordre 1 : écart maximal au pic, état final proche
+    assert ecart.max() < 0.2
+    assert ecart[-1].max() < 0.05
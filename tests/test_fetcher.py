@@ -0,0 +1,166 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.data.fetcher import DataFetcher
+
+CONTENU = b"iso_code,location,date,total_cases\n" + b"".join(
+    f"FRA,France,2020-01-{1 + i % 28:02d},{i}\n".encode() for i in range(5000)
+)
+ETAG = '"v1"'
+
+
+class ServeurOWID(BaseHTTPRequestHandler):
+    """Serveur local : ETag, Range/If-Range, gzip et coupure simulée."""
+
+    contenu = CONTENU
+    etag = ETAG
+    coupure = None  # Nombre d'octets envoyés avant de couper la réponse suivante
+    requetes = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.requetes.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        plage = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if plage and (if_range is None or if_range == self.etag):
+            debut = int(plage.removeprefix("bytes=").rstrip("-"))
+            if debut >= len(self.contenu):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(self.contenu)}")
+                self.end_headers()
+                return
+            corps = self.contenu[debut:]
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                f"bytes {debut}-{len(self.contenu) - 1}/{len(self.contenu)}",
+            )
+        else:
+            corps = self.contenu
+            self.send_response(200)
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                corps = gzip.compress(corps)
+                self.send_header("Content-Encoding", "gzip")
+
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(corps)))
+        self.end_headers()
+        if self.coupure is not None:
+            # Connexion fermée au milieu du corps annoncé
+            type(self).coupure, corps = None, corps[: self.coupure]
+            self.close_connection = True
+        self.wfile.write(corps)
+
+
+@pytest.fixture
+def serveur(monkeypatch):
+    """Serveur HTTP local, réinitialisé pour chaque test."""
+    monkeypatch.setattr(ServeurOWID, "contenu", CONTENU)
+    monkeypatch.setattr(ServeurOWID, "etag", ETAG)
+    monkeypatch.setattr(ServeurOWID, "coupure", None)
+    monkeypatch.setattr(ServeurOWID, "requetes", [])
+    # Pas d'attente entre les tentatives
+    monkeypatch.setattr("src.data.fetcher.time.sleep", lambda _: None)
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), ServeurOWID)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}/owid-covid-data.csv"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def creer_fetcher(tmp_path, url, **options):
+    return DataFetcher(tmp_path, use_cache=False, url=url, **options)
+
+
+def ecrire_part(fetcher, octets, validateur):
+    """Simule un téléchargement interrompu (.part et son validateur)."""
+    part_path = fetcher.file_path.with_name(fetcher.file_path.name + ".part")
+    part_path.write_bytes(octets)
+    with open(part_path.with_name(part_path.name + ".json"), "w") as f:
+        json.dump({"validator": validateur}, f)
+    return part_path
+
+
+def test_telechargement_gzip_puis_304(tmp_path, serveur):
+    """Transfert compressé, puis revalidation sans retransfert."""
+    fetcher = creer_fetcher(tmp_path, serveur)
+    assert len(fetcher.fetch_data()) == 5000
+    assert fetcher.file_path.read_bytes() == CONTENU
+    assert ServeurOWID.requetes[0]["Accept-Encoding"] == "gzip"
+    assert fetcher.verify()
+
+    assert fetcher.refresh() is False
+    assert ServeurOWID.requetes[-1]["If-None-Match"] == ETAG
+    assert fetcher.file_path.read_bytes() == CONTENU
+
+
+def test_reprise_d_un_part_tronque(tmp_path, serveur):
+    """Un .part valide est complété par une requête Range."""
+    fetcher = creer_fetcher(tmp_path, serveur)
+    part_path = ecrire_part(fetcher, CONTENU[:1000], ETAG)
+
+    fetcher.fetch_data()
+    assert ServeurOWID.requetes[0]["Range"] == "bytes=1000-"
+    assert ServeurOWID.requetes[0]["If-Range"] == ETAG
+    assert fetcher.file_path.read_bytes() == CONTENU
+    assert not part_path.exists()
+    assert fetcher.verify()
+
+
+def test_reprise_apres_coupure(tmp_path, serveur):
+    """Une coupure en cours de transfert est reprise à la fin du .part."""
+    ServeurOWID.coupure = 20_000
+    fetcher = creer_fetcher(tmp_path, serveur, gzip=False)
+
+    fetcher.fetch_data()
+    assert len(ServeurOWID.requetes) == 2
+    # Reprise après les octets déjà écrits (blocs complets reçus)
+    debut = int(ServeurOWID.requetes[1]["Range"].removeprefix("bytes=").rstrip("-"))
+    assert 0 < debut <= 20_000
+    assert fetcher.file_path.read_bytes() == CONTENU
+
+
+def test_if_range_perime_redemarre(tmp_path, serveur):
+    """Si la version distante a changé, le .part est remplacé en entier."""
+    fetcher = creer_fetcher(tmp_path, serveur)
+    ecrire_part(fetcher, b"ancienne version tronquee", '"v0"')
+
+    fetcher.fetch_data()
+    assert ServeurOWID.requetes[0]["If-Range"] == '"v0"'
+    assert fetcher.file_path.read_bytes() == CONTENU
+
+
+def test_416_repart_de_zero(tmp_path, serveur):
+    """Une plage refusée (416) efface le .part et relance un transfert complet."""
+    fetcher = creer_fetcher(tmp_path, serveur)
+    ecrire_part(fetcher, CONTENU + b"octets en trop", ETAG)
+
+    fetcher.fetch_data()
+    assert "Range" in ServeurOWID.requetes[0]
+    assert "Range" not in ServeurOWID.requetes[1]
+    assert fetcher.file_path.read_bytes() == CONTENU
+
+
+def test_nouvelle_version_retelechargee(tmp_path, serveur):
+    """Un ETag différent au refresh remplace le fichier et le manifeste."""
+    fetcher = creer_fetcher(tmp_path, serveur)
+    fetcher.fetch_data()
+
+    ServeurOWID.contenu = CONTENU + b"FRA,France,2020-02-01,5000\n"
+    ServeurOWID.etag = '"v2"'
+    assert fetcher.refresh() is True
+    assert fetcher.file_path.read_bytes() == ServeurOWID.contenu
+    assert json.loads(fetcher.manifest_path.read_text())["etag"] == '"v2"'